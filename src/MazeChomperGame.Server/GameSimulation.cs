@@ -18,6 +18,7 @@ public class GameSimulation
     private List<Ghost> _ghosts = new();
     private List<Collectible> _collectibles = new();
     private TileType[,] _map;
+    private NavigationTable? _navigation;
     private int _mapWidth;
     private int _mapHeight;
 
@@ -166,6 +167,7 @@ private void LoadLevel(int level)
         }
         _mapHeight = _map.GetLength(0);
         _mapWidth = _map.GetLength(1);
+        _navigation = _mapLoader.LoadNavigationTable($"level{level}.txt");
 
         _pacman = null;
         if (_assignedRoles.Contains(PlayerRole.Pacman))
@@ -432,6 +434,16 @@ private void UpdateGhost(Ghost ghost, float deltaTime)
         MoveEntity(ghost, speed, deltaTime);
     }
 
+    /// <summary>
+    /// Best direction from an entity's cell toward a target cell: an O(1) lookup in the level's
+    /// navigation table (levelN.nav), tunnels included. Direction.None without a table or path.
+    /// </summary>
+    public Direction GetDirectionToward(Entity entity, int targetRow, int targetCol)
+    {
+        if (_navigation == null) return Direction.None;
+        return _navigation.GetDirection((int)Math.Round(entity.Y), (int)Math.Round(entity.X), targetRow, targetCol);
+    }
+
     private void HandleTurning(Entity entity, PlayerRole role, Direction? overrideDirection = null)
     {
         Direction desiredDirection = overrideDirection ?? _playerInputs.GetValueOrDefault(role, Direction.None);
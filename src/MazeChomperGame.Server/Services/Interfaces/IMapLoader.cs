@@ -1,5 +1,6 @@
 using System.Collections.Generic;
 using MazeChomperGame.Server.Models;
+using MazeChomperGame.Shared;
 
 namespace MazeChomperGame.Server.Services
 {
@@ -9,5 +10,6 @@ public interface IMapLoader
         (int Row, int Col) GetPacmanSpawn(string mapName);
         List<(int Row, int Col)> GetGhostSpawns(string mapName);
         List<Collectible> GetCollectibles(string mapName);
+        NavigationTable? LoadNavigationTable(string mapName);
     }
 }
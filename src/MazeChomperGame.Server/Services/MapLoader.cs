@@ -11,6 +11,7 @@ public class MapLoader : IMapLoader
     {
         private readonly ILogger<MapLoader> _logger;
         private readonly string _mapsPath;
+        private readonly Dictionary<string, CompiledMap?> _compiledMaps = new();
 
         // Constants for map parsing (must match client)
         private const char WallChar = '#';
@@ -25,10 +26,15 @@ public class MapLoader : IMapLoader
         private const int MapHeight = 31;
 
         public MapLoader(ILogger<MapLoader> logger)
+            // Use AppDomain.CurrentDomain.BaseDirectory to ensure we look in the output directory
+            : this(logger, Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "Assets", "Maps"))
+        {
+        }
+
+        public MapLoader(ILogger<MapLoader> logger, string mapsPath)
         {
             _logger = logger;
-            // Use AppDomain.CurrentDomain.BaseDirectory to ensure we look in the output directory
-            _mapsPath = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "Assets", "Maps");
+            _mapsPath = mapsPath;
             _logger.LogInformation($"MapLoader initialized. Maps path: {_mapsPath}");
         }
 
@@ -43,6 +49,22 @@ public MapLoader(ILogger<MapLoader> logger)
                 return new TileType[MapHeight, MapWidth];
             }
 
+            var compiled = GetCompiledMap(mapName);
+            if (compiled != null)
+            {
+                TileType[,] compiledTiles = new TileType[MapHeight, MapWidth];
+                for (int row = 0; row < MapHeight; row++)
+                for (int col = 0; col < MapWidth; col++)
+                {
+                    // Same mapping as CharToTileType: collectibles live on open (Empty) tiles.
+                    // Every cell is assigned because Wall is the enum default.
+                    compiledTiles[row, col] = CompiledMap.IsSet(compiled.Walls, row, col) ? TileType.Wall
+                        : CompiledMap.IsSet(compiled.GhostDoors, row, col) ? TileType.GhostDoor
+                        : TileType.Empty;
+                }
+                return compiledTiles;
+            }
+
             string[] lines = File.ReadAllLines(filePath);
             TileType[,] tiles = new TileType[MapHeight, MapWidth];
 
@@ -63,6 +85,9 @@ public MapLoader(ILogger<MapLoader> logger)
             string filePath = Path.Combine(_mapsPath, mapName);
             if (!File.Exists(filePath)) return (23, 13); // Default fallback
 
+            var compiled = GetCompiledMap(mapName);
+            if (compiled != null) return compiled.PacmanSpawn;
+
             string[] lines = File.ReadAllLines(filePath);
             for (int row = 0; row < lines.Length; row++)
             {
@@ -83,6 +108,9 @@ public List<(int Row, int Col)> GetGhostSpawns(string mapName)
                 return new List<(int, int)> { (11, 13), (14, 11), (14, 13), (14, 15) };
             }
 
+            var compiled = GetCompiledMap(mapName);
+            if (compiled != null) return new List<(int Row, int Col)>(compiled.GhostSpawns);
+
             string[] lines = File.ReadAllLines(filePath);
             for (int row = 0; row < lines.Length; row++)
             {
@@ -104,6 +132,25 @@ public List<Collectible> GetCollectibles(string mapName)
 
             if (!File.Exists(filePath)) return collectibles;
 
+            var compiled = GetCompiledMap(mapName);
+            if (compiled != null)
+            {
+                for (int row = 0; row < compiled.Height; row++)
+                for (int col = 0; col < compiled.Width; col++)
+                {
+                    CollectibleType? type = CompiledMap.IsSet(compiled.Dots, row, col) ? CollectibleType.SmallDot
+                        : CompiledMap.IsSet(compiled.PowerPellets, row, col) ? CollectibleType.PowerPellet
+                        : CompiledMap.IsSet(compiled.Fruits, row, col) ? CollectibleType.Cherry
+                        : null;
+
+                    if (type.HasValue)
+                    {
+                        collectibles.Add(new Collectible(row * 100 + col, row, col, type.Value));
+                    }
+                }
+                return collectibles;
+            }
+
             string[] lines = File.ReadAllLines(filePath);
 
             for (int row = 0; row < lines.Length; row++)
@@ -124,6 +171,53 @@ public List<Collectible> GetCollectibles(string mapName)
             return collectibles;
         }
 
+        public NavigationTable? LoadNavigationTable(string mapName)
+        {
+            try
+            {
+                var table = NavigationTable.TryLoad(Path.Combine(_mapsPath, mapName));
+                if (table == null)
+                {
+                    _logger.LogWarning($"Navigation table not found for {mapName}");
+                }
+                else if (table.Width != MapWidth || table.Height != MapHeight)
+                {
+                    _logger.LogWarning($"Navigation table size mismatch for {mapName}: {table.Width}x{table.Height}");
+                    return null;
+                }
+                return table;
+            }
+            catch (InvalidDataException ex)
+            {
+                _logger.LogWarning(ex, $"Ignoring invalid navigation table for {mapName}");
+                return null;
+            }
+        }
+
+        // Compiled version of a map (level1.txt -> level1.mzmap), read once and cached; null falls back to the text file
+        private CompiledMap? GetCompiledMap(string mapName)
+        {
+            if (_compiledMaps.TryGetValue(mapName, out var cached)) return cached;
+
+            CompiledMap? compiled = null;
+            try
+            {
+                compiled = CompiledMap.TryLoad(Path.Combine(_mapsPath, mapName));
+                if (compiled != null && (compiled.Width != MapWidth || compiled.Height != MapHeight))
+                {
+                    _logger.LogWarning($"Compiled map size mismatch for {mapName}: {compiled.Width}x{compiled.Height}");
+                    compiled = null;
+                }
+            }
+            catch (InvalidDataException ex)
+            {
+                _logger.LogWarning(ex, $"Ignoring invalid compiled map for {mapName}");
+            }
+
+            _compiledMaps[mapName] = compiled;
+            return compiled;
+        }
+
         private TileType CharToTileType(char c)
         {
             return c switch
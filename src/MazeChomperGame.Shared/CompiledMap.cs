@@ -0,0 +1,114 @@
+using System.Buffers.Binary;
+
+namespace MazeChomperGame.Shared;
+
+/// <summary>
+/// Level compiled by tools/AssetGeneration/map_compiler.py (e.g. level1.mzmap next to level1.txt).
+/// The file is a single fixed-size little-endian record, so client and server load a level
+/// with one read and no string parsing. Layout (version 1):
+///   0  magic "MZMP", u16 version, u8 width, u8 height
+///   8  u8 pacman row, u8 pacman col, u8 ghost count, u8 tunnel count,
+///      u8 ghost capacity, u8 tunnel capacity, u16 dot count
+///   16 u32[height] per layer (walls, ghost doors, dots, power pellets, fruits): bit c = column c
+///   then u8[ghost capacity][2] ghost spawns (row, col) and u8[tunnel capacity][4] tunnels.
+/// </summary>
+public sealed class CompiledMap
+{
+    public const string FileExtension = ".mzmap";
+    public const ushort FormatVersion = 1;
+    private const int HeaderSize = 16;
+    private const int LayerCount = 5;
+    private static ReadOnlySpan<byte> Magic => "MZMP"u8;
+
+    public int Width { get; }
+    public int Height { get; }
+    public (int Row, int Col) PacmanSpawn { get; }
+    public int DotCount { get; }
+    public uint[] Walls { get; }
+    public uint[] GhostDoors { get; }
+    public uint[] Dots { get; }
+    public uint[] PowerPellets { get; }
+    public uint[] Fruits { get; }
+    public List<(int Row, int Col)> GhostSpawns { get; }
+    public List<(int RowA, int ColA, int RowB, int ColB)> Tunnels { get; }
+
+    private CompiledMap(ReadOnlySpan<byte> data)
+    {
+        Width = data[6];
+        Height = data[7];
+        PacmanSpawn = (data[8], data[9]);
+        int ghostCount = data[10];
+        int tunnelCount = data[11];
+        int ghostCapacity = data[12];
+        int tunnelCapacity = data[13];
+        DotCount = BinaryPrimitives.ReadUInt16LittleEndian(data.Slice(14));
+
+        int layerSize = Height * sizeof(uint);
+        int ghostsOffset = HeaderSize + LayerCount * layerSize;
+        int tunnelsOffset = ghostsOffset + ghostCapacity * 2;
+        if (data.Length != tunnelsOffset + tunnelCapacity * 4 || Width > 32 ||
+            ghostCount > ghostCapacity || tunnelCount > tunnelCapacity)
+        {
+            throw new InvalidDataException($"Compiled map size mismatch ({data.Length} bytes)");
+        }
+
+        Walls = ReadLayer(data, 0);
+        GhostDoors = ReadLayer(data, 1);
+        Dots = ReadLayer(data, 2);
+        PowerPellets = ReadLayer(data, 3);
+        Fruits = ReadLayer(data, 4);
+
+        GhostSpawns = new List<(int Row, int Col)>(ghostCount);
+        for (int i = 0; i < ghostCount; i++)
+            GhostSpawns.Add((data[ghostsOffset + i * 2], data[ghostsOffset + i * 2 + 1]));
+
+        Tunnels = new List<(int RowA, int ColA, int RowB, int ColB)>(tunnelCount);
+        for (int i = 0; i < tunnelCount; i++)
+        {
+            var tunnel = data.Slice(tunnelsOffset + i * 4, 4);
+            Tunnels.Add((tunnel[0], tunnel[1], tunnel[2], tunnel[3]));
+        }
+    }
+
+    /// <summary>
+    /// Parse a compiled map from its bytes
+    /// </summary>
+    /// <exception cref="InvalidDataException">The data is not a compiled map of this format version</exception>
+    public static CompiledMap Parse(ReadOnlySpan<byte> data)
+    {
+        if (data.Length < HeaderSize || !data.Slice(0, 4).SequenceEqual(Magic) ||
+            BinaryPrimitives.ReadUInt16LittleEndian(data.Slice(4)) != FormatVersion)
+        {
+            throw new InvalidDataException("Not a compiled map of a supported version");
+        }
+
+        return new CompiledMap(data);
+    }
+
+    /// <summary>
+    /// Load the compiled version of a text map (level1.txt -> level1.mzmap) with a single read
+    /// </summary>
+    /// <returns>The compiled map, or null if the map has not been compiled</returns>
+    public static CompiledMap? TryLoad(string textMapPath)
+    {
+        string path = Path.ChangeExtension(textMapPath, FileExtension);
+        return File.Exists(path) ? Parse(File.ReadAllBytes(path)) : null;
+    }
+
+    /// <summary>
+    /// Check a cell in one of the bit layers (Walls, Dots...)
+    /// </summary>
+    public static bool IsSet(uint[] layer, int row, int col)
+    {
+        return (layer[row] & (1u << col)) != 0;
+    }
+
+    private uint[] ReadLayer(ReadOnlySpan<byte> data, int layer)
+    {
+        var rows = new uint[Height];
+        var bytes = data.Slice(HeaderSize + layer * Height * sizeof(uint));
+        for (int row = 0; row < Height; row++)
+            rows[row] = BinaryPrimitives.ReadUInt32LittleEndian(bytes.Slice(row * sizeof(uint)));
+        return rows;
+    }
+}
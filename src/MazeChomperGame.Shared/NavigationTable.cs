@@ -0,0 +1,113 @@
+using System.Buffers.Binary;
+
+namespace MazeChomperGame.Shared;
+
+/// <summary>
+/// All-pairs shortest-path table produced by tools/AssetGeneration/generate_nav_tables.py
+/// (e.g. level1.nav next to level1.txt). For every walkable cell and every target cell it stores
+/// the first step of a shortest path, tunnel wrap included, so "best direction toward X" is an
+/// O(1) lookup. Layout (version 1, little-endian):
+///   0  magic "MZNV", u16 version, u8 width, u8 height, u16 cell count (N), u16 row bytes, u32 reserved
+///   16 i16[height * width] walkable cell index (-1 for walls)
+///   then u16[N] connected component per cell and u8[N][row bytes] direction rows, one per target:
+///   2 bits per source cell (Direction - 1), source i at bits 2 * (i % 4) of byte i / 4.
+/// </summary>
+public sealed class NavigationTable
+{
+    public const string FileExtension = ".nav";
+    public const ushort FormatVersion = 1;
+    private const int HeaderSize = 16;
+    private static ReadOnlySpan<byte> Magic => "MZNV"u8;
+
+    private readonly short[] _cellIndex;
+    private readonly ushort[] _components;
+    private readonly byte[] _directions;
+    private readonly int _rowBytes;
+
+    public int Width { get; }
+    public int Height { get; }
+    public int CellCount { get; }
+
+    private NavigationTable(byte[] data)
+    {
+        Width = data[6];
+        Height = data[7];
+        CellCount = BinaryPrimitives.ReadUInt16LittleEndian(data.AsSpan(8));
+        _rowBytes = BinaryPrimitives.ReadUInt16LittleEndian(data.AsSpan(10));
+
+        int componentsOffset = HeaderSize + Width * Height * sizeof(short);
+        int directionsOffset = componentsOffset + CellCount * sizeof(ushort);
+        if (data.Length != directionsOffset + CellCount * _rowBytes || _rowBytes * 4 < CellCount)
+        {
+            throw new InvalidDataException($"Navigation table size mismatch ({data.Length} bytes)");
+        }
+
+        _cellIndex = new short[Width * Height];
+        for (int i = 0; i < _cellIndex.Length; i++)
+            _cellIndex[i] = BinaryPrimitives.ReadInt16LittleEndian(data.AsSpan(HeaderSize + i * sizeof(short)));
+
+        _components = new ushort[CellCount];
+        for (int i = 0; i < CellCount; i++)
+            _components[i] = BinaryPrimitives.ReadUInt16LittleEndian(data.AsSpan(componentsOffset + i * sizeof(ushort)));
+
+        _directions = data.AsSpan(directionsOffset).ToArray();
+    }
+
+    /// <summary>
+    /// Parse a navigation table from its bytes
+    /// </summary>
+    /// <exception cref="InvalidDataException">The data is not a navigation table of this format version</exception>
+    public static NavigationTable Parse(byte[] data)
+    {
+        if (data.Length < HeaderSize || !data.AsSpan(0, 4).SequenceEqual(Magic) ||
+            BinaryPrimitives.ReadUInt16LittleEndian(data.AsSpan(4)) != FormatVersion)
+        {
+            throw new InvalidDataException("Not a navigation table of a supported version");
+        }
+
+        return new NavigationTable(data);
+    }
+
+    /// <summary>
+    /// Load the navigation table of a text map (level1.txt -> level1.nav) with a single read
+    /// </summary>
+    /// <returns>The table, or null if none was generated for the map</returns>
+    public static NavigationTable? TryLoad(string textMapPath)
+    {
+        string path = Path.ChangeExtension(textMapPath, FileExtension);
+        return File.Exists(path) ? Parse(File.ReadAllBytes(path)) : null;
+    }
+
+    /// <summary>
+    /// First step of a shortest path from one cell to another (O(1))
+    /// </summary>
+    /// <returns>The direction to take, or Direction.None if both cells are the same, either is a wall
+    /// or out of the map, or there is no path between them</returns>
+    public Direction GetDirection(int fromRow, int fromCol, int toRow, int toCol)
+    {
+        int source = GetCellIndex(fromRow, fromCol);
+        int target = GetCellIndex(toRow, toCol);
+        if (source < 0 || target < 0 || source == target || _components[source] != _components[target])
+            return Direction.None;
+
+        int packed = _directions[target * _rowBytes + source / 4];
+        return (Direction)(((packed >> (2 * (source % 4))) & 3) + 1);
+    }
+
+    /// <summary>
+    /// Check whether there is a path between two cells
+    /// </summary>
+    public bool IsReachable(int fromRow, int fromCol, int toRow, int toCol)
+    {
+        int source = GetCellIndex(fromRow, fromCol);
+        int target = GetCellIndex(toRow, toCol);
+        return source >= 0 && target >= 0 && _components[source] == _components[target];
+    }
+
+    private int GetCellIndex(int row, int col)
+    {
+        if (row < 0 || row >= Height || col < 0 || col >= Width)
+            return -1;
+        return _cellIndex[row * Width + col];
+    }
+}
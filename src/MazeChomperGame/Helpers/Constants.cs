@@ -127,6 +127,10 @@ public static class Constants
     public const string ItemsSpriteMap = "items_sprite_map.json";
     public const string TilesSpriteMap = "tiles_sprite_map.json";
 
+    // Texture Atlas (all sprite sheets packed into one texture)
+    public const string AtlasSpriteSheet = "atlas.png";
+    public const string AtlasSpriteMap = "atlas_map.json";
+
     // Music Files
     public const string BackgroundMusic = "background-theme.wav";
     public const string MenuMusic = "menu-theme.wav";
@@ -146,11 +150,21 @@ public static class Constants
     public const string MenuNavigateSound = "menu-navigate.wav";
     public const string GhostReturnSound = "ghost-return.wav";
 
+    // Sound Bank (all sound effects packed into one PCM file + JSON index)
+    public const string SfxBankFile = "sfx-bank.pcm";
+    public const string SfxBankIndex = "sfx-bank.json";
+
     // Map Files
     public const string Level1Map = "level1.txt";
     public const string Level2Map = "level2.txt";
     public const string Level3Map = "level3.txt";
 
+    // Precomputed wall tile grid stored next to each map (level1.txt -> level1.tiles.json)
+    public const string TileGridExtension = ".tiles.json";
+
+    // Pre-rendered static maze (walls + ghost door) stored next to each map (level1.txt -> level1_background.png)
+    public const string MazeBackgroundSuffix = "_background.png";
+
     // Map Characters
     public const char WallChar = '#';
     public const char SmallDotChar = '.';
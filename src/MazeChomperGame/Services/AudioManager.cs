@@ -1,6 +1,8 @@
 using System;
 using System.Collections.Generic;
 using System.IO;
+using System.Runtime.InteropServices;
+using System.Text.Json.Nodes;
 using Microsoft.Extensions.Logging;
 using MazeChomperGame.Helpers;
 using MazeChomperGame.Services.Interfaces;
@@ -27,6 +29,7 @@ public class AudioManager : IAudioManager, IDisposable
     private string? _currentMusicName;
     private readonly List<Sound> _activeSounds = new();
     private readonly Dictionary<string, SoundBuffer> _soundBuffers = new();
+    private readonly Dictionary<string, SoundBuffer[]> _soundVariants = new();
 
     public bool IsMuted => _isMuted;
     public float MenuMusicVolume => _menuMusicVolume / 100f;
@@ -77,15 +80,18 @@ public void Initialize()
                 _logger.LogWarning($"SFX directory not found: {_sfxPath}");
             }
 
-            // Preload common sound effects
-            PreloadSound("chomp");
-            PreloadSound("death");
-            PreloadSound("eat-ghost");
-            PreloadSound("eat-fruit");
-            PreloadSound("game-start");
-            PreloadSound("game-over");
-            PreloadSound("menu-select");
-            PreloadSound("menu-navigate");
+            // Preload sound effects: one read from the packed bank, or the common ones file by file
+            if (!LoadSoundBank())
+            {
+                PreloadSound("chomp");
+                PreloadSound("death");
+                PreloadSound("eat-ghost");
+                PreloadSound("eat-fruit");
+                PreloadSound("game-start");
+                PreloadSound("game-over");
+                PreloadSound("menu-select");
+                PreloadSound("menu-navigate");
+            }
 
             _isInitialized = true;
             _logger.LogInformation("AudioManager initialized (SFML.Audio)");
@@ -97,6 +103,66 @@ public void Initialize()
         }
     }
 
+    /// <summary>
+    /// Load every sound effect from the packed bank (sfx-bank.pcm + sfx-bank.json).
+    /// The bank is raw 16-bit PCM, so each effect is a slice of a single read instead of a WAV file to open and parse.
+    /// </summary>
+    /// <returns>True if the bank was found and loaded</returns>
+    private bool LoadSoundBank()
+    {
+        string bankPath = Path.Combine(_sfxPath, Constants.SfxBankFile);
+        string indexPath = Path.Combine(_sfxPath, Constants.SfxBankIndex);
+        if (!File.Exists(bankPath) || !File.Exists(indexPath))
+            return false;
+
+        try
+        {
+            var index = JsonNode.Parse(File.ReadAllText(indexPath));
+            if (index?["sounds"] is not JsonObject soundsObj)
+                return false;
+
+            uint channels = index["channels"]?.GetValue<uint>() ?? 1;
+            byte[] bank = File.ReadAllBytes(bankPath);
+
+            foreach (var sound in soundsObj)
+            {
+                if (sound.Value is not JsonObject entry)
+                    continue;
+
+                int offset = entry["offset"]!.GetValue<int>();
+                int length = entry["length"]!.GetValue<int>();
+                uint sampleRate = entry["sample_rate"]!.GetValue<uint>();
+                int variantCount = entry["variants"]?.GetValue<int>() ?? 1;
+                int stride = entry["stride"]?.GetValue<int>() ?? 0;
+
+                // Variants are rows of the same length, one every `stride` bytes; row 0 is the original sound
+                var variants = new SoundBuffer[variantCount];
+                for (int i = 0; i < variantCount; i++)
+                {
+                    // pcm_s16le: reinterpret the slice as samples (all supported platforms are little-endian)
+                    var pcm = bank.AsSpan(offset + i * stride, length * (int)channels * sizeof(short));
+                    short[] samples = MemoryMarshal.Cast<byte, short>(pcm).ToArray();
+                    variants[i] = new SoundBuffer(samples, channels, sampleRate);
+                }
+
+                _soundBuffers[sound.Key] = variants[0];
+                if (variantCount > 1)
+                {
+                    _soundVariants[sound.Key] = variants;
+                }
+            }
+
+            _logger.LogInformation($"Loaded {soundsObj.Count} sound effects from {Constants.SfxBankFile}");
+            return true;
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning($"Failed to load sound bank, using individual files: {ex.Message}");
+            DisposeSoundBuffers();
+            return false;
+        }
+    }
+
     private void PreloadSound(string soundName)
     {
         try
@@ -125,8 +191,13 @@ public void PlaySoundEffect(string soundName)
         {
             SoundBuffer? buffer;
 
+            // Sounds with variants (packed in the bank) play a random one each time
+            if (_soundVariants.TryGetValue(soundName, out var variants))
+            {
+                buffer = variants[Random.Shared.Next(variants.Length)];
+            }
             // Try to get from cache, or load if not cached
-            if (!_soundBuffers.TryGetValue(soundName, out buffer))
+            else if (!_soundBuffers.TryGetValue(soundName, out buffer))
             {
                 string filePath = Path.Combine(_sfxPath, $"{soundName}.wav");
                 if (!File.Exists(filePath))
@@ -346,11 +417,24 @@ public void Dispose()
         }
         _activeSounds.Clear();
 
-        foreach (var buffer in _soundBuffers.Values)
+        DisposeSoundBuffers();
+        _logger.LogInformation("AudioManager disposed");
+    }
+
+    private void DisposeSoundBuffers()
+    {
+        // Variant 0 of each variant set is also in _soundBuffers; dispose every buffer once
+        var buffers = new HashSet<SoundBuffer>(_soundBuffers.Values);
+        foreach (var variants in _soundVariants.Values)
+        {
+            buffers.UnionWith(variants);
+        }
+
+        foreach (var buffer in buffers)
         {
             buffer.Dispose();
         }
         _soundBuffers.Clear();
-        _logger.LogInformation("AudioManager disposed");
+        _soundVariants.Clear();
     }
 }
@@ -1,15 +1,17 @@
 using System;
 using System.Collections.Generic;
 using System.Linq;
+using MazeChomperGame.Helpers;
 using MazeChomperGame.Models.Entities;
 using MazeChomperGame.Models.Enums;
 using MazeChomperGame.Services.Interfaces;
+using MazeChomperGame.Services.Models;
 
 namespace MazeChomperGame.Services;
 
 /// <summary>
 /// Service for detecting collisions between game entities.
-/// Uses grid-based collision detection.
+/// Uses grid-based collision detection, refined to pixel level for sprites with collision masks.
 /// </summary>
 public class CollisionDetector : ICollisionDetector
 {
@@ -18,8 +20,10 @@ public class CollisionDetector : ICollisionDetector
     /// <summary>
     /// Check if Arcade Maze Chomper collides with any ghost
     /// </summary>
-    public Ghost? CheckPacmanGhostCollision(Pacman pacman, List<Ghost> ghosts)
+    public Ghost? CheckPacmanGhostCollision(Pacman pacman, List<Ghost> ghosts, Func<Entity, SpriteInfo?>? getSprite = null)
     {
+        var pacmanSprite = getSprite?.Invoke(pacman);
+
         foreach (var ghost in ghosts)
         {
             // Eyes returning to the ghost house should not block collisions with other ghosts
@@ -29,6 +33,19 @@ public class CollisionDetector : ICollisionDetector
                 continue;
             }
 
+            var ghostSprite = getSprite?.Invoke(ghost);
+            if (HasCollisionMask(pacmanSprite) && HasCollisionMask(ghostSprite))
+            {
+                // Pixel level, where both sprites are drawn: bounding boxes first, masks only where they intersect
+                int offsetX = (int)(ghost.ExactX * Constants.TileSize) - (int)(pacman.ExactX * Constants.TileSize);
+                int offsetY = (int)(ghost.ExactY * Constants.TileSize) - (int)(pacman.ExactY * Constants.TileSize);
+                if (pacmanSprite!.Overlaps(ghostSprite!, offsetX, offsetY))
+                {
+                    return ghost;
+                }
+                continue;
+            }
+
             // Check if they're in the same grid position or very close
             if (pacman.X == ghost.X && pacman.Y == ghost.Y)
             {
@@ -46,6 +63,14 @@ public class CollisionDetector : ICollisionDetector
         return null;
     }
 
+    /// <summary>
+    /// Sprite maps generated without collision data leave the mask empty
+    /// </summary>
+    private static bool HasCollisionMask(SpriteInfo? sprite)
+    {
+        return sprite != null && sprite.CollisionMask.Length > 0;
+    }
+
     /// <summary>
     /// Check if Arcade Maze Chomper collides with a collectible
     /// </summary>
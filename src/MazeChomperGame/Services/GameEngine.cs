@@ -5,6 +5,7 @@
 using MazeChomperGame.Models.Entities;
 using MazeChomperGame.Models.Enums;
 using MazeChomperGame.Services.Interfaces;
+using MazeChomperGame.Services.Models;
 using MazeChomperGame.Services.AI;
 using MazeChomperGame.Services.Pathfinding;
 using System;
@@ -28,6 +29,8 @@ public class GameEngine : IGameEngine, IGameEngineInternal
     private bool _isRunning;
     private bool _isPaused;
     private TileType[,] _map;
+    private string?[,] _wallSprites;
+    private Bitmap? _mazeBackground;
     private Pacman? _pacman;
     private List<Ghost> _ghosts;
     private List<Collectible> _collectibles;
@@ -83,6 +86,7 @@ public GameEngine(ILogger<GameEngine> logger, ILoggerFactory loggerFactory, IMap
         _isRunning = false;
         _isPaused = false;
         _map = new TileType[0, 0];
+        _wallSprites = new string?[0, 0];
         _pacman = new Pacman(0, 0, _loggerFactory.CreateLogger<Pacman>());
         _ghosts = new List<Ghost>();
         _collectibles = new List<Collectible>();
@@ -115,6 +119,8 @@ public void LoadLevel(int level)
             string fileName = "level" + level + ".txt";
 
             _map = _mapLoader.LoadMap(fileName);
+            // Wall variants are precomputed at build time (levelN.tiles.json), so Render does no neighbour analysis
+            _wallSprites = _mapLoader.LoadTileGrid(fileName) ?? BuildWallSprites(_map);
             ComputeGhostDoorInfo();
 
             _collectibles = _mapLoader.GetCollectibles(fileName)
@@ -152,6 +158,7 @@ public void LoadLevel(int level)
             _isChaseMode = false;
 
             _spriteManager.Initialize();
+            _mazeBackground = _spriteManager.GetMazeBackground(fileName);
             _audioManager.Initialize();
         }
         catch (Exception ex)
@@ -166,6 +173,7 @@ public void LoadCustomLevel(string mapFilePath)
         try
         {
             _isCustomLevel = true;
+            _mazeBackground = null;
             _customPacmanSpawn = null;
             _ghostDoorInfo = null;
             _customFruitPoints = null;
@@ -207,6 +215,8 @@ public void LoadCustomLevel(string mapFilePath)
                 }
             }
 
+            // Custom levels have no build-time tile grid: resolve wall sprites once here, not per frame
+            _wallSprites = BuildWallSprites(_map);
             ComputeGhostDoorInfo();
 
             _collectibles = new List<Collectible>();
@@ -887,7 +897,7 @@ private void UpdateCollisions()
             }
         }
 
-        var hitGhost = _collisionDetector.CheckPacmanGhostCollision(_pacman, _ghosts);
+        var hitGhost = _collisionDetector.CheckPacmanGhostCollision(_pacman, _ghosts, GetCollisionSprite);
         if (hitGhost != null)
         {
             if (hitGhost.State == GhostState.Vulnerable || hitGhost.State == GhostState.Warning)
@@ -1042,13 +1052,34 @@ public void Render(Canvas canvas)
     {
         if (_spriteManager == null || _map.Length == 0) return;
 
-        // Draw tiles
-        for (int row = 0; row < Constants.MapHeight; row++)
-        for (int col = 0; col < Constants.MapWidth; col++)
+        // Draw tiles: walls and the ghost door are static, so built-in levels blit one pre-rendered image
+        if (_mazeBackground != null)
+        {
+            var background = new Image
+            {
+                Source = _mazeBackground,
+                Width = Constants.WindowWidth,
+                Height = Constants.WindowHeight,
+                ZIndex = 0
+            };
+            Canvas.SetLeft(background, 0);
+            Canvas.SetTop(background, 0);
+            canvas.Children.Add(background);
+        }
+        else
         {
-            if (_map[row, col] == TileType.Wall)
+            for (int row = 0; row < Constants.MapHeight; row++)
+            for (int col = 0; col < Constants.MapWidth; col++)
             {
-                string spriteName = GetWallSpriteName(row, col, _map);
+                string? spriteName = _map[row, col] switch
+                {
+                    TileType.Wall => _wallSprites[row, col] ?? GetWallSpriteName(row, col, _map),
+                    TileType.GhostDoor => "special_ghost_door",
+                    _ => null
+                };
+                if (spriteName == null)
+                    continue;
+
                 var sprite = _spriteManager.GetTileSprite(spriteName);
                 if (sprite != null)
                     DrawImage(canvas, sprite, col * Constants.TileSize, row * Constants.TileSize, 0);
@@ -1082,15 +1113,7 @@ public void Render(Canvas canvas)
             }
             else
             {
-                string direction = Pacman.CurrentDirection switch
-                {
-                    Direction.Up => "down",
-                    Direction.Down => "up",
-                    Direction.Left => "left",
-                    Direction.Right => "right",
-                    _ => "right"
-                };
-                var sprite = _spriteManager.GetPacmanSprite(direction, Pacman.AnimationFrame);
+                var sprite = _spriteManager.GetPacmanSprite(GetPacmanSpriteDirection(Pacman), Pacman.AnimationFrame);
                 if (sprite != null)
                     DrawImage(canvas, sprite, (int)(Pacman.ExactX * Constants.TileSize), (int)(Pacman.ExactY * Constants.TileSize), 2);
             }
@@ -1105,25 +1128,60 @@ public void Render(Canvas canvas)
         }
     }
 
+    private static string GetPacmanSpriteDirection(Pacman pacman)
+    {
+        return pacman.CurrentDirection switch
+        {
+            Direction.Up => "down",
+            Direction.Down => "up",
+            Direction.Left => "left",
+            Direction.Right => "right",
+            _ => "right"
+        };
+    }
+
+    private static string GetGhostSpriteDirection(Ghost ghost)
+    {
+        return ghost.CurrentDirection == Direction.None ? "down" : ghost.CurrentDirection.ToString().ToLower();
+    }
+
+    private static int GetVulnerableGhostFrame(Ghost ghost)
+    {
+        return ghost.State == GhostState.Warning && ghost.AnimationFrame % 2 == 0 ? 1 : 0;
+    }
+
     private CroppedBitmap? GetGhostSprite(Ghost ghost)
     {
         if (_spriteManager == null) return null;
 
-        string direction = ghost.CurrentDirection.ToString().ToLower();
-        if (ghost.CurrentDirection == Direction.None)
-        {
-            direction = "down";
-        }
-
+        string direction = GetGhostSpriteDirection(ghost);
         return ghost.State switch
         {
             GhostState.Eaten => _spriteManager.GetGhostEyesSprite(direction),
-            GhostState.Vulnerable => _spriteManager.GetVulnerableGhostSprite(0),
-            GhostState.Warning => (ghost.AnimationFrame % 2 == 0) ? _spriteManager.GetVulnerableGhostSprite(1) : _spriteManager.GetVulnerableGhostSprite(0),
+            GhostState.Vulnerable or GhostState.Warning => _spriteManager.GetVulnerableGhostSprite(GetVulnerableGhostFrame(ghost)),
             _ => _spriteManager.GetGhostSprite(ghost.Type.ToString().ToLower(), direction, ghost.AnimationFrame)
         };
     }
 
+    /// <summary>
+    /// Collision data of the sprite an entity is drawn with (same choice as the renderer)
+    /// </summary>
+    private SpriteInfo? GetCollisionSprite(Entity entity)
+    {
+        if (_spriteManager == null) return null;
+
+        return entity switch
+        {
+            Pacman pacman when !pacman.IsDying =>
+                _spriteManager.GetPacmanSpriteInfo(GetPacmanSpriteDirection(pacman), pacman.AnimationFrame),
+            Ghost { State: GhostState.Vulnerable or GhostState.Warning } ghost =>
+                _spriteManager.GetVulnerableGhostSpriteInfo(GetVulnerableGhostFrame(ghost)),
+            Ghost { State: not GhostState.Eaten } ghost =>
+                _spriteManager.GetGhostSpriteInfo(ghost.Type.ToString().ToLower(), GetGhostSpriteDirection(ghost), ghost.AnimationFrame),
+            _ => null
+        };
+    }
+
     private void DrawImage(Canvas canvas, CroppedBitmap sprite, int x, int y, int zIndex)
     {
         var image = new Image
@@ -1138,7 +1196,22 @@ private void DrawImage(Canvas canvas, CroppedBitmap sprite, int x, int y, int zI
         canvas.Children.Add(image);
     }
 
-    private string GetWallSpriteName(int row, int col, TileType[,] map)
+    /// <summary>
+    /// Resolve the wall sprite of every cell once (fallback for maps without a precomputed tile grid)
+    /// </summary>
+    private static string?[,] BuildWallSprites(TileType[,] map)
+    {
+        var sprites = new string?[Constants.MapHeight, Constants.MapWidth];
+        for (int row = 0; row < Constants.MapHeight; row++)
+        for (int col = 0; col < Constants.MapWidth; col++)
+        {
+            if (map[row, col] == TileType.Wall)
+                sprites[row, col] = GetWallSpriteName(row, col, map);
+        }
+        return sprites;
+    }
+
+    private static string GetWallSpriteName(int row, int col, TileType[,] map)
     {
         bool hasUp = row > 0 && map[row - 1, col] == TileType.Wall;
         bool hasDown = row < Constants.MapHeight - 1 && map[row + 1, col] == TileType.Wall;
@@ -1,6 +1,8 @@
+using System;
 using System.Collections.Generic;
 using MazeChomperGame.Models.Entities;
 using MazeChomperGame.Models.Enums;
+using MazeChomperGame.Services.Models;
 
 namespace MazeChomperGame.Services.Interfaces;
 
@@ -10,12 +12,14 @@ namespace MazeChomperGame.Services.Interfaces;
 public interface ICollisionDetector
 {
     /// <summary>
-    /// Check if Arcade Maze Chomper collides with any ghost
+    /// Check if Arcade Maze Chomper collides with any ghost.
+    /// With sprite collision data the check is pixel-level at the drawn positions; otherwise it is grid-based.
     /// </summary>
     /// <param name="pacman">Arcade Maze Chomper entity</param>
     /// <param name="ghosts">List of ghost entities</param>
+    /// <param name="getSprite">Sprite an entity is currently drawn with (bounds and collision mask), or null</param>
     /// <returns>The ghost that Arcade Maze Chomper collided with, or null</returns>
-    Ghost? CheckPacmanGhostCollision(Pacman pacman, List<Ghost> ghosts);
+    Ghost? CheckPacmanGhostCollision(Pacman pacman, List<Ghost> ghosts, Func<Entity, SpriteInfo?>? getSprite = null);
 
     /// <summary>
     /// Check if Arcade Maze Chomper collides with a collectible
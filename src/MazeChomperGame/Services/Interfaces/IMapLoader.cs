@@ -15,6 +15,13 @@ public interface IMapLoader
     /// <returns>2D array representing the map tiles</returns>
     TileType[,] LoadMap(string fileName);
 
+    /// <summary>
+    /// Load the precomputed wall tile grid generated at build time for a map
+    /// </summary>
+    /// <param name="fileName">Name of the map file (e.g., "level1.txt")</param>
+    /// <returns>Tile sprite name per cell (null where there is no tile), or null if the map has no tile grid</returns>
+    string?[,]? LoadTileGrid(string fileName);
+
     /// <summary>
     /// Get Arcade Maze Chomper's starting position from the map
     /// </summary>
@@ -1,4 +1,5 @@
 using Avalonia.Media.Imaging;
+using MazeChomperGame.Services.Models;
 
 namespace MazeChomperGame.Services.Interfaces;
 
@@ -65,10 +66,41 @@ public interface ISpriteManager
     /// <returns>Cropped sprite bitmap</returns>
     CroppedBitmap? GetTileSprite(string tileType);
 
+    /// <summary>
+    /// Get the pre-rendered static maze (walls and ghost door) of a map
+    /// </summary>
+    /// <param name="mapFileName">Name of the map file (e.g., "level1.txt")</param>
+    /// <returns>Full-map bitmap, or null if the map has no pre-rendered background</returns>
+    Bitmap? GetMazeBackground(string mapFileName);
+
     /// <summary>
     /// Get Arcade Maze Chomper death animation sprite
     /// </summary>
     /// <param name="frame">Death animation frame (0-10)</param>
     /// <returns>Cropped sprite bitmap</returns>
     CroppedBitmap? GetDeathSprite(int frame);
+
+    /// <summary>
+    /// Get the location and collision data (bounds, mask, centroid) of an Arcade Maze Chomper sprite
+    /// </summary>
+    /// <param name="direction">Direction (right, left, up, down)</param>
+    /// <param name="frame">Animation frame (0-2)</param>
+    /// <returns>Sprite info, or null if the sprite is not loaded</returns>
+    SpriteInfo? GetPacmanSpriteInfo(string direction, int frame);
+
+    /// <summary>
+    /// Get the location and collision data (bounds, mask, centroid) of a ghost sprite
+    /// </summary>
+    /// <param name="ghostType">Ghost type (blinky, pinky, inky, clyde)</param>
+    /// <param name="direction">Direction (right, left, up, down)</param>
+    /// <param name="frame">Animation frame (0-1)</param>
+    /// <returns>Sprite info, or null if the sprite is not loaded</returns>
+    SpriteInfo? GetGhostSpriteInfo(string ghostType, string direction, int frame);
+
+    /// <summary>
+    /// Get the location and collision data (bounds, mask, centroid) of a vulnerable ghost sprite
+    /// </summary>
+    /// <param name="frame">Animation frame (0-1)</param>
+    /// <returns>Sprite info, or null if the sprite is not loaded</returns>
+    SpriteInfo? GetVulnerableGhostSpriteInfo(int frame);
 }
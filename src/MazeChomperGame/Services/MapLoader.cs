@@ -1,10 +1,12 @@
 using System;
 using System.Collections.Generic;
 using System.IO;
+using System.Text.Json.Nodes;
 using Microsoft.Extensions.Logging;
 using MazeChomperGame.Helpers;
 using MazeChomperGame.Models.Enums;
 using MazeChomperGame.Services.Interfaces;
+using MazeChomperGame.Shared;
 
 namespace MazeChomperGame.Services;
 
@@ -16,6 +18,7 @@ public class MapLoader : IMapLoader
 {
     private readonly ILogger<MapLoader> _logger;
     private readonly string _mapsPath;
+    private readonly Dictionary<string, CompiledMap?> _compiledMaps = new();
 
     public MapLoader(ILogger<MapLoader> logger)
     {
@@ -53,6 +56,22 @@ private string GetAssetsBasePath()
         }
 
         _logger.LogInformation($"Loading map: {fileName}");
+
+        var compiled = GetCompiledMap(fileName);
+        if (compiled != null)
+        {
+            TileType[,] compiledTiles = new TileType[Constants.MapHeight, Constants.MapWidth];
+            for (int row = 0; row < Constants.MapHeight; row++)
+            for (int col = 0; col < Constants.MapWidth; col++)
+            {
+                if (CompiledMap.IsSet(compiled.Walls, row, col))
+                    compiledTiles[row, col] = TileType.Wall;
+                else if (CompiledMap.IsSet(compiled.GhostDoors, row, col))
+                    compiledTiles[row, col] = TileType.GhostDoor;
+            }
+            return compiledTiles;
+        }
+
         // Read all lines from the file
         string[] lines = File.ReadAllLines(filePath);
 
@@ -90,11 +109,65 @@ private string GetAssetsBasePath()
         return tiles;
     }
 
+    /// <summary>
+    /// Load the wall tile grid precomputed by tools/AssetGeneration/generate_tile_maps.py
+    /// (e.g. level1.tiles.json next to level1.txt). Each row is a string with one character
+    /// per cell, mapped to a tile sprite name through the "legend" object.
+    /// </summary>
+    public string?[,]? LoadTileGrid(string fileName)
+    {
+        string filePath = Path.Combine(_mapsPath, Path.GetFileNameWithoutExtension(fileName) + Constants.TileGridExtension);
+
+        if (!File.Exists(filePath))
+        {
+            _logger.LogWarning($"Tile grid not found: {filePath}");
+            return null;
+        }
+
+        try
+        {
+            var doc = JsonNode.Parse(File.ReadAllText(filePath));
+            if (doc?["legend"] is not JsonObject legendObj || doc["rows"] is not JsonArray rows)
+                return null;
+
+            int width = doc["width"]?.GetValue<int>() ?? 0;
+            int height = doc["height"]?.GetValue<int>() ?? 0;
+            if (width != Constants.MapWidth || height != Constants.MapHeight || rows.Count != height)
+            {
+                _logger.LogWarning($"Tile grid size mismatch in {filePath}: {width}x{height}");
+                return null;
+            }
+
+            var legend = new Dictionary<char, string>();
+            foreach (var entry in legendObj)
+                legend[entry.Key[0]] = entry.Value!.GetValue<string>();
+
+            var grid = new string?[Constants.MapHeight, Constants.MapWidth];
+            for (int row = 0; row < Constants.MapHeight; row++)
+            {
+                string line = rows[row]!.GetValue<string>();
+                for (int col = 0; col < Constants.MapWidth && col < line.Length; col++)
+                    grid[row, col] = legend.TryGetValue(line[col], out var spriteName) ? spriteName : null;
+            }
+
+            return grid;
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, $"Error loading tile grid {filePath}");
+            return null;
+        }
+    }
+
     /// <summary>
     /// Get Arcade Maze Chomper's starting position from the map
     /// </summary>
     public (int Row, int Col) GetPacmanSpawn(string fileName)
     {
+        var compiled = GetCompiledMap(fileName);
+        if (compiled != null)
+            return compiled.PacmanSpawn;
+
         string filePath = Path.Combine(_mapsPath, fileName);
         string[] lines = File.ReadAllLines(filePath);
 
@@ -117,6 +190,10 @@ private string GetAssetsBasePath()
     /// </summary>
     public List<(int Row, int Col)> GetGhostSpawns(string fileName)
     {
+        var compiled = GetCompiledMap(fileName);
+        if (compiled != null)
+            return new List<(int Row, int Col)>(compiled.GhostSpawns);
+
         string filePath = Path.Combine(_mapsPath, fileName);
         string[] lines = File.ReadAllLines(filePath);
 
@@ -148,6 +225,23 @@ public List<(int Row, int Col)> GetGhostSpawns(string fileName)
     /// </summary>
     public List<(int Row, int Col, CollectibleType Type)> GetCollectibles(string fileName)
     {
+        var compiled = GetCompiledMap(fileName);
+        if (compiled != null)
+        {
+            var compiledCollectibles = new List<(int Row, int Col, CollectibleType Type)>();
+            for (int row = 0; row < compiled.Height; row++)
+            for (int col = 0; col < compiled.Width; col++)
+            {
+                if (CompiledMap.IsSet(compiled.Dots, row, col))
+                    compiledCollectibles.Add((row, col, CollectibleType.SmallDot));
+                else if (CompiledMap.IsSet(compiled.PowerPellets, row, col))
+                    compiledCollectibles.Add((row, col, CollectibleType.PowerPellet));
+                else if (CompiledMap.IsSet(compiled.Fruits, row, col))
+                    compiledCollectibles.Add((row, col, CollectibleType.Cherry)); // Default fruit
+            }
+            return compiledCollectibles;
+        }
+
         string filePath = Path.Combine(_mapsPath, fileName);
         string[] lines = File.ReadAllLines(filePath);
 
@@ -175,6 +269,10 @@ public List<(int Row, int Col, CollectibleType Type)> GetCollectibles(string fil
     /// </summary>
     public int CountDots(string fileName)
     {
+        var compiled = GetCompiledMap(fileName);
+        if (compiled != null)
+            return compiled.DotCount;
+
         string filePath = Path.Combine(_mapsPath, fileName);
         string[] lines = File.ReadAllLines(filePath);
 
@@ -194,6 +292,34 @@ public int CountDots(string fileName)
         return count;
     }
 
+    /// <summary>
+    /// Get the compiled version of a map (level1.txt -> level1.mzmap), read once and cached.
+    /// Returns null when the map has not been compiled, so callers fall back to parsing the text file.
+    /// </summary>
+    private CompiledMap? GetCompiledMap(string fileName)
+    {
+        if (_compiledMaps.TryGetValue(fileName, out var cached))
+            return cached;
+
+        CompiledMap? compiled = null;
+        try
+        {
+            compiled = CompiledMap.TryLoad(Path.Combine(_mapsPath, fileName));
+            if (compiled != null && (compiled.Width != Constants.MapWidth || compiled.Height != Constants.MapHeight))
+            {
+                _logger.LogWarning($"Compiled map size mismatch for {fileName}: {compiled.Width}x{compiled.Height}");
+                compiled = null;
+            }
+        }
+        catch (InvalidDataException ex)
+        {
+            _logger.LogWarning(ex, $"Ignoring invalid compiled map for {fileName}");
+        }
+
+        _compiledMaps[fileName] = compiled;
+        return compiled;
+    }
+
     /// <summary>
     /// Convert a map character to a TileType
     /// </summary>
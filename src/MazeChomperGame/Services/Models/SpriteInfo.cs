@@ -1,3 +1,4 @@
+using System;
 using System.Collections.Generic;
 
 namespace MazeChomperGame.Services.Models;
@@ -31,6 +32,60 @@ public class SpriteInfo
     /// Name/identifier of the sprite
     /// </summary>
     public string Name { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Tight bounding box of the solid pixels (alpha >= 128), relative to the sprite cell.
+    /// Empty (0 x 0) for sprites without solid pixels or maps generated without collision data.
+    /// </summary>
+    public (int X, int Y, int Width, int Height) Bounds { get; set; }
+
+    /// <summary>
+    /// 1-bit collision mask of the bounding box: one row after another, most significant bit first,
+    /// each row padded to a whole byte
+    /// </summary>
+    public byte[] CollisionMask { get; set; } = Array.Empty<byte>();
+
+    /// <summary>
+    /// Centre of mass of the solid pixels, relative to the sprite cell
+    /// </summary>
+    public (float X, float Y) Centroid { get; set; }
+
+    /// <summary>
+    /// Check whether two sprites overlap at pixel level. The bounding boxes are compared first,
+    /// and the masks are only ANDed over the intersection when the boxes touch.
+    /// </summary>
+    /// <param name="other">The other sprite</param>
+    /// <param name="offsetX">X of the other sprite's cell relative to this one's, in pixels</param>
+    /// <param name="offsetY">Y of the other sprite's cell relative to this one's, in pixels</param>
+    public bool Overlaps(SpriteInfo other, int offsetX, int offsetY)
+    {
+        int left = Math.Max(Bounds.X, other.Bounds.X + offsetX);
+        int top = Math.Max(Bounds.Y, other.Bounds.Y + offsetY);
+        int right = Math.Min(Bounds.X + Bounds.Width, other.Bounds.X + offsetX + other.Bounds.Width);
+        int bottom = Math.Min(Bounds.Y + Bounds.Height, other.Bounds.Y + offsetY + other.Bounds.Height);
+        if (left >= right || top >= bottom)
+            return false;
+
+        for (int y = top; y < bottom; y++)
+        {
+            for (int x = left; x < right; x++)
+            {
+                if (IsSolid(x - Bounds.X, y - Bounds.Y) &&
+                    other.IsSolid(x - offsetX - other.Bounds.X, y - offsetY - other.Bounds.Y))
+                {
+                    return true;
+                }
+            }
+        }
+
+        return false;
+    }
+
+    private bool IsSolid(int x, int y)
+    {
+        int rowBytes = (Bounds.Width + 7) / 8;
+        return (CollisionMask[y * rowBytes + x / 8] & (0x80 >> (x % 8))) != 0;
+    }
 }
 
 /// <summary>
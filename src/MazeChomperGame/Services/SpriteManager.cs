@@ -21,6 +21,7 @@ public class SpriteManager : ISpriteManager
     private readonly ILogger<SpriteManager> _logger;
     private readonly Dictionary<string, Bitmap> _spriteSheets = new();
     private readonly Dictionary<string, (string SheetName, SpriteInfo Info)> _flattenedSprites = new();
+    private readonly Dictionary<string, Bitmap?> _mazeBackgrounds = new();
     private bool _isInitialized;
 
     public SpriteManager(ILogger<SpriteManager> logger)
@@ -53,10 +54,22 @@ public void Initialize()
 
         try
         {
-            LoadSpriteSheet("pacman", Constants.PacmanSpriteSheet, Constants.PacmanSpriteMap);
-            LoadSpriteSheet("ghosts", Constants.GhostsSpriteSheet, Constants.GhostsSpriteMap);
-            LoadSpriteSheet("items", Constants.ItemsSpriteSheet, Constants.ItemsSpriteMap);
-            LoadSpriteSheet("tiles", Constants.TilesSpriteSheet, Constants.TilesSpriteMap);
+            var spritesPath = Path.Combine(GetAssetsBasePath(), "Sprites");
+            bool atlasLoaded = false;
+            if (File.Exists(Path.Combine(spritesPath, Constants.AtlasSpriteSheet)) &&
+                File.Exists(Path.Combine(spritesPath, Constants.AtlasSpriteMap)))
+            {
+                // Single texture for every sheet: one file read and one decode at startup
+                atlasLoaded = TryLoadAtlas(Constants.AtlasSpriteSheet, Constants.AtlasSpriteMap);
+            }
+
+            if (!atlasLoaded)
+            {
+                LoadSpriteSheet("pacman", Constants.PacmanSpriteSheet, Constants.PacmanSpriteMap);
+                LoadSpriteSheet("ghosts", Constants.GhostsSpriteSheet, Constants.GhostsSpriteMap);
+                LoadSpriteSheet("items", Constants.ItemsSpriteSheet, Constants.ItemsSpriteMap);
+                LoadSpriteSheet("tiles", Constants.TilesSpriteSheet, Constants.TilesSpriteMap);
+            }
 
             _isInitialized = true;
             _logger.LogInformation("SpriteManager initialized successfully");
@@ -104,6 +117,55 @@ private void LoadSpriteSheet(string name, string imageFileName, string mapFileNa
         }
     }
 
+    private bool TryLoadAtlas(string imageFileName, string mapFileName)
+    {
+        Bitmap? atlas = null;
+        try
+        {
+            var spritesPath = Path.Combine(GetAssetsBasePath(), "Sprites");
+            var imagePath = Path.Combine(spritesPath, imageFileName);
+            var mapPath = Path.Combine(spritesPath, mapFileName);
+
+            using var imageStream = File.OpenRead(imagePath);
+            atlas = new Bitmap(imageStream);
+
+            using var reader = new StreamReader(mapPath);
+            string json = reader.ReadToEnd();
+
+            var doc = JsonNode.Parse(json);
+            var defaultSpriteSize = doc?["sprite_size"]?.GetValue<int>() ?? 32;
+
+            if (doc?["sheets"] is JsonObject sheetsObj)
+            {
+                // Every sheet name points at the same bitmap, so flat keys and GetSprite stay unchanged
+                foreach (var sheet in sheetsObj)
+                {
+                    if (sheet.Value is not JsonObject sheetObj)
+                        continue;
+
+                    _spriteSheets[sheet.Key] = atlas;
+                    var spriteSize = sheetObj["sprite_size"]?.GetValue<int>() ?? defaultSpriteSize;
+                    if (sheetObj["sprites"] is JsonObject spritesObj)
+                    {
+                        FlattenSpriteObject(sheet.Key, spritesObj, spriteSize, "");
+                    }
+                }
+            }
+
+            _logger.LogInformation("Loaded texture atlas with {Count} sprites", _flattenedSprites.Count);
+            return true;
+        }
+        catch (Exception ex)
+        {
+            // An unreadable atlas must not stop the game: drop what was loaded and use the individual sheets
+            _logger.LogWarning(ex, "Error loading texture atlas, falling back to individual sprite sheets");
+            _spriteSheets.Clear();
+            _flattenedSprites.Clear();
+            atlas?.Dispose();
+            return false;
+        }
+    }
+
     private void FlattenSpriteObject(string sheetName, JsonObject obj, int spriteSize, string prefix)
     {
         foreach (var kvp in obj)
@@ -157,7 +219,21 @@ private SpriteInfo ExtractSpriteInfo(JsonObject obj, int defaultSize)
         var width = obj["width"]?.GetValue<int>() ?? defaultSize;
         var height = obj["height"]?.GetValue<int>() ?? defaultSize;
 
-        return new SpriteInfo { X = x, Y = y, Width = width, Height = height, Name = "" };
+        var sprite = new SpriteInfo { X = x, Y = y, Width = width, Height = height, Name = "" };
+
+        // Collision data emitted by the asset build (bbox, mask, centroid); absent in older maps
+        if (obj["bbox"] is JsonArray bbox && bbox.Count == 4)
+        {
+            sprite.Bounds = (bbox[0]!.GetValue<int>(), bbox[1]!.GetValue<int>(),
+                             bbox[2]!.GetValue<int>(), bbox[3]!.GetValue<int>());
+            sprite.CollisionMask = Convert.FromBase64String(obj["mask"]?.GetValue<string>() ?? string.Empty);
+        }
+        if (obj["centroid"] is JsonArray centroid && centroid.Count == 2)
+        {
+            sprite.Centroid = (centroid[0]!.GetValue<float>(), centroid[1]!.GetValue<float>());
+        }
+
+        return sprite;
     }
 
     private CroppedBitmap? GetSprite(string flatKey)
@@ -190,22 +266,27 @@ private SpriteInfo ExtractSpriteInfo(JsonObject obj, int defaultSize)
         }
     }
 
+    // Flat keys shared by the bitmap and the collision-data lookups
+    private static string PacmanSpriteKey(string direction, int frame) => $"pacman_pacman_{direction.ToLower()}_{frame}";
+
+    private static string GhostSpriteKey(string ghostType, string direction, int frame) =>
+        $"ghosts_{ghostType.ToLower()}_{direction.ToLower()}_{frame}";
+
+    private static string VulnerableGhostSpriteKey(int frame) => $"ghosts_vulnerable_normal_{frame}";
+
     public CroppedBitmap? GetPacmanSprite(string direction, int frame)
     {
-        string flatKey = $"pacman_pacman_{direction.ToLower()}_{frame}";
-        return GetSprite(flatKey);
+        return GetSprite(PacmanSpriteKey(direction, frame));
     }
 
     public CroppedBitmap? GetGhostSprite(string ghostType, string direction, int frame)
     {
-        string flatKey = $"ghosts_{ghostType.ToLower()}_{direction.ToLower()}_{frame}";
-        return GetSprite(flatKey);
+        return GetSprite(GhostSpriteKey(ghostType, direction, frame));
     }
 
     public CroppedBitmap? GetVulnerableGhostSprite(int frame)
     {
-        string flatKey = $"ghosts_vulnerable_normal_{frame}";
-        return GetSprite(flatKey);
+        return GetSprite(VulnerableGhostSpriteKey(frame));
     }
 
     public CroppedBitmap? GetWarningGhostSprite(int frame)
@@ -250,9 +331,55 @@ private SpriteInfo ExtractSpriteInfo(JsonObject obj, int defaultSize)
         return GetSprite(flatKey);
     }
 
+    public Bitmap? GetMazeBackground(string mapFileName)
+    {
+        if (_mazeBackgrounds.TryGetValue(mapFileName, out var cached))
+            return cached;
+
+        Bitmap? background = null;
+        var backgroundPath = Path.Combine(GetAssetsBasePath(), "Maps",
+            Path.GetFileNameWithoutExtension(mapFileName) + Constants.MazeBackgroundSuffix);
+        if (File.Exists(backgroundPath))
+        {
+            try
+            {
+                using var imageStream = File.OpenRead(backgroundPath);
+                background = new Bitmap(imageStream);
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Error loading maze background {Path}", backgroundPath);
+            }
+        }
+
+        // Cached either way, so a missing background is not looked up again on every level load
+        _mazeBackgrounds[mapFileName] = background;
+        return background;
+    }
+
     public CroppedBitmap? GetDeathSprite(int frame)
     {
         string flatKey = $"pacman_pacman_death_{frame}";
         return GetSprite(flatKey);
     }
+
+    public SpriteInfo? GetPacmanSpriteInfo(string direction, int frame)
+    {
+        return GetSpriteInfo(PacmanSpriteKey(direction, frame));
+    }
+
+    public SpriteInfo? GetGhostSpriteInfo(string ghostType, string direction, int frame)
+    {
+        return GetSpriteInfo(GhostSpriteKey(ghostType, direction, frame));
+    }
+
+    public SpriteInfo? GetVulnerableGhostSpriteInfo(int frame)
+    {
+        return GetSpriteInfo(VulnerableGhostSpriteKey(frame));
+    }
+
+    private SpriteInfo? GetSpriteInfo(string flatKey)
+    {
+        return _flattenedSprites.TryGetValue(flatKey, out var entry) ? entry.Info : null;
+    }
 }
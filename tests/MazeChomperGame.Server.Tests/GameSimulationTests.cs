@@ -112,4 +112,45 @@ public void SetPlayerInput_StoresInputForRole()
         // Assert
         Assert.True(stateAfter.PacmanPosition!.X >= stateBefore.PacmanPosition!.X);
     }
+
+    [Fact]
+    public void GetDirectionToward_WithNavigationTable_ReturnsTableLookup()
+    {
+        // Arrange
+        var table = NavigationTable.TryLoad(Path.Combine(AppContext.BaseDirectory, "Assets", "Maps", "level1.txt"));
+        Assert.NotNull(table);
+        var roles = new List<PlayerRole> { PlayerRole.Pacman };
+        _mockMapLoader.Setup(m => m.LoadMap(It.IsAny<string>())).Returns(new TileType[31, 28]);
+        _mockMapLoader.Setup(m => m.GetPacmanSpawn(It.IsAny<string>())).Returns((23, 13));
+        _mockMapLoader.Setup(m => m.GetGhostSpawns(It.IsAny<string>())).Returns(new List<(int Row, int Col)>());
+        _mockMapLoader.Setup(m => m.GetCollectibles(It.IsAny<string>())).Returns(new List<Collectible>());
+        _mockMapLoader.Setup(m => m.LoadNavigationTable(It.IsAny<string>())).Returns(table);
+        _simulation.Initialize(1, roles);
+        var entity = new Pacman(23, 13);
+
+        // Act
+        var direction = _simulation.GetDirectionToward(entity, 1, 1);
+
+        // Assert
+        Assert.Equal(table!.GetDirection(23, 13, 1, 1), direction);
+        Assert.Equal(Direction.Left, direction);
+    }
+
+    [Fact]
+    public void GetDirectionToward_WithoutNavigationTable_ReturnsNone()
+    {
+        // Arrange
+        var roles = new List<PlayerRole> { PlayerRole.Pacman };
+        _mockMapLoader.Setup(m => m.LoadMap(It.IsAny<string>())).Returns(new TileType[31, 28]);
+        _mockMapLoader.Setup(m => m.GetPacmanSpawn(It.IsAny<string>())).Returns((23, 13));
+        _mockMapLoader.Setup(m => m.GetGhostSpawns(It.IsAny<string>())).Returns(new List<(int Row, int Col)>());
+        _mockMapLoader.Setup(m => m.GetCollectibles(It.IsAny<string>())).Returns(new List<Collectible>());
+        _simulation.Initialize(1, roles);
+
+        // Act
+        var direction = _simulation.GetDirectionToward(new Pacman(23, 13), 1, 1);
+
+        // Assert
+        Assert.Equal(Direction.None, direction);
+    }
 }
@@ -0,0 +1,72 @@
+using Xunit;
+using Microsoft.Extensions.Logging;
+using Moq;
+using MazeChomperGame.Server.Models;
+using MazeChomperGame.Server.Services;
+using MazeChomperGame.Shared;
+
+namespace MazeChomperGame.Server.Tests;
+
+public class MapLoaderTests : IDisposable
+{
+    private const string LevelName = "level1.txt";
+
+    // Maps copied to the test output by the server project (Assets/Maps/*.txt, *.mzmap)
+    private static readonly string AssetMapsPath = Path.Combine(AppContext.BaseDirectory, "Assets", "Maps");
+
+    private readonly string _textOnlyPath;
+    private readonly string _compiledPath;
+
+    public MapLoaderTests()
+    {
+        string root = Path.Combine(Path.GetTempPath(), $"mzmap_tests_{Guid.NewGuid():N}");
+        _textOnlyPath = Path.Combine(root, "text");
+        _compiledPath = Path.Combine(root, "compiled");
+        Directory.CreateDirectory(_textOnlyPath);
+        Directory.CreateDirectory(_compiledPath);
+
+        string compiledName = Path.ChangeExtension(LevelName, CompiledMap.FileExtension);
+        File.Copy(Path.Combine(AssetMapsPath, LevelName), Path.Combine(_textOnlyPath, LevelName));
+        File.Copy(Path.Combine(AssetMapsPath, LevelName), Path.Combine(_compiledPath, LevelName));
+        File.Copy(Path.Combine(AssetMapsPath, compiledName), Path.Combine(_compiledPath, compiledName));
+    }
+
+    public void Dispose()
+    {
+        Directory.Delete(Path.GetDirectoryName(_textOnlyPath)!, recursive: true);
+    }
+
+    private static MapLoader CreateLoader(string mapsPath)
+    {
+        return new MapLoader(new Mock<ILogger<MapLoader>>().Object, mapsPath);
+    }
+
+    [Fact]
+    public void LoadMap_CompiledAndTextMaps_ProduceIdenticalGrids()
+    {
+        // Act
+        var fromText = CreateLoader(_textOnlyPath).LoadMap(LevelName);
+        var fromCompiled = CreateLoader(_compiledPath).LoadMap(LevelName);
+
+        // Assert
+        Assert.Equal(fromText.GetLength(0), fromCompiled.GetLength(0));
+        Assert.Equal(fromText.GetLength(1), fromCompiled.GetLength(1));
+        for (int row = 0; row < fromText.GetLength(0); row++)
+        for (int col = 0; col < fromText.GetLength(1); col++)
+        {
+            Assert.True(fromText[row, col] == fromCompiled[row, col],
+                $"Tile ({row}, {col}): text {fromText[row, col]}, compiled {fromCompiled[row, col]}");
+        }
+    }
+
+    [Fact]
+    public void LoadMap_CompiledMap_HasWalkableCells()
+    {
+        // Act
+        var tiles = CreateLoader(_compiledPath).LoadMap(LevelName);
+        var (pacmanRow, pacmanCol) = CreateLoader(_compiledPath).GetPacmanSpawn(LevelName);
+
+        // Assert
+        Assert.Equal(TileType.Empty, tiles[pacmanRow, pacmanCol]);
+    }
+}
@@ -0,0 +1,98 @@
+using Xunit;
+using MazeChomperGame.Shared;
+
+namespace MazeChomperGame.Server.Tests;
+
+public class NavigationTableTests
+{
+    // Tables copied to the test output by the server project (Assets/Maps/*.nav)
+    private static readonly string LevelPath = Path.Combine(AppContext.BaseDirectory, "Assets", "Maps", "level1.txt");
+
+    private const int PacmanRow = 23;
+    private const int PacmanCol = 13;
+
+    private static NavigationTable LoadLevel1()
+    {
+        var table = NavigationTable.TryLoad(LevelPath);
+        Assert.NotNull(table);
+        return table!;
+    }
+
+    [Fact]
+    public void TryLoad_Level1_ReadsHeader()
+    {
+        // Act
+        var table = LoadLevel1();
+
+        // Assert
+        Assert.Equal(28, table.Width);
+        Assert.Equal(31, table.Height);
+        Assert.True(table.CellCount > 0);
+    }
+
+    [Theory]
+    [InlineData(23, 14, Direction.Right)]
+    [InlineData(23, 12, Direction.Left)]
+    [InlineData(1, 1, Direction.Left)]
+    [InlineData(29, 26, Direction.Right)]
+    public void GetDirection_FromPacmanSpawn_ReturnsFirstStepOfShortestPath(int toRow, int toCol, Direction expected)
+    {
+        // Arrange
+        var table = LoadLevel1();
+
+        // Act & Assert
+        Assert.Equal(expected, table.GetDirection(PacmanRow, PacmanCol, toRow, toCol));
+    }
+
+    [Fact]
+    public void GetDirection_FollowingTheSteps_ReachesTheTarget()
+    {
+        // Arrange
+        var table = LoadLevel1();
+        int row = PacmanRow, col = PacmanCol;
+        const int targetRow = 1, targetCol = 1;
+
+        // Act: every step must lead to a walkable cell until the target is reached
+        int steps = 0;
+        while ((row, col) != (targetRow, targetCol) && steps < table.CellCount)
+        {
+            var direction = table.GetDirection(row, col, targetRow, targetCol);
+            Assert.NotEqual(Direction.None, direction);
+            (row, col) = direction switch
+            {
+                Direction.Up => ((row - 1 + table.Height) % table.Height, col),
+                Direction.Down => ((row + 1) % table.Height, col),
+                Direction.Left => (row, (col - 1 + table.Width) % table.Width),
+                _ => (row, (col + 1) % table.Width)
+            };
+            Assert.True(table.IsReachable(row, col, targetRow, targetCol));
+            steps++;
+        }
+
+        // Assert
+        Assert.Equal((targetRow, targetCol), (row, col));
+    }
+
+    [Fact]
+    public void GetDirection_SameCellWallOrOutOfMap_ReturnsNone()
+    {
+        // Arrange
+        var table = LoadLevel1();
+
+        // Act & Assert
+        Assert.Equal(Direction.None, table.GetDirection(PacmanRow, PacmanCol, PacmanRow, PacmanCol));
+        Assert.Equal(Direction.None, table.GetDirection(PacmanRow, PacmanCol, 0, 0));
+        Assert.Equal(Direction.None, table.GetDirection(PacmanRow, PacmanCol, -1, 40));
+        Assert.False(table.IsReachable(0, 0, PacmanRow, PacmanCol));
+    }
+
+    [Fact]
+    public void Parse_WithWrongMagic_Throws()
+    {
+        // Arrange
+        var data = new byte[16];
+
+        // Act & Assert
+        Assert.Throws<InvalidDataException>(() => NavigationTable.Parse(data));
+    }
+}
@@ -3,7 +3,9 @@
 using MazeChomperGame.Services;
 using MazeChomperGame.Models.Entities;
 using MazeChomperGame.Models.Enums;
+using MazeChomperGame.Services.Models;
 using System.Collections.Generic;
+using System.Linq;
 using Microsoft.Extensions.Logging;
 using Moq;
 
@@ -50,6 +52,47 @@ public void CheckPacmanGhostCollision_ShouldReturnNull_WhenFarApart()
         result.Should().BeNull();
     }
 
+    // Fully solid square of the given box inside a 32x32 cell
+    private static SpriteInfo CreateSolidSprite(int x, int y, int size) => new()
+    {
+        Width = 32,
+        Height = 32,
+        Bounds = (x, y, size, size),
+        CollisionMask = Enumerable.Repeat((byte)0xFF, (size + 7) / 8 * size).ToArray()
+    };
+
+    [Fact]
+    public void CheckPacmanGhostCollision_ShouldDetectCollision_WhenMasksOverlapBetweenTiles()
+    {
+        // Arrange: different tiles, but the ghost is drawn 19 px to the right of Arcade Maze Chomper
+        var pacman = new Pacman(10, 10, _mockPacmanLogger.Object);
+        var ghost = new Ghost(11, 10) { ExactX = 10.6f };
+        var ghosts = new List<Ghost> { ghost };
+        var sprite = CreateSolidSprite(2, 2, 28);
+
+        // Act
+        var result = _sut.CheckPacmanGhostCollision(pacman, ghosts, _ => sprite);
+
+        // Assert
+        result.Should().Be(ghost);
+    }
+
+    [Fact]
+    public void CheckPacmanGhostCollision_ShouldReturnNull_WhenOnSameTileButMasksDoNotTouch()
+    {
+        // Arrange: same tile, ghost drawn 12 px to the right, 4x4 solid boxes
+        var pacman = new Pacman(10, 10, _mockPacmanLogger.Object);
+        var ghost = new Ghost(10, 10) { ExactX = 10.4f };
+        var ghosts = new List<Ghost> { ghost };
+        var sprite = CreateSolidSprite(14, 14, 4);
+
+        // Act
+        var result = _sut.CheckPacmanGhostCollision(pacman, ghosts, _ => sprite);
+
+        // Assert
+        result.Should().BeNull();
+    }
+
     [Fact]
     public void CheckPacmanCollectibleCollision_ShouldDetectCollision()
     {
@@ -3,8 +3,10 @@
 using FluentAssertions;
 using MazeChomperGame.Services;
 using MazeChomperGame.Services.Interfaces;
+using MazeChomperGame.Services.Models;
 using MazeChomperGame.Models.Enums;
 using MazeChomperGame.Models.Entities;
+using System;
 using System.Collections.Generic;
 using MazeChomperGame.Helpers;
 using System.Linq;
@@ -103,7 +105,7 @@ public void Update_ShouldStartDeathSequence_WhenPacmanHitsGhost()
         _sut.Pacman.NextDirection = Direction.None;
 
         // Use It.IsAny to be safe against reference changes, though references should be stable here
-        _mockCollisionDetector.Setup(c => c.CheckPacmanGhostCollision(It.IsAny<Pacman>(), It.IsAny<List<Ghost>>())).Returns(ghost);
+        _mockCollisionDetector.Setup(c => c.CheckPacmanGhostCollision(It.IsAny<Pacman>(), It.IsAny<List<Ghost>>(), It.IsAny<Func<Entity, SpriteInfo?>>())).Returns(ghost);
 
         // Act
         _sut.Update(0.1f);
@@ -128,7 +130,7 @@ public void Update_WhenLastDotEaten_ShouldFreezeBeforeCheckingGhostCollision()
             .Setup(c => c.CheckPacmanCollectibleCollision(It.IsAny<Pacman>(), It.IsAny<List<Collectible>>()))
             .Returns((Pacman _, List<Collectible> list) => list[0]);
         _mockCollisionDetector
-            .Setup(c => c.CheckPacmanGhostCollision(It.IsAny<Pacman>(), It.IsAny<List<Ghost>>()))
+            .Setup(c => c.CheckPacmanGhostCollision(It.IsAny<Pacman>(), It.IsAny<List<Ghost>>(), It.IsAny<Func<Entity, SpriteInfo?>>()))
             .Returns(ghost);
 
         var levelCompleteRaised = false;
@@ -58,4 +58,50 @@ public void LoadMap_ShouldParseWallsCorrectly()
         map.Should().NotBeNull();
         map[0, 0].Should().Be(TileType.Wall);
     }
+
+    [Fact]
+    public void LoadTileGrid_ShouldReturnNull_WhenGridIsMissing()
+    {
+        // Arrange
+        var mapContent = new string[31];
+        for (int i = 0; i < 31; i++)
+        {
+            mapContent[i] = new string('#', 28);
+        }
+        File.WriteAllLines(Path.Combine(_tempMapDir, "testmap.txt"), mapContent);
+        var mapLoader = CreateMapLoaderWithTempPath();
+        File.Delete(Path.Combine(AppContext.BaseDirectory, "Assets", "Maps", "testmap.tiles.json"));
+
+        // Act
+        var grid = mapLoader.LoadTileGrid("testmap.txt");
+
+        // Assert
+        grid.Should().BeNull();
+    }
+
+    [Fact]
+    public void LoadTileGrid_ShouldMapLegendCharactersToSpriteNames()
+    {
+        // Arrange
+        var mapContent = new string[31];
+        var rows = new string[31];
+        for (int i = 0; i < 31; i++)
+        {
+            mapContent[i] = new string('#', 28);
+            rows[i] = "\"" + (i == 0 ? "A" + new string('.', 27) : new string('.', 28)) + "\"";
+        }
+        File.WriteAllLines(Path.Combine(_tempMapDir, "testmap.txt"), mapContent);
+        var mapLoader = CreateMapLoaderWithTempPath();
+        File.WriteAllText(Path.Combine(AppContext.BaseDirectory, "Assets", "Maps", "testmap.tiles.json"),
+            "{\"width\": 28, \"height\": 31, \"empty\": \".\", \"legend\": {\"A\": \"walls_horizontal\"}, " +
+            "\"rows\": [" + string.Join(", ", rows) + "]}");
+
+        // Act
+        var grid = mapLoader.LoadTileGrid("testmap.txt");
+
+        // Assert
+        grid.Should().NotBeNull();
+        grid![0, 0].Should().Be("walls_horizontal");
+        grid[0, 1].Should().BeNull();
+    }
 }
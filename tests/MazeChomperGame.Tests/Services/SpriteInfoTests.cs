@@ -0,0 +1,61 @@
+using Xunit;
+using FluentAssertions;
+using MazeChomperGame.Services.Models;
+
+namespace MazeChomperGame.Tests.Services;
+
+public class SpriteInfoTests
+{
+    // 2x2 diagonal: solid pixels at (0, 0) and (1, 1)
+    private static SpriteInfo CreateDiagonalSprite() => new()
+    {
+        Width = 32,
+        Height = 32,
+        Bounds = (0, 0, 2, 2),
+        CollisionMask = new byte[] { 0b1000_0000, 0b0100_0000 }
+    };
+
+    [Fact]
+    public void Overlaps_ShouldReturnTrue_WhenSolidPixelsCoincide()
+    {
+        // Arrange
+        var sprite = CreateDiagonalSprite();
+        var other = CreateDiagonalSprite();
+
+        // Act & Assert
+        sprite.Overlaps(other, 0, 0).Should().BeTrue();
+    }
+
+    [Fact]
+    public void Overlaps_ShouldReturnFalse_WhenBoxesTouchButMasksDoNot()
+    {
+        // Arrange
+        var sprite = CreateDiagonalSprite();
+        var other = CreateDiagonalSprite();
+
+        // Act & Assert
+        sprite.Overlaps(other, 1, 0).Should().BeFalse();
+    }
+
+    [Fact]
+    public void Overlaps_ShouldReturnFalse_WhenBoxesDoNotIntersect()
+    {
+        // Arrange
+        var sprite = CreateDiagonalSprite();
+        var other = CreateDiagonalSprite();
+
+        // Act & Assert
+        sprite.Overlaps(other, 5, 0).Should().BeFalse();
+    }
+
+    [Fact]
+    public void Overlaps_ShouldReturnFalse_WhenSpriteHasNoSolidPixels()
+    {
+        // Arrange
+        var sprite = CreateDiagonalSprite();
+        var empty = new SpriteInfo { Width = 32, Height = 32 };
+
+        // Act & Assert
+        sprite.Overlaps(empty, 0, 0).Should().BeFalse();
+    }
+}
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Perfiles de Salida de Audio
+Usado por generate_sound_effects.py, generate_music.py y build_assets.py
+
+Los generadores sintetizan siempre a 44.1 kHz; el perfil decide la tasa y la
+profundidad de bits del archivo final. Por defecto se exporta a 48 kHz, la
+tasa de mezcla de la mayoría de las máquinas objetivo, para que el juego no
+remuestree en cada reproducción. Los efectos cortos de la interfaz no
+necesitan más: se exportan a 22.05 kHz y 8 bits (la mitad de muestras y de
+bytes por muestra).
+
+Un override por asset siempre gana al perfil por defecto.
+"""
+
+import collections
+
+# sample_rate: tasa del archivo WAV (Hz); bits: 16 (PCM con signo) u 8 (PCM sin signo)
+AudioProfile = collections.namedtuple('AudioProfile', ['sample_rate', 'bits'])
+
+AUDIO_PROFILES = {
+    'source': AudioProfile(44100, 16),   # Tasa de síntesis, sin remuestrear
+    'device': AudioProfile(48000, 16),   # Tasa de mezcla habitual del dispositivo
+    'compact': AudioProfile(22050, 16),  # Mitad de tamaño
+    'retro': AudioProfile(22050, 8),     # Una cuarta parte del tamaño
+}
+
+DEFAULT_PROFILE = 'device'
+
+# Overrides por asset (archivo de salida -> nombre de perfil)
+PROFILE_OVERRIDES = {
+    'menu-navigate.wav': 'retro',
+    'menu-select.wav': 'retro',
+    # La música se reproduce en streaming (un solo remuestreo en el mezclador):
+    # a la tasa de síntesis no ocupa más que antes de introducir los perfiles
+    'background-theme.wav': 'source',
+    'menu-theme.wav': 'source',
+    'game-over-theme.wav': 'source',
+}
+
+# Perfil sin conversión: lo que escriben las funciones de guardado si no se indica otro
+SOURCE_PROFILE = AUDIO_PROFILES['source']
+
+def asset_profile(filename, default=DEFAULT_PROFILE):
+    """
+    Perfil de salida de un asset (p. ej. 'menu-navigate.wav')
+
+    Args:
+        filename: nombre del archivo de salida
+        default: nombre del perfil para los assets sin override
+    """
+    return AUDIO_PROFILES[PROFILE_OVERRIDES.get(filename, default)]
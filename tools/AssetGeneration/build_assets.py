@@ -0,0 +1,604 @@
+#!/usr/bin/env python3
+"""
+Constructor Incremental de Assets - Arcade Maze Chomper
+Ejecuta todos los generadores (sprites, efectos de sonido, música e iconos) desde
+un único punto de entrada y solo regenera las salidas cuyas entradas cambiaron.
+
+Cada archivo de salida tiene una huella (SHA-256) calculada a partir de:
+  - El código fuente de la función que lo genera y de todas las funciones que usa
+  - Los valores de las constantes que esas funciones leen (SPRITE_SIZE, COLORS, NOTES, BPM...)
+  - Las versiones de numpy / Pillow
+
+Si la huella coincide con la guardada en la caché y el archivo no fue modificado,
+la salida se omite sin volver a renderizarla.
+
+Uso:
+    python3 build_assets.py                  # Build incremental en src/MazeChomperGame/Assets
+    python3 build_assets.py --force          # Regenerar todo ignorando la caché
+    python3 build_assets.py --output DIR     # Escribir en otro directorio
+    python3 build_assets.py Audio/Music      # Solo las salidas cuya ruta contenga el filtro
+    python3 build_assets.py --jobs 1         # Renderizar en serie (por defecto: un proceso por núcleo)
+    python3 build_assets.py --scales 1 2 4   # Sprite sheets y mapas 1x/2x/4x desde un único render
+    python3 build_assets.py --verify         # Comprobar que los Assets coinciden con un render limpio
+    python3 build_assets.py --parity         # Audio float32 frente a la referencia float64 (máx. 1 LSB)
+    python3 build_assets.py --audio-profile source  # Audio a 44.1 kHz sin remuestrear (ver audio_profiles.py)
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import hashlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import sys
+import time
+import types
+import wave
+
+# Rutas
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, "src", "MazeChomperGame", "Assets")
+CACHE_PATH = os.path.join(SCRIPT_DIR, ".asset-cache.json")
+
+# Incrementar para invalidar todas las huellas guardadas
+CACHE_VERSION = 1
+
+# Paridad del audio: diferencia máxima permitida frente a la referencia float64
+AUDIO_ENCODERS = ('wav', 'voices', 'voices_loop')
+PARITY_TOLERANCE_LSB = 1
+
+# Una unidad de trabajo produce uno o más archivos de salida
+#   output:   ruta relativa al directorio de Assets (separada por '/'), o una
+#             tupla de rutas si la función produce varios archivos a la vez
+#   module:   nombre del script generador (sin .py)
+#   function: función del script que produce el contenido
+#   encoder:  'png' (Image), 'png_scales' (lista de Image, una por salida),
+#             'png_json_scales' (lista de tuplas (Image, dict), una por escala,
+#             p. ej. un sprite sheet o el atlas y su mapa),
+#             'json' (dict), 'wav' (numpy array),
+#             'voices' (mezcla de voces renderizada en streaming),
+#             'voices_loop' (igual, una iteración marcada con chunk 'smpl'),
+#             'bytes_json' (tupla (bytes, dict), p. ej. banco de sonidos e índice) o 'bytes'
+#   args:     argumentos posicionales para la función
+#   profile:  perfil de salida del audio (audio_profiles.AudioProfile) para los
+#             encoders 'wav', 'voices' y 'voices_loop'; None en el resto
+AssetUnit = collections.namedtuple('AssetUnit', ['output', 'module', 'function', 'encoder', 'args', 'profile'],
+                                   defaults=(None,))
+
+# Prioridad de envío al pool: las unidades más costosas primero para que el
+# tiempo total lo marque el tema más largo y no la cola de trabajos
+RENDER_PRIORITY = {
+    'generate_music': 2,
+    'generate_sound_effects': 1,
+}
+
+# Sprite sheets: (script, prefijo de archivo, función que crea el sheet y su mapa)
+SPRITE_SHEETS = [
+    ('generate_pacman_sprites', 'pacman', 'create_pacman_sprite_assets'),
+    ('generate_ghosts_sprites', 'ghosts', 'create_ghosts_sprite_assets'),
+    ('generate_items_sprites', 'items', 'create_items_sprite_assets'),
+    ('generate_tiles_sprites', 'tiles', 'create_tiles_sprite_assets'),
+]
+
+def load_generator(module_name):
+    """
+    Importa un script generador por su nombre de archivo (sin .py)
+
+    Los nombres con guiones (generate-icons) se registran con guiones bajos
+    para que sean importables y serializables.
+    """
+    import_name = module_name.replace('-', '_')
+    if import_name in sys.modules:
+        return sys.modules[import_name]
+
+    path = os.path.join(SCRIPT_DIR, module_name + '.py')
+    spec = importlib.util.spec_from_file_location(import_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[import_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def scaled_filename(filename, scale):
+    """'x.png' -> 'x@2x.png' (1x sin sufijo), igual que sprite_sheet.scaled_filename"""
+    return load_generator('sprite_sheet').scaled_filename(filename, scale)
+
+def unit_outputs(unit):
+    """Rutas de salida de una unidad, siempre como tupla"""
+    return unit.output if isinstance(unit.output, tuple) else (unit.output,)
+
+def collect_units(scales=(1,), audio_profile=None):
+    """
+    Lista todas las unidades de trabajo, en orden determinista
+
+    Args:
+        scales: escalas de los sprite sheets; con más de una, cada sheet se
+                renderiza una sola vez a la mayor y las demás se derivan
+        audio_profile: perfil de audio por defecto (los overrides por asset
+                       de audio_profiles.py se aplican igualmente)
+    """
+    profiles = load_generator('audio_profiles')
+    if audio_profile is None:
+        audio_profile = profiles.DEFAULT_PROFILE
+    units = []
+    scales = tuple(sorted(set(scales)))
+
+    # Cada sheet y su mapa salen del mismo render: las máscaras se calculan de
+    # los píxeles que se exportan, sin volver a dibujar el sheet
+    for module_name, prefix, assets_function in SPRITE_SHEETS:
+        outputs = tuple(f'Sprites/{scaled_filename(filename, scale)}'
+                        for scale in scales
+                        for filename in (f'{prefix}_spritesheet.png', f'{prefix}_sprite_map.json'))
+        units.append(AssetUnit(outputs, module_name, assets_function, 'png_json_scales', (scales,)))
+
+    # Atlas único con los sprites de todos los sheets (una textura al arrancar),
+    # todas las escalas en una unidad para dibujar cada sheet una sola vez
+    outputs = tuple(f'Sprites/{scaled_filename(filename, scale)}'
+                    for scale in scales for filename in ('atlas.png', 'atlas_map.json'))
+    units.append(AssetUnit(outputs, 'generate_atlas', 'create_atlases', 'png_json_scales', (scales,)))
+
+    # Rejilla de tiles de pared de cada nivel (el contenido del nivel entra en la huella)
+    tile_maps = load_generator('generate_tile_maps')
+    for level_filename, lines in tile_maps.level_files():
+        units.append(AssetUnit(f'Maps/{tile_maps.tile_map_filename(level_filename)}',
+                               'generate_tile_maps', 'build_tile_map', 'json', (lines,)))
+
+        # Nivel compilado a binario (se carga con una sola lectura, sin parsear texto)
+        compiled = load_generator('map_compiler').compiled_filename(level_filename)
+        units.append(AssetUnit(f'Maps/{compiled}', 'map_compiler', 'compile_level', 'bytes', (lines,)))
+
+        # Dirección del camino más corto entre cada par de celdas (consulta O(1) en el servidor)
+        nav = load_generator('generate_nav_tables').nav_filename(level_filename)
+        units.append(AssetUnit(f'Maps/{nav}', 'generate_nav_tables', 'build_navigation_table', 'bytes', (lines,)))
+
+        # Fondo estático (paredes + puerta) horneado en una imagen por escala
+        background = load_generator('generate_maze_backgrounds').background_filename(level_filename)
+        if scales == (1,):
+            units.append(AssetUnit(f'Maps/{background}', 'generate_maze_backgrounds',
+                                   'create_maze_background', 'png', (lines,)))
+        else:
+            units.append(AssetUnit(tuple(f'Maps/{scaled_filename(background, scale)}' for scale in scales),
+                                   'generate_maze_backgrounds', 'create_maze_backgrounds', 'png_scales',
+                                   (lines, scales)))
+
+    sfx = load_generator('generate_sound_effects')
+    for filename, generator_func in sfx.SOUND_EFFECTS.items():
+        units.append(AssetUnit(f'Audio/SFX/{filename}', 'generate_sound_effects',
+                               generator_func.__name__, 'wav', (),
+                               profiles.asset_profile(filename, audio_profile)))
+
+    # Banco con todos los efectos en un solo archivo (una lectura al arrancar)
+    units.append(AssetUnit((f'Audio/SFX/{sfx.SOUND_BANK_FILE}', f'Audio/SFX/{sfx.SOUND_BANK_INDEX_FILE}'),
+                           'generate_sound_effects', 'create_sound_bank', 'bytes_json', (audio_profile,)))
+
+    music = load_generator('generate_music')
+    for filename, theme_func in music.THEMES.items():
+        profile = profiles.asset_profile(filename, audio_profile)
+        if filename in music.LOOPED_THEMES:
+            units.append(AssetUnit(f'Audio/Music/{filename}', 'generate_music',
+                                   theme_func.__name__, 'voices_loop', (True,), profile))
+        else:
+            units.append(AssetUnit(f'Audio/Music/{filename}', 'generate_music',
+                                   theme_func.__name__, 'voices', (), profile))
+
+    units.append(AssetUnit('icon.ico', 'generate-icons', 'create_ico_bytes', 'bytes', ()))
+    units.append(AssetUnit('icon.png', 'generate-icons', 'create_png_bytes', 'bytes', (256,)))
+
+    return units
+
+# ============================================
+# RENDERIZADO
+# ============================================
+
+def encode_png(image):
+    """Codifica una imagen PIL como PNG en memoria"""
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+def encode_json(data):
+    """Codifica un diccionario igual que json.dump(..., indent=2)"""
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def render_unit(unit, dtype=None):
+    """
+    Ejecuta el generador de una unidad y devuelve sus archivos completos
+
+    Args:
+        dtype: precisión de síntesis del audio (por defecto la de precision.py)
+
+    Returns:
+        lista de bytes, una entrada por cada salida de la unidad
+    """
+    module = load_generator(unit.module)
+    if dtype is not None:
+        with load_generator('precision').synthesis_precision(dtype):
+            return render_unit(unit)
+
+    value = getattr(module, unit.function)(*unit.args)
+
+    if unit.encoder == 'png_scales':
+        return [encode_png(image) for image in value]
+    if unit.encoder == 'png':
+        return [encode_png(value)]
+    if unit.encoder == 'png_json_scales':
+        return [content for image, data in value for content in (encode_png(image), encode_json(data))]
+    if unit.encoder == 'bytes_json':
+        content, data = value
+        return [content, encode_json(data)]
+    if unit.encoder == 'json':
+        return [encode_json(value)]
+    if unit.encoder == 'wav':
+        return [module.encode_wav(value, unit.profile)]
+    if unit.encoder == 'voices':
+        return [module.encode_voices_wav(value, unit.profile)]
+    if unit.encoder == 'voices_loop':
+        return [module.encode_voices_wav(value, unit.profile, loop=True)]
+    return [value]
+
+def render_all(units, jobs=1, dtype=None):
+    """
+    Renderiza las unidades y devuelve sus archivos en el mismo orden de entrada
+
+    Con jobs > 1 cada unidad se envía a un ProcessPoolExecutor; los resultados
+    se recogen siempre en el orden original, así la escritura es determinista.
+    """
+    if jobs <= 1 or len(units) <= 1:
+        for unit in units:
+            yield render_unit(unit, dtype)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(units))) as executor:
+        order = sorted(range(len(units)),
+                       key=lambda i: RENDER_PRIORITY.get(units[i].module, 0),
+                       reverse=True)
+        futures = {i: executor.submit(render_unit, units[i], dtype) for i in order}
+        for i in range(len(units)):
+            yield futures[i].result()
+
+# ============================================
+# HUELLAS (FINGERPRINTS)
+# ============================================
+
+def _is_generator_module(module):
+    """True si el módulo es uno de los scripts de este directorio"""
+    path = getattr(module, '__file__', None)
+    if not path:
+        return False
+    return os.path.dirname(os.path.abspath(path)) == SCRIPT_DIR
+
+def _is_generator_code(obj):
+    """True si el objeto fue definido en uno de los scripts de este directorio"""
+    return _is_generator_module(sys.modules.get(getattr(obj, '__module__', None) or ''))
+
+def _referenced_names(code):
+    """Nombres globales usados por un code object (incluye funciones anidadas)"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _referenced_names(const)
+    return names
+
+def _describe(value, parts, seen):
+    """
+    Añade a `parts` una descripción estable de un valor de entrada
+
+    Las funciones de los generadores se describen por su código fuente y se
+    recorren recursivamente las globales que leen; las constantes por su repr.
+    """
+    if callable(value) and hasattr(value, '__wrapped__'):
+        # Funciones decoradas (p. ej. functools.lru_cache): describir la original
+        value = inspect.unwrap(value)
+
+    if isinstance(value, (types.FunctionType, type)) and _is_generator_code(value):
+        key = f'{value.__module__}.{value.__qualname__}'
+        if key in seen:
+            parts.append(f'<ref {key}>')
+            return
+        seen.add(key)
+        parts.append(f'<def {key}>')
+        parts.append(inspect.getsource(value))
+
+        if isinstance(value, type):
+            return
+
+        # Valores por defecto (p. ej. sample_rate=SAMPLE_RATE ya evaluado)
+        _describe(value.__defaults__, parts, seen)
+        _describe(value.__kwdefaults__, parts, seen)
+
+        names = _referenced_names(value.__code__)
+        for name in sorted(names):
+            if name in value.__globals__:
+                parts.append(f'{name}=')
+                _describe(value.__globals__[name], parts, seen)
+
+                # modulo.funcion: co_names también trae los atributos leídos, así que
+                # se describen los del módulo (si es un script de aquí) como globales
+                module = value.__globals__[name]
+                if isinstance(module, types.ModuleType) and _is_generator_module(module):
+                    for attr in sorted(names):
+                        if attr in vars(module):
+                            parts.append(f'{name}.{attr}=')
+                            _describe(vars(module)[attr], parts, seen)
+    elif isinstance(value, types.ModuleType):
+        root = sys.modules.get(value.__name__.split('.')[0])
+        parts.append(f'<module {value.__name__} {getattr(root, "__version__", "")}>')
+    elif isinstance(value, dict):
+        parts.append('{')
+        for key, item in value.items():
+            parts.append(repr(key))
+            _describe(item, parts, seen)
+        parts.append('}')
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        parts.append(f'<{type(value).__name__}>')
+        for item in items:
+            _describe(item, parts, seen)
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        parts.append(repr(value))
+    else:
+        # Funciones de librerías, ufuncs de numpy, etc.
+        name = getattr(value, '__qualname__', None) or type(value).__qualname__
+        parts.append(f'<{getattr(value, "__module__", "")}.{name}>')
+
+def unit_fingerprint(unit):
+    """
+    Calcula la huella SHA-256 de todas las entradas de una unidad
+    """
+    module = load_generator(unit.module)
+    roots = [getattr(module, unit.function)]
+    if unit.encoder == 'wav':
+        roots.append(module.encode_wav)
+    elif unit.encoder in ('voices', 'voices_loop'):
+        roots.append(module.encode_voices_wav)
+    elif unit.encoder in ('png', 'png_scales'):
+        roots.append(encode_png)
+    elif unit.encoder in ('json', 'bytes_json'):
+        roots.append(encode_json)
+    elif unit.encoder == 'png_json_scales':
+        roots.extend([encode_png, encode_json])
+
+    parts = [f'version={CACHE_VERSION}', f'output={unit.output}',
+             f'encoder={unit.encoder}', f'args={unit.args!r}', f'profile={unit.profile!r}']
+    seen = set()
+    for root in roots:
+        _describe(root, parts, seen)
+
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+# ============================================
+# CACHÉ
+# ============================================
+
+def file_sha256(path):
+    """SHA-256 del contenido de un archivo"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_cache(path=CACHE_PATH):
+    """Carga la caché de huellas (vacía si no existe o es inválida)"""
+    try:
+        with open(path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache.get('outputs', {})
+
+def save_cache(outputs, path=CACHE_PATH):
+    """Guarda la caché de forma atómica"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({'version': CACHE_VERSION, 'outputs': outputs}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def is_up_to_date(path, fingerprint, entry):
+    """
+    True si el archivo existe, fue generado con la misma huella y no fue modificado
+    """
+    if not entry or entry.get('fingerprint') != fingerprint:
+        return False
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    if stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime_ns']:
+        return True
+
+    # Cambió el mtime (checkout, touch...): comparar contenido
+    if stat.st_size == entry['size'] and file_sha256(path) == entry['sha256']:
+        entry['mtime_ns'] = stat.st_mtime_ns
+        return True
+    return False
+
+def write_output(path, data):
+    """
+    Escribe un archivo de forma atómica solo si su contenido cambió
+
+    Returns:
+        (entrada de caché sin huella, True si el archivo se reescribió)
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    changed = not os.path.exists(path) or file_sha256(path) != digest
+
+    if changed:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    stat = os.stat(path)
+    return {'sha256': digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}, changed
+
+# ============================================
+# BUILD
+# ============================================
+
+def output_path(output_dir, output):
+    """Ruta absoluta de una salida (relativa al directorio de Assets)"""
+    return os.path.abspath(os.path.join(output_dir, *output.split('/')))
+
+def build(units, output_dir=DEFAULT_OUTPUT_DIR, force=False, jobs=1):
+    """
+    Construye las unidades que no estén al día
+
+    Returns:
+        (lista de salidas regeneradas, lista de salidas omitidas)
+    """
+    cache = load_cache()
+    pending = []
+    skipped = []
+
+    for unit in units:
+        paths = [output_path(output_dir, output) for output in unit_outputs(unit)]
+        fingerprint = unit_fingerprint(unit)
+
+        if not force and all(is_up_to_date(path, fingerprint, cache.get(path)) for path in paths):
+            skipped.extend(unit_outputs(unit))
+            continue
+        pending.append((unit, paths, fingerprint))
+
+    built = []
+    rendered = render_all([unit for unit, _, _ in pending], jobs)
+    for (unit, paths, fingerprint), files in zip(pending, rendered):
+        for output, path, data in zip(unit_outputs(unit), paths, files):
+            entry, changed = write_output(path, data)
+            entry['fingerprint'] = fingerprint
+            cache[path] = entry
+            built.append(output)
+            print(f"{'✅ Generado' if changed else '🟰 Sin cambios'}: {output}")
+
+    save_cache(cache)
+    return built, skipped
+
+def verify(units, output_dir=DEFAULT_OUTPUT_DIR, jobs=1):
+    """
+    Re-renderiza las unidades en memoria y compara su SHA-256 con los archivos
+    existentes, sin escribir nada ni usar la caché
+
+    Returns:
+        (lista de salidas idénticas, lista de salidas distintas o ausentes)
+    """
+    matched = []
+    mismatched = []
+    for unit, files in zip(units, render_all(units, jobs)):
+        for output, data in zip(unit_outputs(unit), files):
+            path = output_path(output_dir, output)
+            if not os.path.exists(path):
+                mismatched.append(output)
+                print(f"❌ Falta: {output}")
+            elif file_sha256(path) != hashlib.sha256(data).hexdigest():
+                mismatched.append(output)
+                print(f"❌ Distinto: {output}")
+            else:
+                matched.append(output)
+
+    return matched, mismatched
+
+def decode_pcm(data):
+    """Muestras enteras de un WAV PCM en memoria (int16, o uint8 si es de 8 bits)"""
+    import numpy as np
+    with wave.open(io.BytesIO(data), 'rb') as wav_file:
+        dtype = '<i2' if wav_file.getsampwidth() == 2 else 'u1'
+        return np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype=dtype)
+
+def check_parity(units, jobs=1):
+    """
+    Renderiza el audio en float64 (referencia) y en la precisión por defecto y
+    compara las muestras PCM de cada archivo (en LSB de su profundidad de bits)
+
+    Returns:
+        lista de (salida, diferencia máxima en LSB o None si las longitudes difieren)
+    """
+    precision = load_generator('precision')
+    units = [unit for unit in units if unit.encoder in AUDIO_ENCODERS]
+    reference = list(render_all(units, jobs, precision.REFERENCE_DTYPE))
+    candidate = render_all(units, jobs, precision.DEFAULT_DTYPE)
+
+    results = []
+    for unit, expected, actual in zip(units, reference, candidate):
+        for output, expected_data, actual_data in zip(unit_outputs(unit), expected, actual):
+            difference = precision.max_lsb_difference(decode_pcm(expected_data),
+                                                      decode_pcm(actual_data))
+            results.append((output, difference))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Construye todos los assets del juego de forma incremental")
+    parser.add_argument('filters', nargs='*',
+                        help="Solo construir salidas cuya ruta contenga alguno de estos textos")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_DIR,
+                        help="Directorio de Assets de destino")
+    parser.add_argument('--force', action='store_true',
+                        help="Ignorar la caché y regenerar todo")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Procesos de renderizado en paralelo (1 = en serie)")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1],
+                        help="Escalas de los sprite sheets (p. ej. 1 2 4); se renderiza una sola vez a la mayor")
+    parser.add_argument('--verify', action='store_true',
+                        help="No escribir nada: re-renderizar en memoria y comparar con los archivos existentes")
+    parser.add_argument('--parity', action='store_true',
+                        help="No escribir nada: comparar el audio float32 con la referencia float64")
+    profiles = load_generator('audio_profiles')
+    parser.add_argument('--audio-profile', choices=sorted(profiles.AUDIO_PROFILES),
+                        default=profiles.DEFAULT_PROFILE,
+                        help="Perfil de salida del audio sin override (tasa y bits, ver audio_profiles.py)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+
+    units = collect_units(args.scales, args.audio_profile)
+    if args.filters:
+        units = [unit for unit in units
+                 if any(f in output for output in unit_outputs(unit) for f in args.filters)]
+
+    print("🛠️  Constructor de Assets de Arcade Maze Chomper")
+    print("=" * 50)
+    print(f"Destino: {args.output}")
+    print(f"Procesos: {args.jobs}")
+    print(f"Escalas de sprites: {', '.join(f'{scale}x' for scale in sorted(set(args.scales)))}")
+    print(f"Perfil de audio: {args.audio_profile}")
+    print()
+
+    if args.parity:
+        results = check_parity(units, args.jobs)
+        failed = [output for output, difference in results
+                  if difference is None or difference > PARITY_TOLERANCE_LSB]
+        for output, difference in results:
+            status = '❌' if output in failed else '✅'
+            detail = 'longitud distinta' if difference is None else f'{difference} LSB'
+            print(f"{status} {output}: {detail}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print()
+        if failed:
+            print(f"⚠️  {len(failed)} de {len(results)} superan {PARITY_TOLERANCE_LSB} LSB ({elapsed_ms:.0f} ms)")
+            sys.exit(1)
+        print(f"✨ {len(results)} archivos dentro de {PARITY_TOLERANCE_LSB} LSB de la referencia ({elapsed_ms:.0f} ms)")
+        return
+
+    if args.verify:
+        matched, mismatched = verify(units, args.output, args.jobs)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print()
+        if mismatched:
+            print(f"⚠️  {len(mismatched)} distintos, {len(matched)} idénticos ({elapsed_ms:.0f} ms)")
+            sys.exit(1)
+        print(f"✨ {len(matched)} idénticos a un render limpio ({elapsed_ms:.0f} ms)")
+        return
+
+    built, skipped = build(units, args.output, args.force, args.jobs)
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print()
+    print(f"✨ {len(built)} renderizados, {len(skipped)} al día ({elapsed_ms:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Motor de Envelopes ADSR compartido
+Usado por generate_sound_effects.py y generate_music.py
+
+Un envelope depende solo de (longitud, attack, decay, sustain, release, sample_rate),
+y las mismas combinaciones se repiten cientos de veces por pista (las notas de
+generate_music.py usan siempre 0.01/0.05/0.7/0.05). Cada envelope se construye
+una sola vez, se guarda en una caché LRU como arreglo de solo lectura y se
+aplica in-place sobre la onda.
+El envelope se diseña en float64 y se guarda en el dtype de la onda.
+"""
+
+import functools
+import numpy as np
+
+# Configuración
+DEFAULT_SAMPLE_RATE = 44100
+ENVELOPE_CACHE_SIZE = 256  # Envelopes distintos que se mantienen en memoria
+
+@functools.lru_cache(maxsize=ENVELOPE_CACHE_SIZE)
+def _build_envelope(num_samples, attack, decay, sustain_level, release, sample_rate,
+                    dtype_name='float64'):
+    """
+    Construye un envelope ADSR de solo lectura (usar get_envelope)
+    """
+    envelope = np.ones(num_samples)
+
+    attack_samples = int(attack * sample_rate)
+    decay_samples = int(decay * sample_rate)
+    release_samples = int(release * sample_rate)
+
+    # Attack
+    if attack_samples > 0 and attack_samples < num_samples:
+        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+
+    # Decay (recortado si no cabe en la onda)
+    if decay_samples > 0:
+        decay_start = attack_samples
+        decay_end = min(attack_samples + decay_samples, num_samples)
+        if decay_end > decay_start:
+            envelope[decay_start:decay_end] = np.linspace(1, sustain_level, decay_end - decay_start)
+
+    # Sustain
+    sustain_start = attack_samples + decay_samples
+    sustain_end = num_samples - release_samples
+    if sustain_end > sustain_start:
+        envelope[sustain_start:sustain_end] = sustain_level
+
+    # Release
+    if release_samples > 0 and num_samples > release_samples:
+        envelope[-release_samples:] = np.linspace(sustain_level, 0, release_samples)
+
+    envelope = envelope.astype(dtype_name, copy=False)
+    envelope.flags.writeable = False
+    return envelope
+
+def get_envelope(num_samples, attack=0.01, decay=0.05, sustain_level=0.7, release=0.1,
+                 sample_rate=DEFAULT_SAMPLE_RATE, dtype=np.float64):
+    """
+    Devuelve el envelope ADSR (compartido, de solo lectura) para una longitud dada
+
+    Args:
+        num_samples: longitud de la onda en muestras
+        attack, decay, release: duraciones en segundos
+        sustain_level: nivel de sustain (0-1)
+        sample_rate: tasa de muestreo
+        dtype: dtype del envelope (el de la onda a la que se aplica)
+
+    Returns:
+        numpy array de solo lectura; no modificar
+    """
+    # Normalizar la clave para que llamadas equivalentes compartan entrada
+    return _build_envelope(int(num_samples), float(attack), float(decay),
+                           float(sustain_level), float(release), int(sample_rate),
+                           np.dtype(dtype).name)
+
+def apply_envelope_in_place(wave, attack=0.01, decay=0.05, sustain_level=0.7, release=0.1,
+                            sample_rate=DEFAULT_SAMPLE_RATE):
+    """
+    Multiplica la onda por el envelope cacheado sin crear arreglos nuevos
+
+    La onda puede ser 2-D (variantes × muestras): el envelope se aplica a cada fila.
+
+    Returns:
+        la misma onda (modificada in-place)
+    """
+    wave *= get_envelope(wave.shape[-1], attack, decay, sustain_level, release, sample_rate, wave.dtype)
+    return wave
+
+def envelope_cache_info():
+    """Estadísticas de la caché (hits, misses, maxsize, currsize)"""
+    return _build_envelope.cache_info()
+
+def clear_envelope_cache():
+    """Vacía la caché y reinicia los contadores"""
+    _build_envelope.cache_clear()
+
+def format_envelope_stats():
+    """Resumen legible de la caché de envelopes"""
+    info = envelope_cache_info()
+    total = info.hits + info.misses
+    rate = (info.hits / total * 100) if total else 0.0
+    return (f"{info.hits} aciertos / {info.misses} envelopes construidos "
+            f"({rate:.0f}% reutilizados, {info.currsize} en caché)")
@@ -1,6 +1,10 @@
+import io
 import os
 from PIL import Image, ImageDraw
 
+# Layer sizes embedded in the multi-resolution Windows ICO
+ICO_SIZES = [16, 32, 48, 256]
+
 def draw_pacman(size):
     """
     Draws a Arcade Maze Chomper icon at the specified size.
@@ -35,6 +39,41 @@ def draw_pacman(size):
 
     return img
 
+def create_ico_bytes(sizes=ICO_SIZES):
+    """
+    Renders the multi-resolution Windows ICO in memory.
+
+    Args:
+        sizes (list): Layer sizes to embed in the ICO
+
+    Returns:
+        bytes: Contents of the ICO file
+    """
+    ico_images = [draw_pacman(size) for size in sizes]
+
+    buffer = io.BytesIO()
+    ico_images[0].save(
+        buffer,
+        format='ICO',
+        sizes=[(img.size[0], img.size[1]) for img in ico_images],
+        append_images=ico_images[1:]
+    )
+    return buffer.getvalue()
+
+def create_png_bytes(size):
+    """
+    Renders a single PNG icon in memory.
+
+    Args:
+        size (int): Size of the icon (width and height)
+
+    Returns:
+        bytes: Contents of the PNG file
+    """
+    buffer = io.BytesIO()
+    draw_pacman(size).save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
 def generate_all_icons():
     """
     Generates all required icons for the application.
@@ -57,30 +96,21 @@ def generate_all_icons():
     print("-" * 50)
 
     # Generate Windows ICO (multi-resolution)
-    ico_sizes = [16, 32, 48, 256]
-    ico_images = []
+    ico_path = os.path.join(assets_dir, "icon.ico")
+    with open(ico_path, 'wb') as f:
+        f.write(create_ico_bytes(ICO_SIZES))
 
-    for size in ico_sizes:
-        icon = draw_pacman(size)
-        ico_images.append(icon)
+    for size in ICO_SIZES:
         print(f"  Generated {size}x{size} icon layer")
-
-    ico_path = os.path.join(assets_dir, "icon.ico")
-    ico_images[0].save(
-        ico_path,
-        format='ICO',
-        sizes=[(img.size[0], img.size[1]) for img in ico_images],
-        append_images=ico_images[1:]
-    )
     print(f"Saved: {ico_path}\n")
 
     print("Step 2: Generating Fallback PNG...")
     print("-" * 50)
 
     # Generate fallback PNG (256x256)
-    png_icon = draw_pacman(256)
     png_path = os.path.join(assets_dir, "icon.png")
-    png_icon.save(png_path, format='PNG', optimize=True)
+    with open(png_path, 'wb') as f:
+        f.write(create_png_bytes(256))
     print(f"Saved: {png_path}\n")
 
     print("Step 3: Generating Flatpak Icons...")
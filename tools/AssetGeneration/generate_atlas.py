@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Generador de Atlas de Texturas - Arcade Maze Chomper
+Empaqueta los sprites de los cuatro sprite sheets (pacman, fantasmas, items y
+tiles) en un único atlas de tamaño potencia de 2 con un único mapa JSON.
+
+El juego carga así una sola textura en lugar de cuatro. Cada sheet se obtiene
+con render_at_scales(), igual que los PNG exportados, así que las celdas y sus
+máscaras coinciden píxel a píxel con los sheets de la misma escala y cada sheet
+se dibuja una sola vez para todas las escalas. Las celdas se recortan con las
+coordenadas de cada build_sprite_map(), y las celdas con píxeles idénticos se
+guardan una sola vez (p. ej. las dos celdas vacías del sheet de tiles).
+
+Formato del mapa: la misma estructura de claves que los mapas individuales,
+agrupada por sheet y con x/y apuntando al atlas:
+    {"sprite_size": 32, "width": W, "height": H,
+     "sheets": {"pacman": {"sprite_size": 32, "sprites": {...}}, ...}}
+Cada sprite lleva también bbox, mask y centroid (sprite_sheet.collision_data),
+relativos a su celda.
+"""
+
+import json
+
+import numpy as np
+
+import generate_ghosts_sprites
+import generate_items_sprites
+import generate_pacman_sprites
+import generate_tiles_sprites
+from sprite_sheet import (TRANSPARENT, collision_data, render_at_scales, sheet_to_image,
+                          sprite_entries, sprite_pixels)
+
+# Configuración
+SPRITE_SIZE = 32
+MAX_ATLAS_SIZE = 8192  # Lado máximo soportado por las GPUs más modestas
+
+# Sheets que entran en el atlas: (nombre, función del sheet, función del mapa)
+ATLAS_SHEETS = [
+    ('pacman', generate_pacman_sprites.create_pacman_spritesheet,
+     generate_pacman_sprites.build_sprite_map),
+    ('ghosts', generate_ghosts_sprites.create_ghosts_spritesheet,
+     generate_ghosts_sprites.build_sprite_map),
+    ('items', generate_items_sprites.create_items_spritesheet,
+     generate_items_sprites.build_sprite_map),
+    ('tiles', generate_tiles_sprites.create_tiles_spritesheet,
+     generate_tiles_sprites.build_sprite_map),
+]
+
+def shelf_pack(sizes, width, height):
+    """
+    Coloca rectángulos en estantes (filas) dentro de un área width × height
+
+    Args:
+        sizes: lista de (ancho, alto), ya ordenada de mayor a menor alto
+
+    Returns:
+        lista de posiciones (x, y) en el mismo orden, o None si no caben
+    """
+    positions = []
+    x = y = shelf_height = 0
+    for w, h in sizes:
+        if x + w > width:
+            # Nuevo estante debajo del actual
+            y += shelf_height
+            x = shelf_height = 0
+        if w > width or y + h > height:
+            return None
+        positions.append((x, y))
+        x += w
+        shelf_height = max(shelf_height, h)
+    return positions
+
+def atlas_candidates(sizes):
+    """
+    Tamaños potencia de 2 posibles, del menor área al mayor (y los más
+    cuadrados primero dentro de la misma área)
+    """
+    area = sum(w * h for w, h in sizes)
+    min_width = max(w for w, _ in sizes)
+    min_height = max(h for _, h in sizes)
+    sides = [1 << k for k in range(MAX_ATLAS_SIZE.bit_length())]
+    candidates = [(w, h) for w in sides for h in sides
+                  if w >= min_width and h >= min_height and w * h >= area]
+    return sorted(candidates, key=lambda wh: (wh[0] * wh[1], abs(wh[0] - wh[1]), -wh[0]))
+
+def pack_sprites(sizes):
+    """
+    Busca el atlas potencia de 2 más pequeño donde caben todos los rectángulos
+
+    Returns:
+        ((ancho, alto), lista de posiciones (x, y) en el orden de `sizes`)
+    """
+    # Ordenar por alto (y ancho) descendente mejora el llenado de los estantes;
+    # el orden es estable para que el atlas sea determinista
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    ordered = [sizes[i] for i in order]
+
+    for width, height in atlas_candidates(sizes):
+        packed = shelf_pack(ordered, width, height)
+        if packed is not None:
+            positions = [None] * len(sizes)
+            for i, position in zip(order, packed):
+                positions[i] = position
+            return (width, height), positions
+
+    raise ValueError(f"Los sprites no caben en un atlas de {MAX_ATLAS_SIZE}x{MAX_ATLAS_SIZE}")
+
+def create_atlases(scales=(1,)):
+    """
+    Crea el atlas y su mapa para cada escala, con un único render por sheet
+
+    Args:
+        scales: escalas enteras de los sprites (1 = 32 px), como en render_at_scales
+
+    Returns:
+        lista de (imagen PIL del atlas, diccionario del mapa), en el orden de `scales`
+    """
+    sheets = [(name, render_at_scales(sheet_function, scales), map_function)
+              for name, sheet_function, map_function in ATLAS_SHEETS]
+    return [create_atlas([(name, images[i], map_function(scale)) for name, images, map_function in sheets],
+                         scale)
+            for i, scale in enumerate(scales)]
+
+def create_atlas(sheets, scale=1):
+    """
+    Crea el atlas y su mapa a partir de los cuatro sprite sheets de una escala
+
+    Args:
+        sheets: lista de (nombre, imagen del sheet, sprite map de la misma escala)
+        scale: escala entera de los sprites (1 = 32 px)
+
+    Returns:
+        (imagen PIL del atlas, diccionario del mapa)
+    """
+    cells = []        # Píxeles de cada celda única
+    cell_index = {}   # bytes de la celda -> índice en `cells`
+    placements = []   # (entrada del mapa, índice de celda)
+    sheet_maps = {}
+
+    for name, sheet, sprite_map in sheets:
+        pixels = sprite_pixels(sheet)
+        sprite_map = json.loads(json.dumps(sprite_map))  # Copia profunda
+        default_size = sprite_map['sprite_size']
+
+        for entry in sprite_entries(sprite_map['sprites']):
+            x, y = entry['x'], entry['y']
+            w = entry.get('width', default_size)
+            h = entry.get('height', default_size)
+            cell = pixels[y:y + h, x:x + w]
+            entry.update(collision_data(cell))
+
+            key = (w, h, cell.tobytes())
+            if key not in cell_index:
+                cell_index[key] = len(cells)
+                cells.append(cell)
+            placements.append((entry, cell_index[key]))
+
+        sheet_maps[name] = sprite_map
+
+    sizes = [(cell.shape[1], cell.shape[0]) for cell in cells]
+    (width, height), positions = pack_sprites(sizes)
+
+    atlas = np.empty((height, width, 4), dtype=np.uint8)
+    atlas.view(np.uint32).fill(np.frombuffer(bytes(TRANSPARENT), dtype=np.uint32)[0])
+    for cell, (x, y) in zip(cells, positions):
+        atlas[y:y + cell.shape[0], x:x + cell.shape[1]] = cell
+
+    for entry, index in placements:
+        entry['x'], entry['y'] = positions[index]
+
+    # Los mapas de cada sheet ya vienen escalados; aquí solo se añade el tamaño real
+    atlas_map = {
+        "sprite_size": SPRITE_SIZE * scale,
+        "width": width,
+        "height": height,
+        "sheets": sheet_maps,
+    }
+    if scale != 1:
+        atlas_map["scale"] = scale
+    return sheet_to_image(atlas), atlas_map
+
+def main():
+    print("🗺️  Generador de Atlas de Texturas")
+    print("=" * 50)
+
+    print("Empaquetando los sprite sheets...")
+    atlas, atlas_map = create_atlases()[0]
+
+    output_path = 'atlas.png'
+    atlas.save(output_path)
+    print(f"✅ Atlas guardado: {output_path}")
+
+    map_path = 'atlas_map.json'
+    with open(map_path, 'w') as f:
+        json.dump(atlas_map, f, indent=2)
+    print(f"✅ Mapa guardado: {map_path}")
+
+    sprites = sum(len(sprite_entries(m['sprites'])) for m in atlas_map['sheets'].values())
+    unique = len({(e['x'], e['y']) for m in atlas_map['sheets'].values()
+                  for e in sprite_entries(m['sprites'])})
+    used = unique * atlas_map['sprite_size'] ** 2
+    print("\n📊 Información del Atlas:")
+    print(f"   - Tamaño total: {atlas.width}x{atlas.height} píxeles")
+    print(f"   - Sprites: {sprites} ({unique} celdas únicas, {sprites - unique} duplicadas)")
+    print(f"   - Ocupación: {used / (atlas.width * atlas.height) * 100:.0f}%")
+    print(f"   - Texturas a cargar: 1 (antes {len(ATLAS_SHEETS)})")
+
+    print("\n✨ ¡Generación completada!")
+
+if __name__ == "__main__":
+    main()
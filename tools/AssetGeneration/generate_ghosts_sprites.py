@@ -4,9 +4,13 @@ Generador de Sprite Sheet de Fantasmas - Estilo 8-bit Clásico
 Genera sprites de Blinky, Pinky, Inky y Clyde con todos sus estados
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
+import functools
 import math
 
+from sprite_sheet import (new_sheet, new_sprite_canvas, place_sprite, render_with_sprite_maps,
+                          scale_sprite_map)
+
 # Configuración
 SPRITE_SIZE = 32  # Tamaño de cada sprite individual
 
@@ -72,7 +76,7 @@ def create_ghost_eyes(draw, center, direction='right', is_eyes_only=False):
     Dibuja los ojos del fantasma
     
     Args:
-        draw: ImageDraw object
+        draw: ScaledDraw del sprite (ver sprite_sheet.ScaledDraw)
         center: Centro del sprite
         direction: 'right', 'left', 'up', 'down'
         is_eyes_only: True si solo dibujamos ojos (fantasma comido)
@@ -128,66 +132,50 @@ def create_ghost_eyes(draw, center, direction='right', is_eyes_only=False):
     draw.ellipse(left_pupil_bbox, fill=COLORS['eyes_pupil'], outline=COLORS['eyes_pupil'])
     draw.ellipse(right_pupil_bbox, fill=COLORS['eyes_pupil'], outline=COLORS['eyes_pupil'])
 
-def create_ghost_sprite(ghost_name, direction='right', frame=0):
+# ============================================
+# CAPAS CACHEADAS
+# ============================================
+# La silueta solo depende del frame, los ojos solo de la dirección y la cara
+# vulnerable solo de su color. Cada primitiva se dibuja una sola vez como
+# máscara o capa RGBA; los sprites se obtienen tiñendo y componiendo capas.
+# Las imágenes cacheadas son compartidas: no modificarlas.
+
+@functools.lru_cache(maxsize=None)
+def ghost_shape_mask(frame=0, scale=1):
     """
-    Crea un sprite de fantasma normal
-    
-    Args:
-        ghost_name: 'blinky', 'pinky', 'inky', 'clyde'
-        direction: 'right', 'left', 'up', 'down'
-        frame: 0 o 1 (para animación de ondas inferiores)
-    
-    Returns:
-        Image object
+    Máscara (modo 'L') de la silueta del fantasma: cuerpo + ondas inferiores
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    mask, draw = new_sprite_canvas(size, 0, scale, mode='L')
     
     center = size // 2
     radius = size // 2 - 4
     
-    color = COLORS[ghost_name]
+    create_ghost_body(draw, center, radius, 255)
+    create_ghost_wave_bottom(draw, center, radius, 255, frame)
     
-    # Dibujar cuerpo del fantasma
-    create_ghost_body(draw, center, radius, color)
-    
-    # Dibujar parte inferior ondulada
-    create_ghost_wave_bottom(draw, center, radius, color, frame)
-    
-    # Dibujar ojos
-    create_ghost_eyes(draw, center, direction)
-    
-    return img
+    return mask
 
-def create_vulnerable_ghost_sprite(frame=0, warning=False):
+@functools.lru_cache(maxsize=None)
+def ghost_eyes_layer(direction='right', is_eyes_only=False, scale=1):
     """
-    Crea sprite de fantasma vulnerable (azul)
-    
-    Args:
-        frame: 0 o 1 (animación)
-        warning: True para modo advertencia (parpadeando blanco/azul)
-    
-    Returns:
-        Image object
+    Capa RGBA con los ojos del fantasma sobre fondo transparente
+    """
+    layer, draw = new_sprite_canvas(SPRITE_SIZE, BACKGROUND, scale)
+    create_ghost_eyes(draw, SPRITE_SIZE // 2, direction, is_eyes_only)
+    return layer
+
+@functools.lru_cache(maxsize=None)
+def vulnerable_face_layer(mouth_color=WHITE, scale=1):
+    """
+    Capa RGBA con la boca ondulada y los ojos pequeños del fantasma vulnerable
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    layer, draw = new_sprite_canvas(size, BACKGROUND, scale)
     
     center = size // 2
     radius = size // 2 - 4
     
-    # Color alterna entre azul y blanco si está en warning
-    if warning and frame == 1:
-        color = COLORS['warning']
-    else:
-        color = COLORS['vulnerable']
-    
-    # Dibujar cuerpo
-    create_ghost_body(draw, center, radius, color)
-    create_ghost_wave_bottom(draw, center, radius, color, frame)
-    
     # Dibujar boca ondulada (característica del modo vulnerable)
     mouth_y = center + 4
     mouth_width = radius
@@ -198,8 +186,7 @@ def create_vulnerable_ghost_sprite(frame=0, warning=False):
         point_x = center + x
         point_y = mouth_y + y_offset
         draw.ellipse([point_x - 1, point_y - 1, point_x + 1, point_y + 1], 
-                     fill=WHITE if not warning or frame == 0 else color, 
-                     outline=WHITE if not warning or frame == 0 else color)
+                     fill=mouth_color, outline=mouth_color)
     
     # Dibujar ojos pequeños (solo puntos blancos)
     eye_spacing = 8
@@ -216,30 +203,79 @@ def create_vulnerable_ghost_sprite(frame=0, warning=False):
                   right_eye_x + eye_size, eye_y + eye_size], 
                  fill=WHITE, outline=WHITE)
     
+    return layer
+
+def tint_mask(mask, color):
+    """
+    Crea una imagen RGBA del color dado en los píxeles cubiertos por la máscara
+    """
+    img = Image.new('RGBA', mask.size, BACKGROUND)
+    img.paste(color, mask=mask)
     return img
 
-def create_ghost_eyes_sprite(direction='right'):
+def compose_ghost(color, frame, overlay, scale=1):
     """
-    Crea sprite de solo los ojos (fantasma comido regresando a la base)
+    Silueta teñida del frame + capa superior (ojos o cara)
+    """
+    img = tint_mask(ghost_shape_mask(frame, scale), color)
+    img.alpha_composite(overlay)
+    return img
+
+def create_ghost_sprite(ghost_name, direction='right', frame=0, color=None, scale=1):
+    """
+    Crea un sprite de fantasma normal
     
     Args:
+        ghost_name: 'blinky', 'pinky', 'inky', 'clyde'
         direction: 'right', 'left', 'up', 'down'
+        frame: 0 o 1 (para animación de ondas inferiores)
+        color: color RGB opcional (paletas nuevas sin entrada en COLORS)
+        scale: factor de renderizado (la imagen mide SPRITE_SIZE * scale)
     
     Returns:
         Image object
     """
-    size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    if color is None:
+        color = COLORS[ghost_name]
     
-    center = size // 2
+    return compose_ghost(color, frame, ghost_eyes_layer(direction, scale=scale), scale)
+
+def create_vulnerable_ghost_sprite(frame=0, warning=False, scale=1):
+    """
+    Crea sprite de fantasma vulnerable (azul)
     
-    # Solo dibujar ojos grandes
-    create_ghost_eyes(draw, center, direction, is_eyes_only=True)
+    Args:
+        frame: 0 o 1 (animación)
+        warning: True para modo advertencia (parpadeando blanco/azul)
+        scale: factor de renderizado (la imagen mide SPRITE_SIZE * scale)
     
-    return img
+    Returns:
+        Image object
+    """
+    # Color alterna entre azul y blanco si está en warning
+    if warning and frame == 1:
+        color = COLORS['warning']
+    else:
+        color = COLORS['vulnerable']
+    
+    mouth_color = WHITE if not warning or frame == 0 else color
+    return compose_ghost(color, frame, vulnerable_face_layer(mouth_color, scale), scale)
+
+def create_ghost_eyes_sprite(direction='right', scale=1):
+    """
+    Crea sprite de solo los ojos (fantasma comido regresando a la base)
+    
+    Args:
+        direction: 'right', 'left', 'up', 'down'
+        scale: factor de renderizado (la imagen mide SPRITE_SIZE * scale)
+    
+    Returns:
+        Image object
+    """
+    # Solo ojos grandes (copia: la capa cacheada es compartida)
+    return ghost_eyes_layer(direction, is_eyes_only=True, scale=scale).copy()
 
-def create_ghosts_spritesheet():
+def create_ghosts_spritesheet(scale=1):
     """
     Crea el sprite sheet completo de todos los fantasmas
     
@@ -254,11 +290,9 @@ def create_ghosts_spritesheet():
     # Dimensiones del sprite sheet
     cols = 8
     rows = 9
+    cell_size = SPRITE_SIZE * scale
     
-    sheet_width = SPRITE_SIZE * cols
-    sheet_height = SPRITE_SIZE * rows
-    
-    sprite_sheet = Image.new('RGBA', (sheet_width, sheet_height), BACKGROUND)
+    sprite_sheet = new_sheet(cols, rows, cell_size, BACKGROUND)
     
     ghost_names = ['blinky', 'pinky', 'inky', 'clyde']
     directions = ['right', 'left', 'up', 'down']
@@ -268,39 +302,31 @@ def create_ghosts_spritesheet():
     for ghost_name in ghost_names:
         for frame in range(2):
             for col, direction in enumerate(directions):
-                sprite = create_ghost_sprite(ghost_name, direction, frame)
-                x = col * SPRITE_SIZE
-                y = current_row * SPRITE_SIZE
-                sprite_sheet.paste(sprite, (x, y))
+                sprite = create_ghost_sprite(ghost_name, direction, frame, scale=scale)
+                place_sprite(sprite_sheet, sprite, col, current_row, cell_size)
             current_row += 1
     
     # Fila 9: Estados especiales
     # Vulnerable normal (2 frames)
     for frame in range(2):
-        sprite = create_vulnerable_ghost_sprite(frame, warning=False)
-        x = frame * SPRITE_SIZE
-        y = 8 * SPRITE_SIZE
-        sprite_sheet.paste(sprite, (x, y))
+        sprite = create_vulnerable_ghost_sprite(frame, warning=False, scale=scale)
+        place_sprite(sprite_sheet, sprite, frame, 8, cell_size)
     
     # Vulnerable warning (2 frames)
     for frame in range(2):
-        sprite = create_vulnerable_ghost_sprite(frame, warning=True)
-        x = (2 + frame) * SPRITE_SIZE
-        y = 8 * SPRITE_SIZE
-        sprite_sheet.paste(sprite, (x, y))
+        sprite = create_vulnerable_ghost_sprite(frame, warning=True, scale=scale)
+        place_sprite(sprite_sheet, sprite, 2 + frame, 8, cell_size)
     
     # Eyes only (4 direcciones)
     for col, direction in enumerate(directions):
-        sprite = create_ghost_eyes_sprite(direction)
-        x = (4 + col) * SPRITE_SIZE
-        y = 8 * SPRITE_SIZE
-        sprite_sheet.paste(sprite, (x, y))
+        sprite = create_ghost_eyes_sprite(direction, scale=scale)
+        place_sprite(sprite_sheet, sprite, 4 + col, 8, cell_size)
     
     return sprite_sheet
 
-def create_sprite_map_json():
+def build_sprite_map(scale=1):
     """
-    Crea un archivo JSON con las coordenadas de cada sprite
+    Construye el diccionario con las coordenadas de cada sprite
     """
     sprite_map = {
         "sprite_size": SPRITE_SIZE,
@@ -395,12 +421,31 @@ def create_sprite_map_json():
             }
         }
     }
-    
+
+    return scale_sprite_map(sprite_map, scale)
+
+def create_ghosts_sprite_assets(scales=(1,)):
+    """
+    Crea el sprite sheet y su sprite map a varias escalas (p. ej. 1x/2x/4x)
+    con un único render
+
+    Cada mapa lleva la caja ajustada, la máscara de colisión y el centroide de
+    cada sprite, calculados de la misma imagen que se guarda como PNG
+
+    Returns:
+        lista de (imagen PIL, sprite map), en el mismo orden que `scales`
+    """
+    return render_with_sprite_maps(create_ghosts_spritesheet, build_sprite_map, scales)
+
+def create_sprite_map_json(sprite_map, output_path='ghosts_sprite_map.json'):
+    """
+    Crea un archivo JSON con las coordenadas y los datos de colisión de cada sprite
+    """
     import json
-    with open('ghosts_sprite_map.json', 'w') as f:
+    with open(output_path, 'w') as f:
         json.dump(sprite_map, f, indent=2)
     
-    print("✅ Archivo JSON de mapeo creado: ghosts_sprite_map.json")
+    print(f"✅ Archivo JSON de mapeo creado: {output_path}")
 
 def main():
     print("👻 Generador de Sprites de Fantasmas")
@@ -408,7 +453,7 @@ def main():
     
     # Generar sprite sheet de fantasmas
     print("Generando sprite sheet de fantasmas...")
-    ghosts_sheet = create_ghosts_spritesheet()
+    ghosts_sheet, sprite_map = create_ghosts_sprite_assets()[0]
     
     # Guardar sprite sheet
     output_path = 'ghosts_spritesheet.png'
@@ -416,7 +461,7 @@ def main():
     print(f"✅ Sprite sheet guardado: {output_path}")
     
     # Crear mapa de sprites (JSON)
-    create_sprite_map_json()
+    create_sprite_map_json(sprite_map)
     
     # Información del sprite sheet
     print("\n📊 Información del Sprite Sheet:")
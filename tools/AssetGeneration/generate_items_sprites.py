@@ -4,9 +4,11 @@ Generador de Sprite Sheet de Items - Estilo 8-bit Clásico
 Genera sprites de puntos, power pellets y frutas para Arcade Maze Chomper
 """
 
-from PIL import Image, ImageDraw
 import math
 
+from sprite_sheet import (new_sheet, new_sprite_canvas, place_sprite, render_with_sprite_maps,
+                          scale_sprite_map)
+
 # Configuración
 SPRITE_SIZE = 32  # Tamaño de cada sprite individual
 
@@ -33,13 +35,12 @@ BACKGROUND = (0, 0, 0, 0)  # Transparente
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 
-def create_small_dot():
+def create_small_dot(scale=1):
     """
     Crea un punto pequeño (dot)
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, BACKGROUND, scale)
     
     center = size // 2
     dot_radius = 3
@@ -51,16 +52,16 @@ def create_small_dot():
     
     return img
 
-def create_power_pellet(frame=0):
+def create_power_pellet(frame=0, scale=1):
     """
     Crea un power pellet (punto grande) con animación de parpadeo
     
     Args:
         frame: 0 o 1 (para animación de parpadeo)
+        scale: factor de renderizado (la imagen mide SPRITE_SIZE * scale)
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, BACKGROUND, scale)
     
     center = size // 2
     
@@ -77,13 +78,12 @@ def create_power_pellet(frame=0):
     
     return img
 
-def create_cherry():
+def create_cherry(scale=1):
     """
     Crea sprite de cereza
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, BACKGROUND, scale)
     
     center = size // 2
     cherry_radius = 6
@@ -137,13 +137,12 @@ def create_cherry():
     
     return img
 
-def create_strawberry():
+def create_strawberry(scale=1):
     """
     Crea sprite de fresa
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, BACKGROUND, scale)
     
     center = size // 2
     
@@ -205,13 +204,12 @@ def create_strawberry():
     
     return img
 
-def create_orange():
+def create_orange(scale=1):
     """
     Crea sprite de naranja
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, BACKGROUND, scale)
     
     center = size // 2
     orange_radius = 8
@@ -251,13 +249,12 @@ def create_orange():
     
     return img
 
-def create_apple():
+def create_apple(scale=1):
     """
     Crea sprite de manzana
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, BACKGROUND, scale)
     
     center = size // 2
     apple_radius = 8
@@ -301,13 +298,12 @@ def create_apple():
     
     return img
 
-def create_melon():
+def create_melon(scale=1):
     """
     Crea sprite de melón
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, BACKGROUND, scale)
     
     center = size // 2
     melon_width = 14
@@ -342,7 +338,7 @@ def create_melon():
     
     return img
 
-def create_items_spritesheet():
+def create_items_spritesheet(scale=1):
     """
     Crea el sprite sheet completo de items
     
@@ -353,35 +349,31 @@ def create_items_spritesheet():
     # Dimensiones del sprite sheet
     cols = 8
     rows = 1
+    cell_size = SPRITE_SIZE * scale
     
-    sheet_width = SPRITE_SIZE * cols
-    sheet_height = SPRITE_SIZE * rows
-    
-    sprite_sheet = Image.new('RGBA', (sheet_width, sheet_height), BACKGROUND)
+    sprite_sheet = new_sheet(cols, rows, cell_size, BACKGROUND)
     
     # Lista de sprites en orden
     sprites = [
-        create_small_dot(),           # 0: Dot
-        create_power_pellet(0),       # 1: Power pellet frame 0
-        create_power_pellet(1),       # 2: Power pellet frame 1
-        create_cherry(),              # 3: Cherry
-        create_strawberry(),          # 4: Strawberry
-        create_orange(),              # 5: Orange
-        create_apple(),               # 6: Apple
-        create_melon()                # 7: Melon
+        create_small_dot(scale=scale),           # 0: Dot
+        create_power_pellet(0, scale=scale),       # 1: Power pellet frame 0
+        create_power_pellet(1, scale=scale),       # 2: Power pellet frame 1
+        create_cherry(scale=scale),              # 3: Cherry
+        create_strawberry(scale=scale),          # 4: Strawberry
+        create_orange(scale=scale),              # 5: Orange
+        create_apple(scale=scale),               # 6: Apple
+        create_melon(scale=scale)                # 7: Melon
     ]
     
     # Pegar sprites en el sheet
     for col, sprite in enumerate(sprites):
-        x = col * SPRITE_SIZE
-        y = 0
-        sprite_sheet.paste(sprite, (x, y))
+        place_sprite(sprite_sheet, sprite, col, 0, cell_size)
     
     return sprite_sheet
 
-def create_sprite_map_json():
+def build_sprite_map(scale=1):
     """
-    Crea un archivo JSON con las coordenadas de cada sprite
+    Construye el diccionario con las coordenadas de cada sprite
     """
     sprite_map = {
         "sprite_size": SPRITE_SIZE,
@@ -432,12 +424,31 @@ def create_sprite_map_json():
             }
         }
     }
-    
+
+    return scale_sprite_map(sprite_map, scale)
+
+def create_items_sprite_assets(scales=(1,)):
+    """
+    Crea el sprite sheet y su sprite map a varias escalas (p. ej. 1x/2x/4x)
+    con un único render
+
+    Cada mapa lleva la caja ajustada, la máscara de colisión y el centroide de
+    cada sprite, calculados de la misma imagen que se guarda como PNG
+
+    Returns:
+        lista de (imagen PIL, sprite map), en el mismo orden que `scales`
+    """
+    return render_with_sprite_maps(create_items_spritesheet, build_sprite_map, scales)
+
+def create_sprite_map_json(sprite_map, output_path='items_sprite_map.json'):
+    """
+    Crea un archivo JSON con las coordenadas y los datos de colisión de cada sprite
+    """
     import json
-    with open('items_sprite_map.json', 'w') as f:
+    with open(output_path, 'w') as f:
         json.dump(sprite_map, f, indent=2)
     
-    print("✅ Archivo JSON de mapeo creado: items_sprite_map.json")
+    print(f"✅ Archivo JSON de mapeo creado: {output_path}")
 
 def main():
     print("🍬 Generador de Sprites de Items")
@@ -445,7 +456,7 @@ def main():
     
     # Generar sprite sheet de items
     print("Generando sprite sheet de items...")
-    items_sheet = create_items_spritesheet()
+    items_sheet, sprite_map = create_items_sprite_assets()[0]
     
     # Guardar sprite sheet
     output_path = 'items_spritesheet.png'
@@ -453,7 +464,7 @@ def main():
     print(f"✅ Sprite sheet guardado: {output_path}")
     
     # Crear mapa de sprites (JSON)
-    create_sprite_map_json()
+    create_sprite_map_json(sprite_map)
     
     # Información del sprite sheet
     print("\n📊 Información del Sprite Sheet:")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Fondos Pre-renderizados del Laberinto - Arcade Maze Chomper
+Las paredes y la puerta de los fantasmas no cambian durante un nivel, así que
+su geometría se hornea en build en una sola imagen por nivel y escala
+(levelN_background.png, levelN_background@2x.png...). El juego dibuja esa
+imagen una vez por frame en lugar de cientos de tiles recortados del sheet.
+
+Los tiles salen de create_tiles_spritesheet() (un solo render a la escala más
+alta, ver sprite_sheet.render_at_scales) y la variante de cada pared de la
+rejilla de generate_tile_maps.py, así que el fondo es exactamente lo que el
+juego compondría celda a celda. El fondo se arma con un único gather de NumPy:
+los tiles se apilan en un arreglo (tiles, lado, lado, 4) y se indexan con la
+rejilla del nivel.
+"""
+
+import os
+
+import numpy as np
+
+from generate_tile_maps import MAPS_DIR, autotile, level_files, level_grid, tile_keys
+from generate_tiles_sprites import build_sprite_map, create_tiles_spritesheet
+from sprite_sheet import TRANSPARENT, render_at_scales, sheet_to_image
+
+# Configuración
+GHOST_DOOR_CHAR = '-'
+GHOST_DOOR_TILE = 'special_ghost_door'
+BACKGROUND_SUFFIX = '_background.png'
+
+def tile_cells(sheet, scale, keys):
+    """
+    Píxeles de cada tile del sheet en el orden de `keys`
+
+    Returns:
+        arreglo (tiles + 1, lado, lado, 4); la última entrada es un tile
+        transparente para las celdas sin tile (índice -1)
+    """
+    sprite_map = build_sprite_map(scale)
+    size = sprite_map['sprite_size']
+    pixels = np.asarray(sheet)
+
+    cells = np.empty((len(keys) + 1, size, size, 4), dtype=np.uint8)
+    for index, key in enumerate(keys):
+        group, name = key.split('_', 1)
+        entry = sprite_map['sprites'][group][name]
+        cells[index] = pixels[entry['y']:entry['y'] + size, entry['x']:entry['x'] + size]
+    cells[-1] = TRANSPARENT
+    return cells
+
+def static_tile_grid(lines, keys):
+    """
+    Índice de tile de cada celda estática de un nivel: paredes y puerta de los fantasmas
+
+    Returns:
+        arreglo (alto, ancho) con el índice en `keys`, o -1 en las celdas sin tile
+    """
+    grid = autotile(lines, keys)
+    doors = level_grid(lines) == GHOST_DOOR_CHAR
+    grid[doors] = keys.index(GHOST_DOOR_TILE)
+    return grid
+
+def compose_background(cells, grid):
+    """
+    Arma el fondo con un único gather: (alto, ancho) tiles -> (alto × lado, ancho × lado) píxeles
+    """
+    rows, cols = grid.shape
+    size = cells.shape[1]
+    tiles = cells[grid]  # (alto, ancho, lado, lado, 4); -1 -> tile transparente
+    return tiles.transpose(0, 2, 1, 3, 4).reshape(rows * size, cols * size, 4)
+
+def create_maze_backgrounds(lines, scales=(1,)):
+    """
+    Crea el fondo de un nivel a varias escalas con un único render del sheet de tiles
+
+    Args:
+        lines: líneas del archivo del nivel (ver generate_tile_maps.read_level)
+        scales: escalas enteras (cada una debe dividir a la mayor)
+
+    Returns:
+        lista de imágenes PIL, en el mismo orden que `scales`
+    """
+    keys = tile_keys()
+    grid = static_tile_grid(lines, keys)
+    sheets = render_at_scales(create_tiles_spritesheet, scales)
+    return [sheet_to_image(compose_background(tile_cells(sheet, scale, keys), grid))
+            for sheet, scale in zip(sheets, scales)]
+
+def create_maze_background(lines, scale=1):
+    """
+    Crea el fondo de un nivel a una escala (imagen PIL RGBA)
+    """
+    return create_maze_backgrounds(lines, (scale,))[0]
+
+def background_filename(level_filename):
+    """'level1.txt' -> 'level1_background.png'"""
+    return os.path.splitext(level_filename)[0] + BACKGROUND_SUFFIX
+
+def main():
+    print("🖼️  Generador de Fondos del Laberinto")
+    print("=" * 50)
+
+    levels = level_files()
+    if not levels:
+        print(f"⚠️  No hay niveles en {MAPS_DIR}")
+        return
+
+    for level_filename, lines in levels:
+        background = create_maze_background(lines)
+        output_path = background_filename(level_filename)
+        background.save(output_path)
+
+        grid = static_tile_grid(lines, tile_keys())
+        print(f"✅ Guardado: {output_path} ({background.width}x{background.height}, "
+              f"{int(np.count_nonzero(grid >= 0))} tiles en una imagen)")
+
+    print("\n✨ ¡Generación completada!")
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,24 @@ Generador de Música de Fondo - Estilo Arcade/Chiptune
 Genera 3 pistas musicales completas para el juego Arcade Maze Chomper
 """
 
+import io
 import numpy as np
-import wave as wave_module
 import struct
-import math
+
+from audio_profiles import AUDIO_PROFILES, DEFAULT_PROFILE, SOURCE_PROFILE, asset_profile
+from envelopes import apply_envelope_in_place, format_envelope_stats
+from precision import synthesis_dtype
+from percussion import drum_pattern_voice
+from resampler import resample_blocks, resampled_length
+from wav_output import pcm_block, peak_level, write_pcm_memmap, write_wav_blocks
+from wavetables import tone_phases, wavetable_oscillator
 
 # Configuración de audio
-SAMPLE_RATE = 44100  # 44.1 kHz
+SAMPLE_RATE = 44100  # 44.1 kHz (tasa de síntesis; la del archivo la fija el perfil)
 BPM = 140  # Beats por minuto (tempo arcade energético)
 BEAT_DURATION = 60.0 / BPM  # Duración de un beat en segundos
+BLOCK_SIZE = 16384  # Muestras por bloque en el renderizado en streaming
+BEATS_PER_BAR = 4  # Compás de 4/4 (los patrones de percusión son de un compás)
 
 # Notas musicales en Hz (escala cromática)
 NOTES = {
@@ -25,151 +34,287 @@ NOTES = {
     'C6': 1046.50, 'REST': 0
 }
 
-def generate_square_wave(frequency, duration, sample_rate=SAMPLE_RATE, duty_cycle=0.5):
-    """Genera una onda cuadrada (sonido 8-bit clásico)"""
-    if frequency == 0:  # Silencio
-        return np.zeros(int(sample_rate * duration))
-    
-    num_samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, num_samples, False)
-    wave = np.sign(np.sin(2 * np.pi * frequency * t))
-    
-    # Aplicar duty cycle
-    wave[wave > 0] = 1
-    wave[wave <= 0] = -duty_cycle
-    
-    return wave
+# Duty cycle de la parte negativa para cada forma de onda de pulso
+DUTY_CYCLES = {
+    'square': 0.5,
+    'pulse': 0.25,
+}
 
-def generate_triangle_wave(frequency, duration, sample_rate=SAMPLE_RATE):
-    """Genera una onda triangular (sonido más suave)"""
-    if frequency == 0:
-        return np.zeros(int(sample_rate * duration))
-    
-    num_samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, num_samples, False)
-    wave = 2 * np.abs(2 * (t * frequency - np.floor(t * frequency + 0.5))) - 1
-    return wave
+def apply_adsr(wave, attack=0.01, decay=0.05, sustain_level=0.7, release=0.05):
+    """Aplica envelope ADSR a la onda (in-place, envelope cacheado en envelopes.py)"""
+    return apply_envelope_in_place(wave, attack, decay, sustain_level, release, SAMPLE_RATE)
 
-def generate_pulse_wave(frequency, duration, sample_rate=SAMPLE_RATE):
-    """Genera una onda de pulso (25% duty cycle para bajo)"""
-    return generate_square_wave(frequency, duration, sample_rate, duty_cycle=0.25)
+def schedule_pattern(pattern, repeats=1, sample_rate=SAMPLE_RATE):
+    """
+    Convierte un patrón [(nota, duración), ...] en eventos con offsets absolutos
 
-def apply_adsr(wave, attack=0.01, decay=0.05, sustain_level=0.7, release=0.05):
-    """Aplica envelope ADSR a la onda"""
-    num_samples = len(wave)
-    envelope = np.ones(num_samples)
-    
-    attack_samples = int(attack * SAMPLE_RATE)
-    decay_samples = int(decay * SAMPLE_RATE)
-    release_samples = int(release * SAMPLE_RATE)
-    
-    # Attack
-    if attack_samples > 0 and attack_samples < num_samples:
-        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
-    
-    # Decay
-    if decay_samples > 0:
-        decay_start = attack_samples
-        decay_end = min(attack_samples + decay_samples, num_samples)
-        if decay_end > decay_start:
-            envelope[decay_start:decay_end] = np.linspace(1, sustain_level, decay_end - decay_start)
-    
-    # Sustain
-    sustain_start = attack_samples + decay_samples
-    sustain_end = num_samples - release_samples
-    if sustain_end > sustain_start:
-        envelope[sustain_start:sustain_end] = sustain_level
-    
-    # Release
-    if release_samples > 0 and num_samples > release_samples:
-        envelope[-release_samples:] = np.linspace(sustain_level, 0, release_samples)
-    
-    return wave * envelope
-
-def create_note(note_name, duration, wave_type='square', volume=0.5):
-    """Crea una nota musical con el tipo de onda especificado"""
-    frequency = NOTES.get(note_name, 0)
-    
-    if wave_type == 'square':
-        wave = generate_square_wave(frequency, duration)
-    elif wave_type == 'triangle':
-        wave = generate_triangle_wave(frequency, duration)
-    elif wave_type == 'pulse':
-        wave = generate_pulse_wave(frequency, duration)
+    Los instantes de cada nota se acumulan en segundos y se redondean a muestra
+    una sola vez; la longitud de una nota es la diferencia entre dos instantes
+    redondeados. Así el error de truncar cada nota nunca se acumula y todas las
+    voces que comparten la rejilla de tiempo (BEAT_DURATION) quedan alineadas
+    muestra a muestra, por larga que sea la canción.
+
+    Returns:
+        (starts, lengths, frequencies, end): arreglos de las notas que suenan
+        (los silencios se omiten) y la muestra final del patrón repetido
+    """
+    durations = np.array([duration for _, duration in pattern], dtype=np.float64)
+    frequencies = np.array([NOTES.get(note, 0) for note, _ in pattern], dtype=np.float64)
+    phrase_times = np.concatenate(([0.0], np.cumsum(durations)))
+
+    # Instantes de todas las notas de todas las repeticiones, más el final
+    times = (np.arange(repeats)[:, None] * phrase_times[-1] + phrase_times[:-1]).ravel()
+    times = np.append(times, repeats * phrase_times[-1])
+    onsets = np.rint(times * sample_rate).astype(np.int64)
+
+    starts = onsets[:-1]
+    lengths = np.diff(onsets)
+    frequencies = np.tile(frequencies, repeats)
+    sounding = (frequencies > 0) & (lengths > 0)
+    return starts[sounding], lengths[sounding], frequencies[sounding], int(onsets[-1])
+
+def sequenced_voice(pattern, wave_type='square', volume=0.5, repeats=1, length=None):
+    """
+    Crea una voz a partir de un patrón programado en muestras absolutas
+
+    Cada nota distinta (frecuencia, longitud) se sintetiza una sola vez en un
+    banco (wavetable + envelope cacheado) y cada evento suma su nota del banco
+    directamente en la porción del buffer de salida que le corresponde: no hay
+    arreglos por nota, ni np.tile, ni concatenaciones.
+
+    Una voz es un par (add_to, length): add_to(out, start) suma al bloque
+    `out` las muestras de la voz desde la posición absoluta `start`.
+
+    Args:
+        pattern: lista de (nota, duración en segundos)
+        wave_type: 'square', 'pulse' o 'triangle'
+        volume: volumen de la voz
+        repeats: repeticiones del patrón
+        length: longitud total de la voz (por defecto el final del patrón);
+                si es mayor, el resto es silencio; si es menor, se recorta
+    """
+    starts, lengths, frequencies, end = schedule_pattern(pattern, repeats)
+    if length is None:
+        length = end
+
+    if wave_type == 'triangle':
+        waveform, low_level = 'triangle', 1.0
     else:
-        wave = generate_square_wave(frequency, duration)
-    
-    # Aplicar ADSR
-    if frequency > 0:
-        wave = apply_adsr(wave, attack=0.01, decay=0.05, sustain_level=0.7, release=0.05)
-    
-    return wave * volume
+        waveform, low_level = 'square', DUTY_CYCLES.get(wave_type, 0.5)
 
-def create_arpeggio(notes, duration, wave_type='square', volume=0.5):
-    """Crea un arpegio rápido con múltiples notas"""
-    note_duration = duration / len(notes)
-    waves = []
-    
-    for note in notes:
-        note_wave = create_note(note, note_duration, wave_type, volume)
-        waves.append(note_wave)
-    
-    return np.concatenate(waves)
+    # Banco con cada nota distinta sintetizada una vez (la fase empieza en 0)
+    keys = list(zip(frequencies.tolist(), lengths.tolist()))
+    unique_keys = list(dict.fromkeys(keys))
+    offsets = {}
+    bank = np.empty(sum(n for _, n in unique_keys), dtype=synthesis_dtype())
+    position = 0
+    for frequency, n in unique_keys:
+        note = bank[position:position + n]
+        phases = tone_phases(frequency, n, 1 / SAMPLE_RATE)
+        note[:] = wavetable_oscillator(waveform, frequency, phases, low_level, SAMPLE_RATE)
+        # Envelope ADSR: la caché compartida construye uno por cada longitud distinta
+        apply_adsr(note, attack=0.01, decay=0.05, sustain_level=0.7, release=0.05)
+        offsets[(frequency, n)] = position
+        position += n
+    bank *= volume
+    sources = np.array([offsets[key] for key in keys], dtype=np.int64)
+    ends = starts + lengths
 
-def mix_tracks(*tracks):
-    """Mezcla múltiples pistas de audio"""
-    # Encontrar la longitud máxima
-    max_length = max(len(track) for track in tracks)
-    
-    # Extender todas las pistas a la misma longitud
-    extended_tracks = []
-    for track in tracks:
-        if len(track) < max_length:
-            padding = np.zeros(max_length - len(track))
-            track = np.concatenate([track, padding])
-        extended_tracks.append(track)
-    
-    # Mezclar sumando todas las pistas
-    mixed = np.sum(extended_tracks, axis=0)
-    
-    # Normalizar para evitar clipping
-    max_val = np.max(np.abs(mixed))
-    if max_val > 0:
-        mixed = mixed / max_val * 0.8  # 80% del máximo para headroom
-    
-    return mixed
+    def add_to(out, start):
+        stop = min(start + len(out), length)
+        first = np.searchsorted(ends, start, side='right')
+        last = np.searchsorted(starts, stop, side='left')
+        for index in range(first, last):
+            note_start = int(starts[index])
+            lo = max(note_start, start)
+            hi = min(int(ends[index]), stop)
+            source = int(sources[index]) + lo - note_start
+            out[lo - start:hi - start] += bank[source:source + hi - lo]
 
-def normalize_wave(wave):
-    """Normaliza la onda"""
-    max_val = np.max(np.abs(wave))
-    if max_val > 0:
-        wave = wave / max_val
-    return wave * 0.9
+    return add_to, length
 
-def save_wav(filename, wave, sample_rate=SAMPLE_RATE):
-    """Guarda la onda como archivo WAV"""
-    wave = normalize_wave(wave)
-    wave_int = np.int16(wave * 32767)
-    
-    with wave_module.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(wave_int.tobytes())
-    
-    print(f"✅ Guardado: {filename}")
+def theme_voice(pattern, wave_type, volume, repeats, loop_duration=None):
+    """
+    Voz de un tema: `repeats` pasadas del patrón, o un bucle de `loop_duration` segundos
+
+    En modo bucle el patrón se repite o se recorta hasta durar exactamente el
+    bucle (ver fit_pattern): todas las voces llegan sin hueco a la costura.
+    """
+    if loop_duration is None:
+        return sequenced_voice(pattern, wave_type, volume, repeats=repeats)
+    return sequenced_voice(fit_pattern(pattern, loop_duration), wave_type, volume)
+
+def loop_duration(melody_pattern):
+    """
+    Duración (segundos) de una iteración de bucle: una frase de la melodía
+    ajustada al compás completo más cercano, para que la percusión (un patrón
+    por compás) no se reinicie a mitad de compás en la costura
+    """
+    bar_duration = BEATS_PER_BAR * BEAT_DURATION
+    phrase = sum(duration for _, duration in melody_pattern)
+    return max(1, round(phrase / bar_duration)) * bar_duration
+
+def fit_pattern(pattern, duration):
+    """
+    Repite un patrón y lo recorta para que dure exactamente `duration` segundos
+
+    Las notas que empiezan después del final se descartan y la que lo cruza se
+    acorta: se sintetiza con su propio envelope, así termina en el cero del
+    release y el punto de bucle no produce clics.
+    """
+    fitted = []
+    elapsed = 0.0
+    while True:
+        for note, note_duration in pattern:
+            remaining = duration - elapsed
+            if remaining <= 1e-9:
+                return fitted
+            fitted.append((note, min(note_duration, remaining)))
+            elapsed += note_duration
+
+def voices_length(voices):
+    """Longitud total (en muestras) de una mezcla de voces"""
+    return max(length for _, length in voices)
+
+def stream_voices(voices, block_size=BLOCK_SIZE):
+    """
+    Genera la suma de todas las voces en bloques de tamaño fijo
+
+    Reutiliza el mismo buffer en cada bloque: el consumidor no debe guardarlo.
+    """
+    total = voices_length(voices)
+    buffer = np.empty(block_size, dtype=synthesis_dtype())
+    for start in range(0, total, block_size):
+        block = buffer[:min(block_size, total - start)]
+        block.fill(0.0)
+        for add_to, _ in voices:
+            add_to(block, start)
+        yield block
+
+def voice_reader(voices):
+    """
+    Función read(out, start) que escribe en `out` la mezcla de las voces desde
+    la posición `start` (entrada de resampler.resample_blocks)
+    """
+    def read(out, start):
+        out.fill(0.0)
+        for add_to, _ in voices:
+            add_to(out, start)
+    return read
+
+def profile_voice_blocks(voices, profile, loop=False, block_size=BLOCK_SIZE):
+    """
+    Genera la mezcla de las voces en bloques a la tasa del perfil
+
+    A la tasa de síntesis son los bloques de stream_voices(); si no, la mezcla
+    se remuestrea en streaming, como señal periódica si es un bucle para que
+    siga sin costura a la nueva tasa.
+    """
+    if profile.sample_rate == SAMPLE_RATE:
+        return stream_voices(voices, block_size)
+    return resample_blocks(voice_reader(voices), voices_length(voices), SAMPLE_RATE,
+                           profile.sample_rate, periodic=loop)
+
+def profile_length(voices, profile, loop=False):
+    """Longitud (en muestras) de la mezcla a la tasa del perfil"""
+    return resampled_length(voices_length(voices), SAMPLE_RATE, profile.sample_rate, periodic=loop)
+
+def write_voices_wav(file, voices, profile=SOURCE_PROFILE, loop=False, block_size=BLOCK_SIZE):
+    """
+    Renderiza y escribe una mezcla de voces en dos pasadas con memoria acotada
+
+    Primera pasada: pico de la mezcla. Segunda pasada: mezcla normalizada al
+    80% del pico (headroom) y escrita bloque a bloque, sin tener nunca la pista
+    completa en memoria.
+    Con un perfil de otra tasa, ambas pasadas remuestrean en streaming.
+    """
+    peak = peak_level(profile_voice_blocks(voices, profile, loop, block_size))
+    write_wav_blocks(file, normalized_blocks(profile_voice_blocks(voices, profile, loop, block_size), peak),
+                     0.8 if peak > 0 else 0.0, profile.sample_rate, profile.bits)
+
+def normalized_blocks(blocks, peak):
+    """Bloques de la mezcla normalizados in-place al 80% del pico (headroom contra clipping)"""
+    for block in blocks:
+        if peak > 0:
+            block /= peak
+            block *= 0.8
+        yield block
+
+def append_loop_chunk(file, loop_start, loop_end, sample_rate=SAMPLE_RATE):
+    """
+    Añade a un WAV ya escrito un chunk RIFF 'smpl' con un bucle hacia delante
+
+    Los reproductores y samplers que lo leen repiten [loop_start, loop_end]
+    (ambos inclusive, en muestras) sin hueco. El tamaño del chunk RIFF se
+    corrige para incluir el nuevo chunk.
+
+    Args:
+        file: ruta o archivo binario con el WAV completo
+    """
+    chunk = struct.pack('<4sI9I', b'smpl', 60,
+                        0, 0,                            # Fabricante, producto
+                        round(1e9 / sample_rate),        # Periodo de muestra (ns)
+                        60, 0,                           # Nota MIDI unísono (C4), afinación
+                        0, 0,                            # Formato y offset SMPTE
+                        1, 0)                            # Un bucle, sin datos extra
+    chunk += struct.pack('<6I', 0, 0, loop_start, loop_end, 0, 0)  # Id, hacia delante, inicio, fin, fracción, infinito
+
+    if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+        with open(file, 'r+b') as f:
+            append_loop_chunk(f, loop_start, loop_end, sample_rate)
+        return
+
+    end = file.seek(0, io.SEEK_END)
+    file.write(chunk)
+    file.seek(4)
+    file.write(struct.pack('<I', end + len(chunk) - 8))
+    file.seek(0, io.SEEK_END)
+
+def encode_voices_wav(voices, profile=SOURCE_PROFILE, loop=False):
+    """
+    Codifica una mezcla de voces como WAV en memoria (bytes) renderizando en streaming
+
+    Con loop=True el archivo completo es una iteración del bucle y se marca
+    con un chunk 'smpl' de la primera a la última muestra.
+    """
+    buffer = io.BytesIO()
+    write_voices_wav(buffer, voices, profile, loop)
+    if loop:
+        append_loop_chunk(buffer, 0, profile_length(voices, profile, loop) - 1, profile.sample_rate)
+    return buffer.getvalue()
+
+def save_voices_wav(filename, voices, profile=SOURCE_PROFILE, loop=False, block_size=BLOCK_SIZE):
+    """
+    Renderiza una mezcla de voces directamente en el archivo WAV mapeado
+
+    Igual que write_voices_wav (dos pasadas, mismo resultado bit a bit), pero
+    cada bloque se escala in-place y se copia a su porción del np.memmap: la
+    memoria usada es la de un bloque, sea cual sea la duración del tema.
+    """
+    peak = peak_level(profile_voice_blocks(voices, profile, loop, block_size))
+    output_peak = 0.8 if peak > 0 else 0.0
+    blocks = (pcm_block(block, output_peak, profile.bits, out=block)
+              for block in normalized_blocks(profile_voice_blocks(voices, profile, loop, block_size), peak))
+    length = profile_length(voices, profile, loop)
+    write_pcm_memmap(filename, blocks, length, profile.sample_rate, profile.bits)
+    if loop:
+        append_loop_chunk(filename, 0, length - 1, profile.sample_rate)
+
+    print(f"✅ Guardado: {filename} ({profile.sample_rate} Hz, {profile.bits} bits)")
 
 # ============================================
 # COMPOSICIONES MUSICALES
 # ============================================
 
-def create_main_theme():
+def main_theme_voices(loop=False):
     """
     Tema principal del juego - Energético y pegajoso
     Inspirado en el estilo arcade clásico con melodía memorable
+
+    Args:
+        loop: renderizar una sola iteración del bucle (ver loop_duration)
+              en lugar de las repeticiones completas
     """
-    print("🎵 Componiendo tema principal...")
-    
     # Duración de cada nota (en beats)
     eighth = BEAT_DURATION / 2      # Corchea
     quarter = BEAT_DURATION          # Negra
@@ -192,13 +337,8 @@ def create_main_theme():
         ('C5', eighth), ('D5', eighth), ('B4', quarter),
     ]
     
-    melody_waves = []
-    for note, duration in melody_pattern:
-        melody_waves.append(create_note(note, duration, 'square', volume=0.6))
-    melody = np.concatenate(melody_waves)
-    
     # Repetir melodía para hacer el tema más largo
-    melody = np.tile(melody, 4)  # 4 repeticiones
+    repeats = 4  # 4 repeticiones
     
     # BAJO (Canal 2 - Bass)
     bass_pattern = [
@@ -208,12 +348,6 @@ def create_main_theme():
         ('G3', quarter), ('G3', quarter), ('C3', quarter), ('C3', quarter),
     ]
     
-    bass_waves = []
-    for note, duration in bass_pattern:
-        bass_waves.append(create_note(note, duration, 'pulse', volume=0.4))
-    bass = np.concatenate(bass_waves)
-    bass = np.tile(bass, 4)
-    
     # ARMONÍA (Canal 3 - Harmony)
     harmony_pattern = [
         ('G4', half), ('E4', half),
@@ -222,39 +356,33 @@ def create_main_theme():
         ('E4', half), ('C4', half),
     ]
     
-    harmony_waves = []
-    for note, duration in harmony_pattern:
-        harmony_waves.append(create_note(note, duration, 'triangle', volume=0.3))
-    harmony = np.concatenate(harmony_waves)
-    harmony = np.tile(harmony, 4)
-    
-    # PERCUSIÓN (simulada con ruido)
-    # Crear patrón de kick y hi-hat
-    beat_duration = quarter
-    num_beats = int(len(melody) / (SAMPLE_RATE * beat_duration))
-    percussion = np.zeros(len(melody))
-    
-    for i in range(num_beats):
-        # Kick en cada beat
-        kick_pos = int(i * SAMPLE_RATE * beat_duration)
-        kick_length = int(SAMPLE_RATE * 0.05)
-        if kick_pos + kick_length < len(percussion):
-            kick = np.random.uniform(-0.3, 0.3, kick_length)
-            kick = kick * np.linspace(1, 0, kick_length)
-            percussion[kick_pos:kick_pos + kick_length] += kick
-    
-    # Mezclar todos los canales
-    theme = mix_tracks(melody, bass, harmony, percussion)
-    
-    return theme
-
-def create_menu_theme():
+    loop_seconds = loop_duration(melody_pattern) if loop else None
+    
+    melody = theme_voice(melody_pattern, 'square', 0.6, repeats, loop_seconds)
+    bass = theme_voice(bass_pattern, 'pulse', 0.4, repeats, loop_seconds)
+    harmony = theme_voice(harmony_pattern, 'triangle', 0.3, repeats, loop_seconds)
+    length = voices_length([melody, bass, harmony])
+    
+    # PERCUSIÓN (Canal 4 - ruido LFSR, ver percussion.py)
+    # Kick en cada beat, snare en el 2 y el 4, hi-hat en los contratiempos
+    drums = drum_pattern_voice({
+        'kick':  'X...X...X...X...',
+        'snare': '....X.......X...',
+        'hat':   '..x...x...x...x.',
+    }, BEAT_DURATION / 4, length, volume=0.3)
+    
+    # Todos los canales
+    return [melody, bass, harmony, drums]
+
+def menu_theme_voices(loop=False):
     """
     Tema del menú - Más tranquilo pero aún retro
     Melodía simple y relajante para no distraer
+
+    Args:
+        loop: renderizar una sola iteración del bucle (ver loop_duration)
+              en lugar de las repeticiones completas
     """
-    print("🎵 Componiendo tema del menú...")
-    
     eighth = BEAT_DURATION / 2
     quarter = BEAT_DURATION
     half = BEAT_DURATION * 2
@@ -274,11 +402,7 @@ def create_menu_theme():
         ('E5', quarter), ('G5', quarter), ('C5', half),
     ]
     
-    melody_waves = []
-    for note, duration in melody_pattern:
-        melody_waves.append(create_note(note, duration, 'triangle', volume=0.5))
-    melody = np.concatenate(melody_waves)
-    melody = np.tile(melody, 3)  # 3 repeticiones
+    repeats = 3  # 3 repeticiones
     
     # BAJO (Canal 2)
     bass_pattern = [
@@ -288,44 +412,39 @@ def create_menu_theme():
         ('G3', half), ('C3', half),
     ]
     
-    bass_waves = []
-    for note, duration in bass_pattern:
-        bass_waves.append(create_note(note, duration, 'pulse', volume=0.35))
-    bass = np.concatenate(bass_waves)
-    bass = np.tile(bass, 3)
+    loop_seconds = loop_duration(melody_pattern) if loop else None
+    
+    melody = theme_voice(melody_pattern, 'triangle', 0.5, repeats, loop_seconds)
+    bass = theme_voice(bass_pattern, 'pulse', 0.35, repeats, loop_seconds)
+    length = melody[1]
     
     # ARPEGIO DE FONDO (Canal 3)
     arp_notes = ['C4', 'E4', 'G4', 'C5']
     arp_duration = quarter
     
-    arp_waves = []
-    for _ in range(int(len(melody) / (SAMPLE_RATE * arp_duration))):
-        arp = create_arpeggio(arp_notes, arp_duration, 'square', volume=0.2)
-        arp_waves.append(arp)
-    
-    if arp_waves:
-        arpeggios = np.concatenate(arp_waves)
-        # Ajustar longitud
-        if len(arpeggios) > len(melody):
-            arpeggios = arpeggios[:len(melody)]
-        elif len(arpeggios) < len(melody):
-            padding = np.zeros(len(melody) - len(arpeggios))
-            arpeggios = np.concatenate([arpeggios, padding])
-    else:
-        arpeggios = np.zeros(len(melody))
+    num_arps = int(length / (SAMPLE_RATE * arp_duration))
+    arp_pattern = [(note, arp_duration / len(arp_notes)) for note in arp_notes]
+    
+    # Arpegio repetido sobre toda la canción, ajustado a la longitud de la melodía
+    arpeggio = sequenced_voice(arp_pattern, 'square', volume=0.2, repeats=num_arps, length=length)
     
-    # Mezclar
-    theme = mix_tracks(melody, bass, arpeggios)
+    # PERCUSIÓN (Canal 4 - suave: kick en el 1 y el 3, hi-hat en el 2 y el 4)
+    drums = drum_pattern_voice({
+        'kick': 'x.......x.......',
+        'hat':  '....x.......x...',
+    }, BEAT_DURATION / 4, length, volume=0.15)
     
-    return theme
+    return [melody, bass, arpeggio, drums]
 
-def create_game_over_theme():
+def game_over_theme_voices(loop=False):
     """
     Tema de Game Over - Melancólico y descendente
     Melodía triste que indica el fin del juego
+
+    Args:
+        loop: renderizar una sola iteración del bucle (ver loop_duration)
+              en lugar de las repeticiones completas
     """
-    print("🎵 Componiendo tema de Game Over...")
-    
     quarter = BEAT_DURATION
     half = BEAT_DURATION * 2
     whole = BEAT_DURATION * 4
@@ -345,11 +464,7 @@ def create_game_over_theme():
         ('REST', quarter),
     ]
     
-    melody_waves = []
-    for note, duration in melody_pattern:
-        melody_waves.append(create_note(note, duration, 'triangle', volume=0.6))
-    melody = np.concatenate(melody_waves)
-    melody = np.tile(melody, 2)  # 2 repeticiones
+    repeats = 2  # 2 repeticiones
     
     # BAJO (Canal 2 - notas largas y profundas)
     bass_pattern = [
@@ -359,28 +474,39 @@ def create_game_over_theme():
         ('G2', whole), ('C2', whole),
     ]
     
-    bass_waves = []
-    for note, duration in bass_pattern:
-        bass_waves.append(create_note(note, duration, 'pulse', volume=0.4))
-    bass = np.concatenate(bass_waves)
-    bass = np.tile(bass, 2)
-    
     # PAD (Canal 3 - acordes sostenidos)
     pad_pattern = [
         ('E4', whole), ('F4', whole),
         ('D4', whole), ('C4', whole),
     ]
     
-    pad_waves = []
-    for note, duration in pad_pattern:
-        pad_waves.append(create_note(note, duration, 'triangle', volume=0.25))
-    pad = np.concatenate(pad_waves)
-    pad = np.tile(pad, 2)
+    loop_seconds = loop_duration(melody_pattern) if loop else None
+    
+    voices = [
+        theme_voice(melody_pattern, 'triangle', 0.6, repeats, loop_seconds),
+        theme_voice(bass_pattern, 'pulse', 0.4, repeats, loop_seconds),
+        theme_voice(pad_pattern, 'triangle', 0.25, repeats, loop_seconds),
+    ]
     
-    # Mezclar
-    theme = mix_tracks(melody, bass, pad)
+    # PERCUSIÓN (Canal 4 - marcha lenta: kick al inicio de cada compás, snare en el 3)
+    drums = drum_pattern_voice({
+        'kick':  'X...............',
+        'snare': '........x.......',
+    }, BEAT_DURATION / 4, voices_length(voices), volume=0.2)
     
-    return theme
+    return voices + [drums]
+
+# Temas musicales (archivo de salida -> función que devuelve sus voces)
+THEMES = {
+    "background-theme.wav": main_theme_voices,
+    "menu-theme.wav": menu_theme_voices,
+    "game-over-theme.wav": game_over_theme_voices
+}
+
+# Temas que el juego reproduce con loop: true. Se renderiza una sola iteración
+# del bucle marcada con un chunk 'smpl'; el de Game Over suena una vez y
+# conserva sus repeticiones completas
+LOOPED_THEMES = {"background-theme.wav", "menu-theme.wav"}
 
 # ============================================
 # FUNCIÓN PRINCIPAL
@@ -398,29 +524,33 @@ def main():
     print()
     
     # 1. Tema Principal
-    main_theme = create_main_theme()
-    save_wav("background-theme.wav", main_theme)
-    duration_main = len(main_theme) / SAMPLE_RATE
+    print("🎵 Componiendo tema principal...")
+    main_theme = main_theme_voices(loop=True)
+    save_voices_wav("background-theme.wav", main_theme, asset_profile("background-theme.wav"), loop=True)
+    duration_main = voices_length(main_theme) / SAMPLE_RATE
     print(f"   Duración: {duration_main:.1f} segundos")
     print()
     
     # 2. Tema del Menú
-    menu_theme = create_menu_theme()
-    save_wav("menu-theme.wav", menu_theme)
-    duration_menu = len(menu_theme) / SAMPLE_RATE
+    print("🎵 Componiendo tema del menú...")
+    menu_theme = menu_theme_voices(loop=True)
+    save_voices_wav("menu-theme.wav", menu_theme, asset_profile("menu-theme.wav"), loop=True)
+    duration_menu = voices_length(menu_theme) / SAMPLE_RATE
     print(f"   Duración: {duration_menu:.1f} segundos")
     print()
     
     # 3. Tema de Game Over
-    gameover_theme = create_game_over_theme()
-    save_wav("game-over-theme.wav", gameover_theme)
-    duration_gameover = len(gameover_theme) / SAMPLE_RATE
+    print("🎵 Componiendo tema de Game Over...")
+    gameover_theme = game_over_theme_voices()
+    save_voices_wav("game-over-theme.wav", gameover_theme, asset_profile("game-over-theme.wav"))
+    duration_gameover = voices_length(gameover_theme) / SAMPLE_RATE
     print(f"   Duración: {duration_gameover:.1f} segundos")
     print()
     
     # Resumen
     print("=" * 50)
     print("✨ ¡Composición completada!")
+    print(f"📈 Caché de envelopes: {format_envelope_stats()}")
     print()
     print("📁 Música generada:")
     print("   1. background-theme.wav - Tema principal energético")
@@ -430,21 +560,23 @@ def main():
     print()
     print("   2. menu-theme.wav - Tema del menú tranquilo")
     print("      └─ Melodía relajante pero retro")
-    print("      └─ 3 canales: Melodía + Bajo + Arpegios")
+    print("      └─ 4 canales: Melodía + Bajo + Arpegios + Percusión")
     print(f"      └─ {duration_menu:.1f}s de loop suave")
     print()
     print("   3. game-over-theme.wav - Tema melancólico")
     print("      └─ Melodía descendente y triste")
-    print("      └─ 3 canales: Melodía + Bajo + Pad")
+    print("      └─ 4 canales: Melodía + Bajo + Pad + Percusión")
     print(f"      └─ {duration_gameover:.1f}s de despedida")
     print()
     print("💡 Características:")
-    print("   - Formato: WAV (44.1 kHz, 16-bit, mono)")
+    default = AUDIO_PROFILES[DEFAULT_PROFILE]
+    print(f"   - Formato: WAV mono, {default.sample_rate / 1000:g} kHz, {default.bits}-bit "
+          f"(perfil '{DEFAULT_PROFILE}')")
     print("   - Estilo: Chiptune/Arcade 8-bit auténtico")
     print("   - BPM: 140 (tempo arcade energético)")
-    print("   - Síntesis: Ondas cuadradas, triangulares y pulso")
+    print("   - Síntesis: Ondas cuadradas, triangulares, pulso y ruido LFSR")
     print("   - Canales múltiples mezclados profesionalmente")
-    print("   - Loops perfectos para repetición continua")
+    print("   - Loops perfectos: una iteración con chunk 'smpl' (inicio/fin del bucle)")
     print()
     print("🎮 ¡Listas para darle vida a tu juego Arcade Maze Chomper!")
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Tablas de Navegación de los Niveles - Arcade Maze Chomper
+Los mapas no cambian durante la partida, así que el camino más corto entre
+dos celdas cualesquiera se calcula en build: para cada nivel se guarda la
+dirección del primer paso desde cada celda transitable hacia cada otra
+(levelN.nav), y el servidor responde "mejor dirección hacia X" con una
+consulta O(1) en lugar de buscar en cada tick de cada sala.
+
+Las distancias salen de un BFS multi-origen vectorizado: un frente por celda
+destino, todos avanzando a la vez sobre un arreglo (destinos, alto, ancho)
+con np.roll. np.roll envuelve los bordes igual que el juego (Ghost.CanMove,
+AStarPathfinder), así que los túneles quedan incluidos.
+
+Formato (little-endian):
+    offset  tipo              campo
+    0       char[4]           magic 'MZNV'
+    4       u16               version
+    6       u8, u8            width, height
+    8       u16               número de celdas transitables (N)
+    10      u16               bytes por fila de destino (ceil(N / 4))
+    12      u32               reservado (0)
+    16      i16[height*width] índice de cada celda transitable (-1 en paredes)
+    ...     u16[N]            componente de cada celda (sin camino entre componentes distintas)
+    ...     u8[N][row_bytes]  fila por destino: 2 bits por origen (bits 2*(i % 4) del byte i // 4)
+                              con la dirección del primer paso, Direction - 1 (Up=0, Down=1,
+                              Left=2, Right=3)
+"""
+
+import os
+
+import numpy as np
+
+from generate_tile_maps import MAPS_DIR, WALL_CHAR, level_files, level_grid
+
+# Configuración
+MAGIC = b'MZNV'
+FORMAT_VERSION = 1
+NAV_SUFFIX = '.nav'
+
+NAV_HEADER_DTYPE = np.dtype([
+    ('magic', 'S4'),
+    ('version', '<u2'),
+    ('width', 'u1'),
+    ('height', 'u1'),
+    ('cell_count', '<u2'),
+    ('row_bytes', '<u2'),
+    ('reserved', '<u4'),
+])
+
+# Direcciones en orden de desempate entre caminos igual de cortos (el del
+# arcade: arriba, izquierda, abajo, derecha) con su desplazamiento (fila, columna)
+DIRECTION_SHIFTS = [('up', -1, 0), ('left', 0, -1), ('down', 1, 0), ('right', 0, 1)]
+DIRECTION_CODES = {'up': 0, 'down': 1, 'left': 2, 'right': 3}  # MazeChomperGame.Shared.Direction - 1
+DIRECTION_NAMES = {code: name for name, code in DIRECTION_CODES.items()}
+
+def walkable_mask(lines):
+    """Celdas transitables de un nivel (todo lo que no es pared; la puerta de fantasmas sí)"""
+    return level_grid(lines) != WALL_CHAR
+
+def distance_fields(walkable):
+    """
+    Distancia (en pasos) de cada celda a cada celda transitable
+
+    BFS desde todos los destinos a la vez: cada iteración avanza un paso todos
+    los frentes (destinos, alto, ancho) desplazándolos con np.roll.
+
+    Returns:
+        (cells, dist): cells (N, 2) con la (fila, columna) de cada celda
+        transitable en orden de lectura y dist (N, alto, ancho) int16 con la
+        distancia hasta el destino i, o -1 si no hay camino
+    """
+    cells = np.argwhere(walkable)
+    count = len(cells)
+    dist = np.full((count,) + walkable.shape, -1, dtype=np.int16)
+    frontier = np.zeros(dist.shape, dtype=bool)
+    frontier[np.arange(count), cells[:, 0], cells[:, 1]] = True
+    dist[frontier] = 0
+
+    step = 0
+    while frontier.any():
+        step += 1
+        reached = np.zeros_like(frontier)
+        for _, dy, dx in DIRECTION_SHIFTS:
+            reached |= np.roll(frontier, (dy, dx), axis=(1, 2))
+        frontier = reached & walkable & (dist < 0)
+        dist[frontier] = step
+    return cells, dist
+
+def next_directions(cells, dist):
+    """
+    Dirección del primer paso de cada origen hacia cada destino
+
+    Returns:
+        arreglo (destinos, orígenes) uint8 con el código de DIRECTION_CODES;
+        0 cuando origen == destino o no hay camino (ver components)
+    """
+    codes = np.zeros(dist.shape, dtype=np.uint8)
+    chosen = np.zeros(dist.shape, dtype=bool)
+    for name, dy, dx in DIRECTION_SHIFTS:
+        # Distancia de la celda vecina en esta dirección, en la posición del origen
+        neighbour = np.roll(dist, (-dy, -dx), axis=(1, 2))
+        step = (dist > 0) & (neighbour == dist - 1) & ~chosen
+        codes[step] = DIRECTION_CODES[name]
+        chosen |= step
+    return codes[:, cells[:, 0], cells[:, 1]]
+
+def components(cells, dist):
+    """
+    Componente conexa de cada celda transitable: el índice de la primera
+    celda (en orden de lectura) a la que puede llegar
+    """
+    reachable = dist[:, cells[:, 0], cells[:, 1]] >= 0  # (destinos, orígenes)
+    return np.argmax(reachable, axis=0).astype('<u2')
+
+def pack_directions(codes):
+    """(destinos, orígenes) códigos de 2 bits -> (destinos, ceil(N / 4)) bytes"""
+    targets, sources = codes.shape
+    padded = np.zeros((targets, -(-sources // 4) * 4), dtype=np.uint8)
+    padded[:, :sources] = codes
+    quads = padded.reshape(targets, -1, 4)
+    return quads[..., 0] | quads[..., 1] << 2 | quads[..., 2] << 4 | quads[..., 3] << 6
+
+def build_navigation_table(lines):
+    """
+    Tabla de navegación de un nivel, lista para guardar como levelN.nav
+
+    Args:
+        lines: líneas del archivo del nivel (ver generate_tile_maps.read_level)
+
+    Returns:
+        bytes del archivo
+    """
+    walkable = walkable_mask(lines)
+    height, width = walkable.shape
+    cells, dist = distance_fields(walkable)
+
+    cell_index = np.full(walkable.shape, -1, dtype='<i2')
+    cell_index[cells[:, 0], cells[:, 1]] = np.arange(len(cells))
+    packed = pack_directions(next_directions(cells, dist))
+
+    header = np.zeros((), dtype=NAV_HEADER_DTYPE)
+    header['magic'] = MAGIC
+    header['version'] = FORMAT_VERSION
+    header['width'] = width
+    header['height'] = height
+    header['cell_count'] = len(cells)
+    header['row_bytes'] = packed.shape[1]
+    return b''.join([header.tobytes(), cell_index.tobytes(),
+                     components(cells, dist).tobytes(), packed.tobytes()])
+
+def lookup_direction(data, start, target):
+    """
+    Consulta una tabla: dirección del primer paso de `start` a `target`
+
+    Args:
+        data: bytes de un archivo .nav
+        start, target: (fila, columna)
+
+    Returns:
+        'up', 'down', 'left', 'right' o None (misma celda, pared o sin camino)
+    """
+    header = np.frombuffer(data, dtype=NAV_HEADER_DTYPE, count=1)[0]
+    width, height = int(header['width']), int(header['height'])
+    offset = NAV_HEADER_DTYPE.itemsize
+    cell_index = np.frombuffer(data, dtype='<i2', count=width * height, offset=offset)
+    offset += cell_index.nbytes
+    component = np.frombuffer(data, dtype='<u2', count=int(header['cell_count']), offset=offset)
+    table_offset = offset + component.nbytes
+    row_bytes = int(header['row_bytes'])
+
+    source = cell_index[start[0] * width + start[1]]
+    destination = cell_index[target[0] * width + target[1]]
+    if source < 0 or destination < 0 or source == destination or component[source] != component[destination]:
+        return None
+    packed = data[table_offset + int(destination) * row_bytes + int(source) // 4]
+    return DIRECTION_NAMES[(packed >> 2 * (int(source) % 4)) & 3]
+
+def nav_filename(level_filename):
+    """'level1.txt' -> 'level1.nav'"""
+    return os.path.splitext(level_filename)[0] + NAV_SUFFIX
+
+def main():
+    print("🧭 Generador de Tablas de Navegación")
+    print("=" * 50)
+
+    levels = level_files()
+    if not levels:
+        print(f"⚠️  No hay niveles en {MAPS_DIR}")
+        return
+
+    for level_filename, lines in levels:
+        data = build_navigation_table(lines)
+        output_path = nav_filename(level_filename)
+        with open(output_path, 'wb') as f:
+            f.write(data)
+
+        count = int(np.frombuffer(data, dtype=NAV_HEADER_DTYPE, count=1)[0]['cell_count'])
+        print(f"✅ Guardado: {output_path} ({count} celdas, {count * count} pares, "
+              f"{len(data) / 1024:.1f} KB)")
+
+    print("\n✨ ¡Generación completada!")
+
+if __name__ == "__main__":
+    main()
@@ -4,32 +4,33 @@ Generador de Sprite Sheet de Arcade Maze Chomper - Estilo 8-bit Clásico
 Genera todos los sprites necesarios para el juego Arcade Maze Chomper
 """
 
-from PIL import Image, ImageDraw
 import math
 
+from sprite_sheet import (new_sheet, new_sprite_canvas, place_sprite, render_with_sprite_maps,
+                          scale_sprite_map)
+
 # Configuración
 SPRITE_SIZE = 32  # Tamaño de cada sprite individual
-SPRITE_SCALE = 2  # Factor de escala para mejor visualización
 
 # Colores clásicos de Arcade Maze Chomper (RGB)
 PACMAN_YELLOW = (255, 255, 0)
 BACKGROUND = (0, 0, 0, 0)  # Transparente
 BLACK = (0, 0, 0)
 
-def create_pacman_sprite(direction='right', frame=0):
+def create_pacman_sprite(direction='right', frame=0, scale=1):
     """
     Crea un sprite de Arcade Maze Chomper
     
     Args:
         direction: 'right', 'left', 'up', 'down'
         frame: 0 (boca cerrada), 1 (semi-abierta), 2 (abierta)
+        scale: factor de renderizado (la imagen mide SPRITE_SIZE * scale)
     
     Returns:
         Image object
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, BACKGROUND, scale)
     
     # Centro del sprite
     center = size // 2
@@ -98,19 +99,19 @@ def create_pacman_sprite(direction='right', frame=0):
     
     return img
 
-def create_pacman_death_sprite(frame):
+def create_pacman_death_sprite(frame, scale=1):
     """
     Crea sprites de animación de muerte de Arcade Maze Chomper
     
     Args:
         frame: 0-10 (progresión de la animación de muerte)
+        scale: factor de renderizado (la imagen mide SPRITE_SIZE * scale)
     
     Returns:
         Image object
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), BACKGROUND)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, BACKGROUND, scale)
     
     center = size // 2
     radius = size // 2 - 2
@@ -136,7 +137,7 @@ def create_pacman_death_sprite(frame):
     
     return img
 
-def create_pacman_spritesheet():
+def create_pacman_spritesheet(scale=1):
     """
     Crea el sprite sheet completo de Arcade Maze Chomper
     
@@ -151,37 +152,31 @@ def create_pacman_spritesheet():
     # Dimensiones del sprite sheet
     cols = 6  # 6 columnas
     rows = 6  # 6 filas
+    cell_size = SPRITE_SIZE * scale
     
-    sheet_width = SPRITE_SIZE * cols
-    sheet_height = SPRITE_SIZE * rows
-    
-    sprite_sheet = Image.new('RGBA', (sheet_width, sheet_height), BACKGROUND)
+    sprite_sheet = new_sheet(cols, rows, cell_size, BACKGROUND)
     
     directions = ['right', 'left', 'up', 'down']
     
     # Generar sprites de movimiento (primeras 4 filas)
     for row, direction in enumerate(directions):
         for col in range(3):
-            sprite = create_pacman_sprite(direction, col)
-            x = col * SPRITE_SIZE
-            y = row * SPRITE_SIZE
-            sprite_sheet.paste(sprite, (x, y))
+            sprite = create_pacman_sprite(direction, col, scale=scale)
+            place_sprite(sprite_sheet, sprite, col, row, cell_size)
     
     # Generar sprites de muerte (filas 5 y 6)
     death_frames = 11
     for i in range(death_frames):
-        sprite = create_pacman_death_sprite(i)
+        sprite = create_pacman_death_sprite(i, scale=scale)
         row = 4 + (i // cols)
         col = i % cols
-        x = col * SPRITE_SIZE
-        y = row * SPRITE_SIZE
-        sprite_sheet.paste(sprite, (x, y))
+        place_sprite(sprite_sheet, sprite, col, row, cell_size)
     
     return sprite_sheet
 
-def create_sprite_map_json():
+def build_sprite_map(scale=1):
     """
-    Crea un archivo JSON con las coordenadas de cada sprite
+    Construye el diccionario con las coordenadas de cada sprite
     """
     sprite_map = {
         "sprite_size": SPRITE_SIZE,
@@ -214,12 +209,31 @@ def create_sprite_map_json():
             }
         }
     }
-    
+
+    return scale_sprite_map(sprite_map, scale)
+
+def create_pacman_sprite_assets(scales=(1,)):
+    """
+    Crea el sprite sheet y su sprite map a varias escalas (p. ej. 1x/2x/4x)
+    con un único render
+
+    Cada mapa lleva la caja ajustada, la máscara de colisión y el centroide de
+    cada sprite, calculados de la misma imagen que se guarda como PNG
+
+    Returns:
+        lista de (imagen PIL, sprite map), en el mismo orden que `scales`
+    """
+    return render_with_sprite_maps(create_pacman_spritesheet, build_sprite_map, scales)
+
+def create_sprite_map_json(sprite_map, output_path='pacman_sprite_map.json'):
+    """
+    Crea un archivo JSON con las coordenadas y los datos de colisión de cada sprite
+    """
     import json
-    with open('pacman_sprite_map.json', 'w') as f:
+    with open(output_path, 'w') as f:
         json.dump(sprite_map, f, indent=2)
     
-    print("✅ Archivo JSON de mapeo creado: pacman_sprite_map.json")
+    print(f"✅ Archivo JSON de mapeo creado: {output_path}")
 
 def main():
     print("🎮 Generador de Sprites de Arcade Maze Chomper")
@@ -227,7 +241,7 @@ def main():
     
     # Generar sprite sheet de Arcade Maze Chomper
     print("Generando sprite sheet de Arcade Maze Chomper...")
-    pacman_sheet = create_pacman_spritesheet()
+    pacman_sheet, sprite_map = create_pacman_sprite_assets()[0]
     
     # Guardar sprite sheet
     output_path = 'pacman_spritesheet.png'
@@ -235,7 +249,7 @@ def main():
     print(f"✅ Sprite sheet guardado: {output_path}")
     
     # Crear mapa de sprites (JSON)
-    create_sprite_map_json()
+    create_sprite_map_json(sprite_map)
     
     # Información del sprite sheet
     print("\n📊 Información del Sprite Sheet:")
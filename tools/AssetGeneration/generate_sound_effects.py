@@ -4,14 +4,62 @@ Generador de Efectos de Sonido - Estilo Arcade 8-bit
 Genera todos los SFX necesarios para el juego Arcade Maze Chomper
 """
 
+import io
+import json
+import os
 import numpy as np
-import wave as wave_module
 import struct
 import math
 
+from audio_profiles import (AUDIO_PROFILES, DEFAULT_PROFILE, PROFILE_OVERRIDES, SOURCE_PROFILE,
+                            asset_profile)
+from envelopes import apply_envelope_in_place, format_envelope_stats, get_envelope
+from precision import (accumulator_cycles, is_reference, phase_accumulator, sweep_accumulator,
+                       synthesis_dtype)
+from random_streams import asset_rng
+from resampler import resample
+from sound_recipes import (CHOMP_RECIPE, DEATH_RECIPE, EAT_FRUIT_RECIPE, EAT_GHOST_RECIPE,
+                           EAT_POWER_PELLET_RECIPE, EXTRA_LIFE_RECIPE, GAME_OVER_RECIPE,
+                           GAME_START_RECIPE, GHOST_RETURN_RECIPE, LEVEL_COMPLETE_RECIPE,
+                           MENU_NAVIGATE_RECIPE, MENU_SELECT_RECIPE)
+from variants import VariantSpec, render_variants, variant_parameter, variant_shape
+from wav_output import (pcm16_from_pcm, pcm_block, pcm_samples, peak_level, write_pcm_memmap,
+                        write_wav_blocks)
+from wavetables import tone_phases, wavetable_oscillator
+
 # Configuración de audio
-SAMPLE_RATE = 44100  # 44.1 kHz (calidad CD)
-BITS_PER_SAMPLE = 16
+SAMPLE_RATE = 44100  # 44.1 kHz (tasa de síntesis; la del archivo la fija el perfil)
+BLOCK_SIZE = 16384  # Muestras por bloque al escribir WAV
+
+# Banco de sonidos: todos los SFX en un único archivo PCM + índice
+SOUND_BANK_FILE = "sfx-bank.pcm"
+SOUND_BANK_INDEX_FILE = "sfx-bank.json"
+SOUND_BANK_ALIGNMENT = 64  # Bytes; cada efecto empieza en un múltiplo
+
+# Efectos con variantes en el banco (archivo -> VariantSpec, ver variants.py).
+# El chomp suena miles de veces por nivel: 8 variantes de afinación, timbre y envelope
+SOUND_VARIANTS = {
+    "chomp.wav": VariantSpec(count=8, pitch=0.04, duty=0.15, envelope=0.2),
+}
+
+def varied_frequency(frequency):
+    """
+    Frecuencia afinada por variante: columna (N, 1) dentro de
+    variants.rendering_variants(), o la misma frecuencia fuera
+    """
+    pitch = variant_parameter('pitch')
+    return frequency if pitch is None else frequency * pitch
+
+def varied_duty(duty=0.5):
+    """Ciclo de trabajo de las ondas cuadradas por variante (igual que varied_frequency)"""
+    offset = variant_parameter('duty')
+    return duty if offset is None else duty + offset
+
+def generate_silence(duration, sample_rate=SAMPLE_RATE):
+    """
+    Genera silencio (con la forma de las demás ondas si se renderizan variantes)
+    """
+    return np.zeros(variant_shape(int(sample_rate * duration)), dtype=synthesis_dtype())
 
 def generate_sine_wave(frequency, duration, sample_rate=SAMPLE_RATE):
     """
@@ -23,108 +71,269 @@ def generate_sine_wave(frequency, duration, sample_rate=SAMPLE_RATE):
         sample_rate: Tasa de muestreo
     
     Returns:
-        numpy array con la onda
+        numpy array con la onda (variantes × muestras dentro de rendering_variants)
     """
+    frequency = varied_frequency(frequency)
     num_samples = int(sample_rate * duration)
+    if not is_reference():
+        return sine_from_accumulator(phase_accumulator(frequency * duration / num_samples, num_samples))
     t = np.linspace(0, duration, num_samples, False)
     wave = np.sin(2 * np.pi * frequency * t)
     return wave
 
-def generate_square_wave(frequency, duration, sample_rate=SAMPLE_RATE):
+def sine_from_accumulator(accumulator):
+    """
+    Seno de una fase de punto fijo (envuelta en [0, 1) ciclos), en el dtype de síntesis
     """
-    Genera una onda cuadrada (sonido más retro/8-bit)
+    wave = accumulator_cycles(accumulator)
+    wave *= wave.dtype.type(2 * np.pi)
+    return np.sin(wave, out=wave)
+
+def generate_sweep_wave(freq_start, freq_end, duration, sample_rate=SAMPLE_RATE):
+    """
+    Genera un barrido sinusoidal lineal de freq_start a freq_end
+
+    La frecuencia instantánea se calcula en float64 (es un arreglo pequeño) y
+    la fase se acumula en punto fijo, envuelta en cada ciclo, para que el seno
+    en float32 no pierda precisión al avanzar el barrido.
     """
     num_samples = int(sample_rate * duration)
     t = np.linspace(0, duration, num_samples, False)
-    wave = np.sign(np.sin(2 * np.pi * frequency * t))
-    return wave
+    instantaneous_freq = varied_frequency(freq_start + (freq_end - freq_start) * (t / duration))
+
+    if not is_reference():
+        return sine_from_accumulator(sweep_accumulator(instantaneous_freq / sample_rate))
+
+    phase = 2 * np.pi * np.cumsum(instantaneous_freq, axis=-1) / sample_rate
+    return np.sin(phase)
+
+def generate_square_wave(frequency, duration, sample_rate=SAMPLE_RATE):
+    """
+    Genera una onda cuadrada (sonido más retro/8-bit), limitada en banda
+    """
+    frequency = varied_frequency(frequency)
+    num_samples = int(sample_rate * duration)
+    phases = tone_phases(frequency, num_samples, duration / num_samples)
+    return wavetable_oscillator('square', frequency, phases, sample_rate=sample_rate,
+                                duty=varied_duty())
 
 def generate_sawtooth_wave(frequency, duration, sample_rate=SAMPLE_RATE):
     """
-    Genera una onda de sierra
+    Genera una onda de sierra, limitada en banda
     """
+    frequency = varied_frequency(frequency)
     num_samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, num_samples, False)
-    wave = 2 * (t * frequency - np.floor(t * frequency + 0.5))
-    return wave
+    phases = tone_phases(frequency, num_samples, duration / num_samples)
+    return wavetable_oscillator('sawtooth', frequency, phases, sample_rate=sample_rate)
 
 def generate_triangle_wave(frequency, duration, sample_rate=SAMPLE_RATE):
     """
-    Genera una onda triangular
+    Genera una onda triangular, limitada en banda
     """
+    frequency = varied_frequency(frequency)
     num_samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, num_samples, False)
-    wave = 2 * np.abs(2 * (t * frequency - np.floor(t * frequency + 0.5))) - 1
-    return wave
+    phases = tone_phases(frequency, num_samples, duration / num_samples)
+    return wavetable_oscillator('triangle', frequency, phases, sample_rate=sample_rate)
 
 def apply_envelope(wave, attack=0.01, decay=0.05, sustain_level=0.7, release=0.1):
     """
     Aplica un envelope ADSR (Attack, Decay, Sustain, Release) a la onda
+
+    El envelope sale de la caché compartida de envelopes.py y se aplica in-place.
+    Al renderizar variantes, cada fila usa sus tiempos escalados.
     """
-    num_samples = len(wave)
-    envelope = np.ones(num_samples)
-    
-    attack_samples = int(attack * SAMPLE_RATE)
-    decay_samples = int(decay * SAMPLE_RATE)
-    release_samples = int(release * SAMPLE_RATE)
-    
-    # Attack
-    if attack_samples > 0:
-        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
-    
-    # Decay
-    if decay_samples > 0:
-        decay_start = attack_samples
-        decay_end = attack_samples + decay_samples
-        envelope[decay_start:decay_end] = np.linspace(1, sustain_level, decay_samples)
-    
-    # Sustain (ya está en sustain_level)
-    sustain_start = attack_samples + decay_samples
-    sustain_end = num_samples - release_samples
-    if sustain_end > sustain_start:
-        envelope[sustain_start:sustain_end] = sustain_level
-    
-    # Release
-    if release_samples > 0 and num_samples > release_samples:
-        envelope[-release_samples:] = np.linspace(sustain_level, 0, release_samples)
-    
-    return wave * envelope
+    scales = variant_parameter('envelope')
+    if scales is None:
+        return apply_envelope_in_place(wave, attack, decay, sustain_level, release, SAMPLE_RATE)
+
+    wave *= np.stack([get_envelope(wave.shape[-1], attack * scale, decay * scale, sustain_level,
+                                   release * scale, SAMPLE_RATE, wave.dtype)
+                      for scale in scales.ravel().tolist()])
+    return wave
 
-def add_noise(wave, noise_level=0.02):
+def add_noise(wave, noise_level=0.02, seed_name='add_noise'):
     """
     Añade ruido blanco para textura más orgánica
+
+    El ruido sale del flujo determinista del asset (random_streams.py), así el
+    mismo efecto produce el mismo archivo en cada build.
+
+    Args:
+        seed_name: nombre del asset que fija la semilla (p. ej. 'death.wav')
+    """
+    noise = asset_rng(seed_name).normal(0, noise_level, wave.shape)
+    return wave + noise.astype(wave.dtype, copy=False)
+
+# Osciladores de frecuencia fija por forma de onda de las recetas (sound_recipes.py)
+SEGMENT_OSCILLATORS = {
+    'sine': generate_sine_wave,
+    'square': generate_square_wave,
+    'triangle': generate_triangle_wave,
+    'sawtooth': generate_sawtooth_wave,
+}
+
+def render_segment(segment):
+    """
+    Renderiza un segmento de receta: oscilador, barrido o silencio, con su envelope
+    """
+    if segment.waveform == 'silence':
+        return generate_silence(segment.duration)
+    if segment.waveform == 'sweep':
+        wave = generate_sweep_wave(segment.frequency, segment.end_frequency, segment.duration)
+    else:
+        wave = SEGMENT_OSCILLATORS[segment.waveform](segment.frequency, segment.duration)
+    if segment.envelope is not None:
+        wave = apply_envelope(wave, *segment.envelope)
+    return wave
+
+def render_recipe(recipe):
+    """
+    Renderiza una receta completa (secuencia de segmentos, ver sound_recipes.py)
+
+    Dentro de variants.rendering_variants() cada segmento sale con una fila por
+    variante y la concatenación es sobre el último eje.
     """
-    noise = np.random.normal(0, noise_level, len(wave))
-    return wave + noise
+    return np.concatenate([render_segment(segment) for segment in recipe], axis=-1)
 
-def normalize_wave(wave):
+def iter_blocks(wave, block_size=BLOCK_SIZE):
+    """
+    Recorre un arreglo en bloques de tamaño fijo (vistas, sin copias)
     """
-    Normaliza la onda para evitar clipping y usar el rango completo
+    for start in range(0, len(wave), block_size):
+        yield wave[start:start + block_size]
+
+def encode_wav(wave, profile=SOURCE_PROFILE):
+    """
+    Codifica la onda como un archivo WAV completo en memoria
+
+    Args:
+        profile: perfil de salida (tasa y bits); la onda se remuestrea si hace falta
+
+    Returns:
+        bytes con el contenido del archivo WAV
     """
-    max_val = np.max(np.abs(wave))
-    if max_val > 0:
-        wave = wave / max_val
-    return wave * 0.9  # Dejar un poco de headroom
+    wave = resample(wave, SAMPLE_RATE, profile.sample_rate)
+    buffer = io.BytesIO()
+    write_wav_blocks(buffer, iter_blocks(wave), peak_level(iter_blocks(wave)), profile.sample_rate, profile.bits)
+    return buffer.getvalue()
 
-def save_wav(filename, wave, sample_rate=SAMPLE_RATE):
+def save_wav(filename, wave, profile=SOURCE_PROFILE, block_size=BLOCK_SIZE):
     """
     Guarda la onda como archivo WAV
+
+    El encabezado se escribe por adelantado y cada bloque se escala sobre un
+    buffer reutilizado y se copia directamente al archivo mapeado (np.memmap)
+    """
+    wave = resample(wave, SAMPLE_RATE, profile.sample_rate)
+    peak = peak_level(iter_blocks(wave, block_size))
+    scratch = np.empty(block_size, dtype=wave.dtype)
+    blocks = (pcm_block(block, peak, profile.bits, out=scratch[:len(block)])
+              for block in iter_blocks(wave, block_size))
+    write_pcm_memmap(filename, blocks, len(wave), profile.sample_rate, profile.bits)
+
+    print(f"✅ Guardado: {filename} ({profile.sample_rate} Hz, {profile.bits} bits)")
+
+# ============================================
+# BANCO DE SONIDOS
+# ============================================
+
+def bank_samples(wave, profile):
     """
-    # Normalizar y convertir a 16-bit
-    wave = normalize_wave(wave)
-    wave_int = np.int16(wave * 32767)
-    
-    # Crear archivo WAV
-    with wave_module.open(filename, 'w') as wav_file:
-        # Configurar parámetros: mono, 16-bit, sample_rate
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)  # 2 bytes = 16 bits
-        wav_file.setframerate(sample_rate)
-        
-        # Escribir datos
-        wav_file.writeframes(wave_int.tobytes())
-    
-    print(f"✅ Guardado: {filename}")
+    Muestras int16 (little-endian) de la onda tal como el juego las carga de su WAV
+
+    Mismo remuestreo y cuantización que save_wav; los perfiles de 8 bits se
+    expanden a 16 igual que hace SFML al leer el archivo.
+    """
+    wave = resample(wave, SAMPLE_RATE, profile.sample_rate)
+    peak = peak_level(iter_blocks(wave))
+    return pcm16_from_pcm(pcm_samples(wave, peak, profile.bits), profile.bits)
+
+def build_sound_bank(waves, default_profile=DEFAULT_PROFILE):
+    """
+    Empaqueta varias ondas en un único bloque PCM con su índice
+
+    Cada efecto se convierte con su perfil de salida, igual que su WAV, y
+    empieza en un offset múltiplo de SOUND_BANK_ALIGNMENT (relleno con ceros),
+    así el juego puede cargar el banco con una sola lectura (o mapearlo) y
+    recortar cada efecto sin parsear encabezados.
+
+    Un efecto con variantes (arreglo variantes × muestras, ver variants.py) se
+    guarda como filas consecutivas separadas por "stride" bytes, cada una
+    normalizada por separado; la fila 0 es el efecto original.
+
+    Args:
+        waves: diccionario archivo WAV -> onda (p. ej. 'chomp.wav')
+        default_profile: perfil de los efectos sin override (audio_profiles.py)
+
+    Returns:
+        (bytes del banco, diccionario del índice)
+        Índice: {"format": "pcm_s16le", "channels": 1, "alignment": 64, "size": N,
+                 "sounds": {"chomp": {"offset": bytes, "length": muestras, "sample_rate": 48000,
+                                      "variants": 8, "stride": bytes}}}
+        ("variants" y "stride" solo en los efectos con variantes)
+    """
+    data = bytearray()
+    sounds = {}
+    for filename, wave in waves.items():
+        profile = asset_profile(filename, default_profile)
+        rows = [bank_samples(row, profile) for row in np.atleast_2d(wave)]
+        length = len(rows[0])
+        stride = length * 2 + (-length * 2 % SOUND_BANK_ALIGNMENT)
+
+        data.extend(bytes(-len(data) % SOUND_BANK_ALIGNMENT))
+        entry = {
+            "offset": len(data),
+            "length": length,
+            "sample_rate": profile.sample_rate,
+        }
+        if len(rows) > 1:
+            entry["variants"] = len(rows)
+            entry["stride"] = stride
+        sounds[os.path.splitext(filename)[0]] = entry
+
+        for row in rows:
+            data.extend(bytes(-len(data) % SOUND_BANK_ALIGNMENT))
+            data.extend(row.tobytes())
+
+    index = {
+        "format": "pcm_s16le",
+        "channels": 1,
+        "alignment": SOUND_BANK_ALIGNMENT,
+        "size": len(data),
+        "sounds": sounds,
+    }
+    return bytes(data), index
+
+def render_sound_effect(filename):
+    """
+    Renderiza un efecto de SOUND_EFFECTS: sus variantes (variantes × muestras)
+    si está en SOUND_VARIANTS, si no la onda única
+    """
+    generator_func = SOUND_EFFECTS[filename]
+    if filename in SOUND_VARIANTS:
+        return render_variants(generator_func, SOUND_VARIANTS[filename], filename)
+    return generator_func()
+
+def create_sound_bank(default_profile=DEFAULT_PROFILE):
+    """
+    Renderiza todos los efectos de SOUND_EFFECTS (con sus variantes) y los
+    empaqueta en un banco
+    """
+    return build_sound_bank({filename: render_sound_effect(filename) for filename in SOUND_EFFECTS},
+                            default_profile)
+
+def save_sound_bank(waves, bank_filename=SOUND_BANK_FILE, index_filename=SOUND_BANK_INDEX_FILE):
+    """
+    Guarda el banco de sonidos y su índice JSON
+    """
+    data, index = build_sound_bank(waves)
+    with open(bank_filename, 'wb') as f:
+        f.write(data)
+    with open(index_filename, 'w') as f:
+        json.dump(index, f, indent=2)
+
+    print(f"✅ Guardado: {bank_filename} ({len(index['sounds'])} efectos, {len(data) / 1024:.0f} KiB)")
+    print(f"✅ Guardado: {index_filename}")
 
 # ============================================
 # EFECTOS DE SONIDO ESPECÍFICOS
@@ -135,282 +344,100 @@ def create_chomp_sound():
     Sonido de Arcade Maze Chomper comiendo puntos pequeños
     Sonido muy corto y agudo tipo "waka"
     """
-    duration = 0.08
-    
-    # Dos tonos rápidos que bajan
-    freq1 = 800
-    freq2 = 400
-    
-    half_duration = duration / 2
-    
-    # Primera mitad (tono alto)
-    wave1 = generate_square_wave(freq1, half_duration)
-    wave1 = apply_envelope(wave1, attack=0.001, decay=0.01, sustain_level=0.6, release=0.02)
-    
-    # Segunda mitad (tono bajo)
-    wave2 = generate_square_wave(freq2, half_duration)
-    wave2 = apply_envelope(wave2, attack=0.001, decay=0.01, sustain_level=0.5, release=0.02)
-    
-    # Combinar
-    wave = np.concatenate([wave1, wave2])
-    
-    return wave
+    return render_recipe(CHOMP_RECIPE)
 
 def create_eat_power_pellet_sound():
     """
     Sonido de comer power pellet (punto grande)
     Más largo y dramático que el chomp normal
     """
-    duration = 0.3
-    
-    # Secuencia de tonos ascendentes
-    freqs = [400, 500, 600, 800]
-    waves = []
-    
-    segment_duration = duration / len(freqs)
-    
-    for freq in freqs:
-        segment = generate_square_wave(freq, segment_duration)
-        segment = apply_envelope(segment, attack=0.005, decay=0.02, sustain_level=0.7, release=0.03)
-        waves.append(segment)
-    
-    wave = np.concatenate(waves)
-    
-    return wave
+    return render_recipe(EAT_POWER_PELLET_RECIPE)
 
 def create_eat_ghost_sound():
     """
     Sonido de comer fantasma vulnerable
     Tono ascendente rápido y satisfactorio
     """
-    duration = 0.4
-    
-    # Sweep de frecuencia ascendente
-    num_samples = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, num_samples, False)
-    
-    # Frecuencia que sube de 200 Hz a 800 Hz
-    freq_start = 200
-    freq_end = 800
-    instantaneous_freq = freq_start + (freq_end - freq_start) * (t / duration)
-    
-    # Generar onda con frecuencia variable
-    phase = 2 * np.pi * np.cumsum(instantaneous_freq) / SAMPLE_RATE
-    wave = np.sin(phase)
-    
-    wave = apply_envelope(wave, attack=0.01, decay=0.05, sustain_level=0.8, release=0.1)
-    
-    return wave
+    return render_recipe(EAT_GHOST_RECIPE)
 
 def create_eat_fruit_sound():
     """
     Sonido de comer fruta
     Melodía corta y alegre
     """
-    duration = 0.5
-    
-    # Secuencia melódica
-    notes = [
-        (659, 0.1),  # E5
-        (784, 0.1),  # G5
-        (988, 0.15), # B5
-        (1319, 0.15) # E6
-    ]
-    
-    waves = []
-    for freq, note_duration in notes:
-        segment = generate_sine_wave(freq, note_duration)
-        segment = apply_envelope(segment, attack=0.005, decay=0.02, sustain_level=0.7, release=0.03)
-        waves.append(segment)
-    
-    wave = np.concatenate(waves)
-    
-    return wave
+    return render_recipe(EAT_FRUIT_RECIPE)
 
 def create_death_sound():
     """
     Sonido de muerte de Arcade Maze Chomper
     Tono descendente dramático
     """
-    duration = 1.0
-    
-    # Sweep de frecuencia descendente
-    num_samples = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, num_samples, False)
-    
-    # Frecuencia que baja de 800 Hz a 100 Hz
-    freq_start = 800
-    freq_end = 100
-    instantaneous_freq = freq_start - (freq_start - freq_end) * (t / duration)
-    
-    # Generar onda con frecuencia variable
-    phase = 2 * np.pi * np.cumsum(instantaneous_freq) / SAMPLE_RATE
-    wave = np.sin(phase)
-    
-    # Envelope que se desvanece gradualmente
-    wave = apply_envelope(wave, attack=0.01, decay=0.1, sustain_level=0.6, release=0.4)
-    
-    return wave
+    return render_recipe(DEATH_RECIPE)
 
 def create_extra_life_sound():
     """
     Sonido de obtener vida extra
     Melodía ascendente alegre
     """
-    duration = 0.8
-    
-    # Arpeggio ascendente
-    notes = [
-        (523, 0.15),  # C5
-        (659, 0.15),  # E5
-        (784, 0.15),  # G5
-        (1047, 0.2),  # C6
-        (1047, 0.15)  # C6 (repetido)
-    ]
-    
-    waves = []
-    for freq, note_duration in notes:
-        segment = generate_sine_wave(freq, note_duration)
-        segment = apply_envelope(segment, attack=0.01, decay=0.03, sustain_level=0.7, release=0.05)
-        waves.append(segment)
-    
-    wave = np.concatenate(waves)
-    
-    return wave
+    return render_recipe(EXTRA_LIFE_RECIPE)
 
 def create_game_start_sound():
     """
     Sonido de inicio de nivel
     Melodía icónica tipo fanfare
     """
-    duration = 2.0
-    
-    # Melodía de inicio
-    notes = [
-        (392, 0.15),  # G4
-        (523, 0.15),  # C5
-        (659, 0.15),  # E5
-        (784, 0.2),   # G5
-        (659, 0.15),  # E5
-        (784, 0.3),   # G5
-        (0, 0.2),     # Silencio
-        (659, 0.2),   # E5
-        (784, 0.4)    # G5
-    ]
-    
-    waves = []
-    for freq, note_duration in notes:
-        if freq == 0:  # Silencio
-            segment = np.zeros(int(SAMPLE_RATE * note_duration))
-        else:
-            segment = generate_sine_wave(freq, note_duration)
-            segment = apply_envelope(segment, attack=0.01, decay=0.03, sustain_level=0.7, release=0.05)
-        waves.append(segment)
-    
-    wave = np.concatenate(waves)
-    
-    return wave
+    return render_recipe(GAME_START_RECIPE)
 
 def create_level_complete_sound():
     """
     Sonido de completar nivel
     Melodía victoriosa
     """
-    duration = 1.5
-    
-    # Secuencia victoriosa
-    notes = [
-        (659, 0.1),   # E5
-        (659, 0.1),   # E5
-        (659, 0.2),   # E5 (más largo)
-        (523, 0.1),   # C5
-        (659, 0.1),   # E5
-        (784, 0.3),   # G5
-        (392, 0.3)    # G4
-    ]
-    
-    waves = []
-    for freq, note_duration in notes:
-        segment = generate_triangle_wave(freq, note_duration)
-        segment = apply_envelope(segment, attack=0.01, decay=0.02, sustain_level=0.8, release=0.04)
-        waves.append(segment)
-    
-    wave = np.concatenate(waves)
-    
-    return wave
+    return render_recipe(LEVEL_COMPLETE_RECIPE)
 
 def create_game_over_sound():
     """
     Sonido de Game Over
     Melodía descendente triste
     """
-    duration = 2.0
-    
-    # Secuencia descendente
-    notes = [
-        (523, 0.3),   # C5
-        (494, 0.3),   # B4
-        (440, 0.3),   # A4
-        (392, 0.3),   # G4
-        (349, 0.4),   # F4
-        (330, 0.4)    # E4
-    ]
-    
-    waves = []
-    for freq, note_duration in notes:
-        segment = generate_sine_wave(freq, note_duration)
-        segment = apply_envelope(segment, attack=0.02, decay=0.05, sustain_level=0.6, release=0.1)
-        waves.append(segment)
-    
-    wave = np.concatenate(waves)
-    
-    return wave
+    return render_recipe(GAME_OVER_RECIPE)
 
 def create_menu_select_sound():
     """
     Sonido de seleccionar opción en menú
     Blip corto y agradable
     """
-    duration = 0.1
-    
-    wave = generate_square_wave(800, duration)
-    wave = apply_envelope(wave, attack=0.005, decay=0.02, sustain_level=0.5, release=0.03)
-    
-    return wave
+    return render_recipe(MENU_SELECT_RECIPE)
 
 def create_menu_navigate_sound():
     """
     Sonido de navegar en el menú
     Blip más suave
     """
-    duration = 0.08
-    
-    wave = generate_sine_wave(600, duration)
-    wave = apply_envelope(wave, attack=0.005, decay=0.015, sustain_level=0.4, release=0.02)
-    
-    return wave
+    return render_recipe(MENU_NAVIGATE_RECIPE)
 
 def create_ghost_return_sound():
     """
     Sonido de fantasma regresando a la base (opcional)
     Tono rápido ascendente
     """
-    duration = 0.3
-    
-    # Sweep rápido
-    num_samples = int(SAMPLE_RATE * duration)
-    t = np.linspace(0, duration, num_samples, False)
-    
-    freq_start = 300
-    freq_end = 600
-    instantaneous_freq = freq_start + (freq_end - freq_start) * (t / duration)
-    
-    phase = 2 * np.pi * np.cumsum(instantaneous_freq) / SAMPLE_RATE
-    wave = np.sin(phase)
-    
-    wave = apply_envelope(wave, attack=0.01, decay=0.05, sustain_level=0.5, release=0.08)
-    
-    return wave
+    return render_recipe(GHOST_RETURN_RECIPE)
+
+# Diccionario de efectos de sonido (archivo de salida -> función generadora)
+SOUND_EFFECTS = {
+    "chomp.wav": create_chomp_sound,
+    "eat-power-pellet.wav": create_eat_power_pellet_sound,
+    "eat-ghost.wav": create_eat_ghost_sound,
+    "eat-fruit.wav": create_eat_fruit_sound,
+    "death.wav": create_death_sound,
+    "extra-life.wav": create_extra_life_sound,
+    "game-start.wav": create_game_start_sound,
+    "level-complete.wav": create_level_complete_sound,
+    "game-over.wav": create_game_over_sound,
+    "menu-select.wav": create_menu_select_sound,
+    "menu-navigate.wav": create_menu_navigate_sound,
+    "ghost-return.wav": create_ghost_return_sound
+}
 
 # ============================================
 # FUNCIÓN PRINCIPAL
@@ -422,30 +449,23 @@ def main():
     print("Generando efectos de sonido estilo 8-bit...")
     print()
 
-    
-    # Diccionario de efectos de sonido
-    sound_effects = {
-        "chomp.wav": create_chomp_sound,
-        "eat-power-pellet.wav": create_eat_power_pellet_sound,
-        "eat-ghost.wav": create_eat_ghost_sound,
-        "eat-fruit.wav": create_eat_fruit_sound,
-        "death.wav": create_death_sound,
-        "extra-life.wav": create_extra_life_sound,
-        "game-start.wav": create_game_start_sound,
-        "level-complete.wav": create_level_complete_sound,
-        "game-over.wav": create_game_over_sound,
-        "menu-select.wav": create_menu_select_sound,
-        "menu-navigate.wav": create_menu_navigate_sound,
-        "ghost-return.wav": create_ghost_return_sound
-    }
-    
+    sound_effects = SOUND_EFFECTS
+
     # Generar todos los efectos
     print("📦 Generando archivos WAV:")
     print()
-    
-    for filename, generator_func in sound_effects.items():
-        wave = generator_func()
-        save_wav(filename, wave)
+
+    waves = {}
+    for filename in sound_effects:
+        wave = render_sound_effect(filename)
+        # Con variantes, el WAV es la fila 0 (el efecto original)
+        save_wav(filename, wave if wave.ndim == 1 else wave[0], asset_profile(filename))
+        waves[filename] = wave
+
+    # Banco único con todos los efectos (una sola lectura al arrancar el juego)
+    print()
+    print("📦 Generando banco de sonidos:")
+    save_sound_bank(waves)
     
     # Resumen
     print()
@@ -453,6 +473,7 @@ def main():
     print("✨ ¡Generación completada!")
     print()
     print(f"📊 Total de efectos generados: {len(sound_effects)}")
+    print(f"📈 Caché de envelopes: {format_envelope_stats()}")
     print()
     print("📁 Efectos de sonido creados:")
     print("   Arcade Maze Chomper:")
@@ -475,8 +496,18 @@ def main():
     print("   Fantasmas:")
     print("   - ghost-return.wav (fantasma regresando)")
     print()
+    print("   Banco:")
+    print(f"   - {SOUND_BANK_FILE} + {SOUND_BANK_INDEX_FILE} (todos los efectos en un archivo)")
+    for filename, spec in SOUND_VARIANTS.items():
+        print(f"   - {filename}: {spec.count} variantes (afinación ±{spec.pitch:.0%}, "
+              f"duty ±{spec.duty:g}, envelope ±{spec.envelope:.0%})")
+    print()
     print("💡 Características:")
-    print("   - Formato: WAV (44.1 kHz, 16-bit, mono)")
+    default = AUDIO_PROFILES[DEFAULT_PROFILE]
+    print(f"   - Formato: WAV mono, {default.sample_rate / 1000:g} kHz, {default.bits}-bit "
+          f"(perfil '{DEFAULT_PROFILE}')")
+    for filename, name in PROFILE_OVERRIDES.items():
+        print(f"   - {filename}: perfil '{name}'")
     print("   - Estilo: Arcade/8-bit retro")
     print("   - Síntesis: Ondas cuadradas, sinusoidales y triangulares")
     print("   - Optimizados para juegos")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Autotiler de Niveles - Arcade Maze Chomper
+Resuelve en build la variante de pared (esquina, unión en T, terminal...) de
+cada celda '#' de Assets/Maps/level*.txt y guarda la rejilla de tiles junto
+al nivel, para que el juego no analice vecinos al cargar ni en cada frame.
+
+Cada celda de pared recibe un bitmask de sus 4 vecinos (arriba, abajo,
+izquierda, derecha), calculado para todo el mapa a la vez desplazando la
+máscara de paredes, y el bitmask elige la clave del tiles_sprite_map.json con
+las mismas reglas que GameEngine.GetWallSpriteName.
+
+Formato (levelN.tiles.json): una fila de texto por fila del mapa, un carácter
+por celda; la leyenda traduce cada carácter a su clave de sprite:
+    {"width": 28, "height": 31, "empty": ".",
+     "legend": {"A": "walls_horizontal", ...},
+     "rows": ["CAAAA...", ...]}
+"""
+
+import glob
+import json
+import os
+
+import numpy as np
+
+from generate_tiles_sprites import build_sprite_map
+
+# Configuración
+MAP_WIDTH = 28   # Constants.MapWidth
+MAP_HEIGHT = 31  # Constants.MapHeight
+WALL_CHAR = '#'
+NO_TILE = '.'    # Celda sin tile (pasillos, puntos, puerta de fantasmas...)
+TILE_GRID_SUFFIX = '.tiles.json'
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+MAPS_DIR = os.path.join(os.path.dirname(os.path.dirname(SCRIPT_DIR)),
+                        "src", "MazeChomperGame", "Assets", "Maps")
+LEVEL_PATTERN = 'level*.txt'
+
+# Bits del bitmask de vecinos que también son pared
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+
+# Clave de sprite por bitmask (mismas reglas que GameEngine.GetWallSpriteName)
+WALL_VARIANTS = {
+    0: 'special_empty',
+    UP: 'walls_end_down',
+    DOWN: 'walls_end_up',
+    LEFT: 'walls_end_left',
+    RIGHT: 'walls_end_right',
+    UP | DOWN: 'walls_vertical',
+    LEFT | RIGHT: 'walls_horizontal',
+    DOWN | RIGHT: 'walls_corner_br',
+    DOWN | LEFT: 'walls_corner_bl',
+    UP | RIGHT: 'walls_corner_tr',
+    UP | LEFT: 'walls_corner_tl',
+    UP | DOWN | LEFT: 'walls_t_left',
+    UP | DOWN | RIGHT: 'walls_t_right',
+    UP | LEFT | RIGHT: 'walls_t_up',
+    DOWN | LEFT | RIGHT: 'walls_t_down',
+    UP | DOWN | LEFT | RIGHT: 'walls_cross',
+}
+
+def tile_keys():
+    """
+    Claves de todos los tiles del sheet ('walls_horizontal', 'special_empty'...),
+    en el orden de tiles_sprite_map.json (las mismas que usa GetTileSprite)
+    """
+    sprites = build_sprite_map()['sprites']
+    return [f'{group}_{name}' for group, entries in sprites.items() for name in entries]
+
+def variant_lookup(keys):
+    """
+    Tabla bitmask -> índice en `keys` (16 entradas)
+    """
+    lookup = np.empty(16, dtype=np.intp)
+    for mask in range(16):
+        key = WALL_VARIANTS[mask]
+        if key not in keys:
+            raise ValueError(f"La variante '{key}' no existe en tiles_sprite_map.json")
+        lookup[mask] = keys.index(key)
+    return lookup
+
+def read_level(path):
+    """Líneas de un archivo de nivel (sin saltos de línea)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return tuple(f.read().splitlines())
+
+def level_files(maps_dir=MAPS_DIR):
+    """
+    Niveles del juego en orden: lista de (nombre de archivo, líneas)
+    """
+    paths = sorted(glob.glob(os.path.join(maps_dir, LEVEL_PATTERN)))
+    return [(os.path.basename(path), read_level(path)) for path in paths]
+
+def level_grid(lines):
+    """
+    Rejilla de caracteres (MAP_HEIGHT × MAP_WIDTH) de un nivel
+
+    Las líneas cortas se completan con espacios, igual que MapLoader.LoadMap.
+    """
+    if len(lines) != MAP_HEIGHT:
+        raise ValueError(f"Alto del mapa incorrecto: se esperaban {MAP_HEIGHT} líneas, hay {len(lines)}")
+    for row, line in enumerate(lines):
+        if len(line) > MAP_WIDTH:
+            raise ValueError(f"Ancho del mapa incorrecto en la línea {row + 1}: "
+                             f"máximo {MAP_WIDTH}, hay {len(line)}")
+    return np.array([list(line.ljust(MAP_WIDTH)) for line in lines])
+
+def neighbour_masks(walls):
+    """
+    Bitmask de vecinos de pared de cada celda (UP | DOWN | LEFT | RIGHT)
+
+    La máscara se rodea de una celda sin pared y cada vecino es la misma
+    máscara desplazada una celda: fuera del mapa nunca hay pared.
+    """
+    padded = np.pad(walls, 1)
+    masks = padded[:-2, 1:-1] * np.uint8(UP)
+    masks |= padded[2:, 1:-1] * np.uint8(DOWN)
+    masks |= padded[1:-1, :-2] * np.uint8(LEFT)
+    masks |= padded[1:-1, 2:] * np.uint8(RIGHT)
+    return masks
+
+def autotile(lines, keys=None):
+    """
+    Índice de tile de cada celda de un nivel
+
+    Returns:
+        arreglo (MAP_HEIGHT, MAP_WIDTH) con el índice en tile_keys() de cada
+        pared, o -1 en las celdas sin tile
+    """
+    keys = tile_keys() if keys is None else keys
+    walls = level_grid(lines) == WALL_CHAR
+    return np.where(walls, variant_lookup(keys)[neighbour_masks(walls)], -1)
+
+def build_tile_map(lines):
+    """
+    Rejilla de tiles de un nivel, lista para guardar como levelN.tiles.json
+
+    Args:
+        lines: líneas del archivo del nivel (ver read_level)
+    """
+    keys = tile_keys()
+    codes = [chr(ord('A') + index) for index in range(len(keys))]
+    grid = autotile(lines, keys)
+
+    # El índice -1 cae en el último elemento: NO_TILE
+    characters = np.array(codes + [NO_TILE])[grid]
+    return {
+        "width": MAP_WIDTH,
+        "height": MAP_HEIGHT,
+        "empty": NO_TILE,
+        "legend": dict(zip(codes, keys)),
+        "rows": [''.join(row) for row in characters],
+    }
+
+def tile_map_filename(level_filename):
+    """'level1.txt' -> 'level1.tiles.json'"""
+    return os.path.splitext(level_filename)[0] + TILE_GRID_SUFFIX
+
+def main():
+    print("🧱 Autotiler de Niveles")
+    print("=" * 50)
+
+    levels = level_files()
+    if not levels:
+        print(f"⚠️  No hay niveles en {MAPS_DIR}")
+        return
+
+    for level_filename, lines in levels:
+        tile_map = build_tile_map(lines)
+        output_path = tile_map_filename(level_filename)
+        with open(output_path, 'w') as f:
+            json.dump(tile_map, f, indent=2)
+
+        used = {code for row in tile_map['rows'] for code in row} - {NO_TILE}
+        walls = sum(len(row) - row.count(NO_TILE) for row in tile_map['rows'])
+        print(f"✅ Guardado: {output_path} ({walls} paredes, {len(used)} variantes)")
+
+    print("\n✨ ¡Generación completada!")
+
+if __name__ == "__main__":
+    main()
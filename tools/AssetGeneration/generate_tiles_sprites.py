@@ -4,7 +4,8 @@ Generador de Sprite Sheet de Tiles del Laberinto - Estilo 8-bit Clásico
 Genera todos los tiles necesarios para construir el mapa de Arcade Maze Chomper
 """
 
-from PIL import Image, ImageDraw
+from sprite_sheet import (new_sheet, new_sprite_canvas, place_sprite, render_with_sprite_maps,
+                          scale_sprite_map)
 
 # Configuración
 SPRITE_SIZE = 32  # Tamaño de cada sprite individual
@@ -22,13 +23,12 @@ COLORS = {
 BACKGROUND = (0, 0, 0, 0)  # Transparente para sprites
 TRANSPARENT = (0, 0, 0, 0)
 
-def create_wall_horizontal():
+def create_wall_horizontal(scale=1):
     """
     Crea un tile de pared horizontal
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     # Pared horizontal en el centro
     wall_y = size // 2 - WALL_THICKNESS // 2
@@ -38,13 +38,12 @@ def create_wall_horizontal():
 
     return img
 
-def create_wall_vertical():
+def create_wall_vertical(scale=1):
     """
     Crea un tile de pared vertical
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     # Pared vertical en el centro
     wall_x = size // 2 - WALL_THICKNESS // 2
@@ -54,13 +53,12 @@ def create_wall_vertical():
 
     return img
 
-def create_wall_corner_tl():
+def create_wall_corner_tl(scale=1):
     """
     Crea esquina superior izquierda (Top-Left)
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     center = size // 2
 
@@ -82,13 +80,12 @@ def create_wall_corner_tl():
 
     return img
 
-def create_wall_corner_tr():
+def create_wall_corner_tr(scale=1):
     """
     Crea esquina superior derecha (Top-Right)
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     center = size // 2
 
@@ -108,13 +105,12 @@ def create_wall_corner_tr():
 
     return img
 
-def create_wall_corner_bl():
+def create_wall_corner_bl(scale=1):
     """
     Crea esquina inferior izquierda (Bottom-Left)
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     center = size // 2
 
@@ -134,13 +130,12 @@ def create_wall_corner_bl():
 
     return img
 
-def create_wall_corner_br():
+def create_wall_corner_br(scale=1):
     """
     Crea esquina inferior derecha (Bottom-Right)
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     center = size // 2
 
@@ -160,16 +155,16 @@ def create_wall_corner_br():
 
     return img
 
-def create_wall_t_junction(direction):
+def create_wall_t_junction(direction, scale=1):
     """
     Crea una unión en T
 
     Args:
         direction: 'up', 'down', 'left', 'right' (indica hacia dónde apunta la T)
+        scale: factor de renderizado (la imagen mide SPRITE_SIZE * scale)
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     center = size // 2
     wall_x = center - WALL_THICKNESS // 2
@@ -209,13 +204,12 @@ def create_wall_t_junction(direction):
 
     return img
 
-def create_wall_cross():
+def create_wall_cross(scale=1):
     """
     Crea una cruz (intersección de 4 caminos)
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     center = size // 2
     wall_x = center - WALL_THICKNESS // 2
@@ -229,16 +223,16 @@ def create_wall_cross():
 
     return img
 
-def create_wall_end(direction):
+def create_wall_end(direction, scale=1):
     """
     Crea un terminal de pared (pared que termina)
 
     Args:
         direction: 'up', 'down', 'left', 'right'
+        scale: factor de renderizado (la imagen mide SPRITE_SIZE * scale)
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     center = size // 2
     wall_x = center - WALL_THICKNESS // 2
@@ -280,13 +274,12 @@ def create_wall_end(direction):
 
     return img
 
-def create_ghost_door():
+def create_ghost_door(scale=1):
     """
     Crea la puerta de la casa de los fantasmas
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     center = size // 2
     door_height = 3
@@ -306,20 +299,19 @@ def create_ghost_door():
 
     return img
 
-def create_empty_tile():
+def create_empty_tile(scale=1):
     """
     Crea un tile vacío (fondo negro)
     """
     size = SPRITE_SIZE
-    img = Image.new('RGBA', (size, size), TRANSPARENT)
-    draw = ImageDraw.Draw(img)
+    img, draw = new_sprite_canvas(size, TRANSPARENT, scale)
 
     # Fondo completamente negro
     draw.rectangle([0, 0, size, size], fill=COLORS['background'])
 
     return img
 
-def create_tiles_spritesheet():
+def create_tiles_spritesheet(scale=1):
     """
     Crea el sprite sheet completo de tiles del laberinto
 
@@ -331,53 +323,47 @@ def create_tiles_spritesheet():
     # Dimensiones del sprite sheet
     cols = 9
     rows = 2
+    cell_size = SPRITE_SIZE * scale
 
-    sheet_width = SPRITE_SIZE * cols
-    sheet_height = SPRITE_SIZE * rows
-
-    sprite_sheet = Image.new('RGBA', (sheet_width, sheet_height), TRANSPARENT)
+    sprite_sheet = new_sheet(cols, rows, cell_size, TRANSPARENT)
 
     # Primera fila
     row1_sprites = [
-        create_wall_horizontal(),      # 0: Horizontal
-        create_wall_vertical(),        # 1: Vertical
-        create_wall_corner_tl(),       # 2: Corner Top-Left
-        create_wall_corner_tr(),       # 3: Corner Top-Right
-        create_wall_corner_bl(),       # 4: Corner Bottom-Left
-        create_wall_corner_br(),       # 5: Corner Bottom-Right
-        create_wall_t_junction('up'),  # 6: T-Junction Up
-        create_wall_t_junction('down'),# 7: T-Junction Down
-        create_wall_t_junction('left') # 8: T-Junction Left
+        create_wall_horizontal(scale=scale),      # 0: Horizontal
+        create_wall_vertical(scale=scale),        # 1: Vertical
+        create_wall_corner_tl(scale=scale),       # 2: Corner Top-Left
+        create_wall_corner_tr(scale=scale),       # 3: Corner Top-Right
+        create_wall_corner_bl(scale=scale),       # 4: Corner Bottom-Left
+        create_wall_corner_br(scale=scale),       # 5: Corner Bottom-Right
+        create_wall_t_junction('up', scale=scale),  # 6: T-Junction Up
+        create_wall_t_junction('down', scale=scale),# 7: T-Junction Down
+        create_wall_t_junction('left', scale=scale) # 8: T-Junction Left
     ]
 
     for col, sprite in enumerate(row1_sprites):
-        x = col * SPRITE_SIZE
-        y = 0
-        sprite_sheet.paste(sprite, (x, y))
+        place_sprite(sprite_sheet, sprite, col, 0, cell_size)
 
     # Segunda fila
     row2_sprites = [
-        create_wall_t_junction('right'), # 0: T-Junction Right
-        create_wall_cross(),             # 1: Cross
-        create_wall_end('up'),           # 2: End Up
-        create_wall_end('down'),         # 3: End Down
-        create_wall_end('left'),         # 4: End Left
-        create_wall_end('right'),        # 5: End Right
-        create_ghost_door(),             # 6: Ghost Door
-        create_empty_tile(),             # 7: Empty/Background
-        create_empty_tile()              # 8: Extra empty
+        create_wall_t_junction('right', scale=scale), # 0: T-Junction Right
+        create_wall_cross(scale=scale),             # 1: Cross
+        create_wall_end('up', scale=scale),           # 2: End Up
+        create_wall_end('down', scale=scale),         # 3: End Down
+        create_wall_end('left', scale=scale),         # 4: End Left
+        create_wall_end('right', scale=scale),        # 5: End Right
+        create_ghost_door(scale=scale),             # 6: Ghost Door
+        create_empty_tile(scale=scale),             # 7: Empty/Background
+        create_empty_tile(scale=scale)              # 8: Extra empty
     ]
 
     for col, sprite in enumerate(row2_sprites):
-        x = col * SPRITE_SIZE
-        y = SPRITE_SIZE
-        sprite_sheet.paste(sprite, (x, y))
+        place_sprite(sprite_sheet, sprite, col, 1, cell_size)
 
     return sprite_sheet
 
-def create_sprite_map_json():
+def build_sprite_map(scale=1):
     """
-    Crea un archivo JSON con las coordenadas de cada sprite
+    Construye el diccionario con las coordenadas de cada sprite
     """
     sprite_map = {
         "sprite_size": SPRITE_SIZE,
@@ -406,11 +392,30 @@ def create_sprite_map_json():
         }
     }
 
+    return scale_sprite_map(sprite_map, scale)
+
+def create_tiles_sprite_assets(scales=(1,)):
+    """
+    Crea el sprite sheet y su sprite map a varias escalas (p. ej. 1x/2x/4x)
+    con un único render
+
+    Cada mapa lleva la caja ajustada, la máscara de colisión y el centroide de
+    cada sprite, calculados de la misma imagen que se guarda como PNG
+
+    Returns:
+        lista de (imagen PIL, sprite map), en el mismo orden que `scales`
+    """
+    return render_with_sprite_maps(create_tiles_spritesheet, build_sprite_map, scales)
+
+def create_sprite_map_json(sprite_map, output_path='tiles_sprite_map.json'):
+    """
+    Crea un archivo JSON con las coordenadas y los datos de colisión de cada sprite
+    """
     import json
-    with open('tiles_sprite_map.json', 'w') as f:
+    with open(output_path, 'w') as f:
         json.dump(sprite_map, f, indent=2)
 
-    print("✅ Archivo JSON de mapeo creado: tiles_sprite_map.json")
+    print(f"✅ Archivo JSON de mapeo creado: {output_path}")
 
 def main():
     print("🧱 Generador de Sprites de Tiles del Laberinto")
@@ -418,7 +423,7 @@ def main():
 
     # Generar sprite sheet de tiles
     print("Generando sprite sheet de tiles...")
-    tiles_sheet = create_tiles_spritesheet()
+    tiles_sheet, sprite_map = create_tiles_sprite_assets()[0]
 
     # Guardar sprite sheet
     output_path = 'tiles_spritesheet.png'
@@ -426,7 +431,7 @@ def main():
     print(f"✅ Sprite sheet guardado: {output_path}")
 
     # Crear mapa de sprites (JSON)
-    create_sprite_map_json()
+    create_sprite_map_json(sprite_map)
 
     # Información del sprite sheet
     print("\n📊 Información del Sprite Sheet:")
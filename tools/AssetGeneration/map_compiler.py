@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Compilador de Mapas - Arcade Maze Chomper
+Valida los niveles ASCII (Assets/Maps/level*.txt) y los compila a un formato
+binario versionado (levelN.mzmap) que el cliente y el servidor cargan con una
+sola lectura, sin parsear texto.
+
+El archivo es un único registro de tamaño fijo, little-endian y alineado a 4
+bytes (se puede mapear en memoria tal cual; ver COMPILED_MAP_DTYPE):
+
+    offset  tipo          campo
+    0       char[4]       magic 'MZMP'
+    4       u16           version
+    6       u8, u8        width, height
+    8       u8, u8        fila y columna del spawn del jugador ('P')
+    10      u8, u8        número de spawns de fantasmas y de túneles usados
+    12      u8, u8        capacidad de spawns de fantasmas y de túneles
+    14      u16           puntos a comer (puntos + power pellets)
+    16      u32[height]   paredes ('#'): una fila por u32, bit c = columna c
+    ...     u32[height]   puertas de fantasmas ('-')
+    ...     u32[height]   puntos ('.')
+    ...     u32[height]   power pellets ('o')
+    ...     u32[height]   frutas ('F')
+    ...     u8[G][2]      spawns de fantasmas (fila, columna) en orden de lectura
+    ...     u8[T][4]      túneles (fila, columna) <-> (fila, columna)
+
+Un túnel une dos celdas de bordes opuestos que no son pared: el juego envuelve
+el movimiento de un borde al otro (Ghost.CanMove, AStarPathfinder).
+"""
+
+import os
+
+import numpy as np
+
+from generate_tile_maps import MAP_HEIGHT, MAP_WIDTH, MAPS_DIR, level_files, level_grid
+
+# Configuración
+MAGIC = b'MZMP'
+FORMAT_VERSION = 1
+COMPILED_SUFFIX = '.mzmap'
+MAX_GHOST_SPAWNS = 32
+MAX_TUNNELS = 16
+
+# Caracteres de los mapas (Constants.cs)
+WALL_CHAR = '#'
+GHOST_DOOR_CHAR = '-'
+SMALL_DOT_CHAR = '.'
+POWER_PELLET_CHAR = 'o'
+FRUIT_CHAR = 'F'
+PACMAN_CHAR = 'P'
+GHOST_CHAR = 'G'
+EMPTY_CHAR = ' '
+MAP_CHARS = {WALL_CHAR, GHOST_DOOR_CHAR, SMALL_DOT_CHAR, POWER_PELLET_CHAR, FRUIT_CHAR,
+             PACMAN_CHAR, GHOST_CHAR, EMPTY_CHAR}
+
+# Capas de bits en el orden del archivo
+LAYERS = [
+    ('walls', WALL_CHAR),
+    ('ghost_doors', GHOST_DOOR_CHAR),
+    ('dots', SMALL_DOT_CHAR),
+    ('power_pellets', POWER_PELLET_CHAR),
+    ('fruits', FRUIT_CHAR),
+]
+
+COMPILED_MAP_DTYPE = np.dtype([
+    ('magic', 'S4'),
+    ('version', '<u2'),
+    ('width', 'u1'),
+    ('height', 'u1'),
+    ('pacman', 'u1', (2,)),
+    ('ghost_count', 'u1'),
+    ('tunnel_count', 'u1'),
+    ('ghost_capacity', 'u1'),
+    ('tunnel_capacity', 'u1'),
+    ('dot_count', '<u2'),
+] + [(name, '<u4', (MAP_HEIGHT,)) for name, _ in LAYERS] + [
+    ('ghosts', 'u1', (MAX_GHOST_SPAWNS, 2)),
+    ('tunnels', 'u1', (MAX_TUNNELS, 4)),
+])
+
+def pack_rows(mask):
+    """
+    Empaqueta una máscara (alto, ancho) en un u32 por fila (bit c = columna c)
+    """
+    padded = np.zeros((mask.shape[0], 32), dtype=bool)
+    padded[:, :mask.shape[1]] = mask
+    return np.packbits(padded, axis=1, bitorder='little').view('<u4').ravel()
+
+def unpack_rows(rows, width=MAP_WIDTH):
+    """Inversa de pack_rows: u32 por fila -> máscara (alto, ancho)"""
+    bits = np.unpackbits(np.ascontiguousarray(rows, dtype='<u4').view(np.uint8).reshape(-1, 4),
+                         axis=1, bitorder='little')
+    return bits[:, :width].astype(bool)
+
+def find_tunnels(walls):
+    """
+    Túneles de un mapa: pares de celdas de bordes opuestos que no son pared
+
+    Returns:
+        lista de (fila, columna, fila, columna)
+    """
+    height, width = walls.shape
+    rows = np.flatnonzero(~walls[:, 0] & ~walls[:, -1])
+    cols = np.flatnonzero(~walls[0] & ~walls[-1])
+    return ([(int(row), 0, int(row), width - 1) for row in rows] +
+            [(0, int(col), height - 1, int(col)) for col in cols])
+
+def validate_level(lines):
+    """
+    Comprueba un nivel ASCII
+
+    Returns:
+        lista de problemas encontrados (vacía si el nivel es válido)
+    """
+    try:
+        grid = level_grid(lines)
+    except ValueError as error:
+        return [str(error)]
+
+    problems = []
+    unknown = sorted(set(np.unique(grid).tolist()) - MAP_CHARS)
+    if unknown:
+        problems.append(f"Caracteres desconocidos: {', '.join(repr(c) for c in unknown)}")
+
+    pacman = np.argwhere(grid == PACMAN_CHAR)
+    if len(pacman) != 1:
+        problems.append(f"Se esperaba un spawn '{PACMAN_CHAR}', hay {len(pacman)}")
+
+    ghosts = np.count_nonzero(grid == GHOST_CHAR)
+    if not 1 <= ghosts <= MAX_GHOST_SPAWNS:
+        problems.append(f"Spawns '{GHOST_CHAR}': se esperaban entre 1 y {MAX_GHOST_SPAWNS}, hay {ghosts}")
+
+    if not np.isin(grid, [SMALL_DOT_CHAR, POWER_PELLET_CHAR]).any():
+        problems.append("El nivel no tiene puntos que comer")
+
+    # Un borde abierto sin celda abierta enfrente llevaría al jugador dentro de una pared
+    walls = grid == WALL_CHAR
+    open_rows = ~walls[:, 0] ^ ~walls[:, -1]
+    open_cols = ~walls[0] ^ ~walls[-1]
+    for row in np.flatnonzero(open_rows):
+        problems.append(f"Fila {row + 1}: borde abierto sin túnel al otro lado")
+    for col in np.flatnonzero(open_cols):
+        problems.append(f"Columna {col + 1}: borde abierto sin túnel al otro lado")
+
+    tunnels = find_tunnels(walls)
+    if len(tunnels) > MAX_TUNNELS:
+        problems.append(f"Demasiados túneles: máximo {MAX_TUNNELS}, hay {len(tunnels)}")
+
+    return problems
+
+def compile_level(lines):
+    """
+    Compila un nivel ASCII al formato binario
+
+    Args:
+        lines: líneas del archivo del nivel (ver generate_tile_maps.read_level)
+
+    Returns:
+        bytes del archivo .mzmap (COMPILED_MAP_DTYPE.itemsize bytes)
+
+    Raises:
+        ValueError: si el nivel no es válido (con todos los problemas encontrados)
+    """
+    problems = validate_level(lines)
+    if problems:
+        raise ValueError("Nivel inválido:\n  - " + "\n  - ".join(problems))
+
+    grid = level_grid(lines)
+    walls = grid == WALL_CHAR
+    ghosts = np.argwhere(grid == GHOST_CHAR)  # Orden de lectura, igual que GetGhostSpawns
+    tunnels = find_tunnels(walls)
+
+    record = np.zeros((), dtype=COMPILED_MAP_DTYPE)
+    record['magic'] = MAGIC
+    record['version'] = FORMAT_VERSION
+    record['width'] = MAP_WIDTH
+    record['height'] = MAP_HEIGHT
+    record['pacman'] = np.argwhere(grid == PACMAN_CHAR)[0]
+    record['ghost_count'] = len(ghosts)
+    record['tunnel_count'] = len(tunnels)
+    record['ghost_capacity'] = MAX_GHOST_SPAWNS
+    record['tunnel_capacity'] = MAX_TUNNELS
+    record['dot_count'] = np.count_nonzero(np.isin(grid, [SMALL_DOT_CHAR, POWER_PELLET_CHAR]))
+    for name, char in LAYERS:
+        record[name] = pack_rows(grid == char)
+    record['ghosts'][:len(ghosts)] = ghosts
+    if tunnels:
+        record['tunnels'][:len(tunnels)] = tunnels
+    return record.tobytes()
+
+def load_compiled(data):
+    """
+    Lee un .mzmap (bytes o np.memmap) como registro de COMPILED_MAP_DTYPE, sin copia
+
+    Raises:
+        ValueError: si el archivo no es un mapa compilado de esta versión
+    """
+    if len(data) != COMPILED_MAP_DTYPE.itemsize:
+        raise ValueError(f"Tamaño incorrecto: se esperaban {COMPILED_MAP_DTYPE.itemsize} bytes, hay {len(data)}")
+    record = np.frombuffer(data, dtype=COMPILED_MAP_DTYPE)[0]
+    if record['magic'] != MAGIC or record['version'] != FORMAT_VERSION:
+        raise ValueError(f"Formato desconocido: {record['magic']!r} versión {record['version']}")
+    return record
+
+def compiled_filename(level_filename):
+    """'level1.txt' -> 'level1.mzmap'"""
+    return os.path.splitext(level_filename)[0] + COMPILED_SUFFIX
+
+def main():
+    print("🗜️  Compilador de Mapas")
+    print("=" * 50)
+
+    levels = level_files()
+    if not levels:
+        print(f"⚠️  No hay niveles en {MAPS_DIR}")
+        return
+
+    for level_filename, lines in levels:
+        problems = validate_level(lines)
+        if problems:
+            print(f"❌ {level_filename}:")
+            for problem in problems:
+                print(f"   - {problem}")
+            continue
+
+        data = compile_level(lines)
+        output_path = compiled_filename(level_filename)
+        with open(output_path, 'wb') as f:
+            f.write(data)
+
+        record = load_compiled(data)
+        text_size = sum(len(line) + 1 for line in lines)
+        print(f"✅ Guardado: {output_path} ({len(data)} bytes, texto: {text_size} bytes, "
+              f"{record['dot_count']} puntos, {record['ghost_count']} spawns, "
+              f"{record['tunnel_count']} túneles)")
+
+    print("\n✨ ¡Compilación completada!")
+
+if __name__ == "__main__":
+    main()
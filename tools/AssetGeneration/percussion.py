@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Canal de Ruido y Percusión Chiptune
+Usado por generate_music.py
+
+El ruido no sale de un generador aleatorio sino de un LFSR de 15 bits como el
+canal de ruido de las consolas de 8 bits: en modo 'long' la secuencia dura
+32767 pasos (ruido blanco), en modo 'short' solo 93 (ruido metálico, tonal).
+Cada secuencia se calcula una sola vez (caché de solo lectura) y el LFSR corre
+libre a su frecuencia de reloj: la muestra k lee el paso k * reloj // SAMPLE_RATE.
+Ese flujo se precalcula para NOISE_LOOP muestras y la muestra absoluta k usa
+la posición k % NOISE_LOOP, así cada golpe suena distinto y el resultado es el
+mismo en cada build y en cualquier bloque.
+
+Cada instrumento (kick, snare, hi-hat) es un golpe de longitud fija: un tono
+opcional con barrido de afinación y ruido del LFSR, bajo un envelope de caída.
+Un patrón de batería completo es una sola voz: los golpes de todos los
+instrumentos que tocan un bloque se calculan como un arreglo (golpes ×
+muestras): el ruido de cada golpe es una fila contigua del flujo precalculado
+y todos se suman al bloque con un único scatter-add (np.bincount con pesos).
+"""
+
+import collections
+import functools
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from precision import synthesis_dtype
+
+# Configuración
+SAMPLE_RATE = 44100
+LFSR_BITS = 15
+LFSR_TAPS = {'long': 1, 'short': 6}         # Bit que se combina (XOR) con el bit 0
+LFSR_PERIODS = {'long': 32767, 'short': 93}  # Pasos hasta repetir desde el registro 1
+NOISE_LOOP = 65536  # Muestras del flujo de ruido precalculado (~1.5 s)
+DRUM_CACHE_SIZE = 16
+
+#   duration: segundos del golpe; decay: constante de tiempo de la caída (s)
+#   noise_mode: 'long' o 'short'; noise_clock: pasos del LFSR por segundo
+#   noise_level: nivel del ruido; tone_start/tone_end: barrido del tono (Hz)
+#   tone_level: nivel del tono (0 = solo ruido)
+DrumSpec = collections.namedtuple('DrumSpec', ['duration', 'decay', 'noise_mode', 'noise_clock',
+                                               'noise_level', 'tone_start', 'tone_end',
+                                               'tone_level'])
+
+# Relojes tomados de los periodos del canal de ruido del NES (1.789773 MHz / periodo)
+DRUM_KIT = {
+    'kick': DrumSpec(duration=0.12, decay=0.035, noise_mode='long', noise_clock=7457,
+                     noise_level=0.15, tone_start=160, tone_end=45, tone_level=1.0),
+    'snare': DrumSpec(duration=0.15, decay=0.045, noise_mode='long', noise_clock=111861,
+                      noise_level=0.8, tone_start=190, tone_end=170, tone_level=0.35),
+    'hat': DrumSpec(duration=0.05, decay=0.012, noise_mode='short', noise_clock=447443,
+                    noise_level=0.5, tone_start=0, tone_end=0, tone_level=0.0),
+}
+
+# Caracteres de un patrón por pasos: 'X' acento, 'x' golpe normal, '.' silencio
+STEP_VELOCITIES = {'X': 1.0, 'x': 0.6, '.': 0.0}
+
+@functools.lru_cache(maxsize=4)
+def _build_lfsr_sequence(mode, dtype_name):
+    """
+    Un periodo completo del LFSR como ruido ±1 centrado (versión cacheada, de solo lectura)
+
+    El bit de salida s[n] cumple s[n + 15] = s[n] XOR s[n + tap]; se calcula
+    por tramos de 15 - tap bits, que solo dependen de bits ya calculados.
+    """
+    tap = LFSR_TAPS[mode]
+    period = LFSR_PERIODS[mode]
+    bits = np.zeros(period + LFSR_BITS, dtype=np.uint8)
+    bits[0] = 1  # Registro inicial 1, como al encender la consola
+    chunk = LFSR_BITS - tap
+    for n in range(0, period, chunk):
+        count = min(chunk, period - n)
+        np.bitwise_xor(bits[n:n + count], bits[n + tap:n + tap + count],
+                       out=bits[n + LFSR_BITS:n + LFSR_BITS + count])
+
+    sequence = 1.0 - 2.0 * bits[:period]
+    sequence -= sequence.mean()  # El modo 'short' no tiene media 0: sin componente continua
+    sequence = sequence.astype(dtype_name)
+    sequence.flags.writeable = False
+    return sequence
+
+def lfsr_sequence(mode, dtype=None):
+    """
+    Periodo del LFSR (compartido, no modificar)
+
+    Args:
+        mode: 'long' (32767 pasos) o 'short' (93 pasos)
+        dtype: dtype del ruido (por defecto el de síntesis)
+    """
+    dtype = synthesis_dtype() if dtype is None else np.dtype(dtype)
+    return _build_lfsr_sequence(mode, dtype.name)
+
+@functools.lru_cache(maxsize=DRUM_CACHE_SIZE)
+def _build_noise_stream(mode, clock, dtype_name):
+    """
+    NOISE_LOOP muestras del LFSR corriendo libre a `clock` pasos por segundo
+    (versión cacheada, de solo lectura)
+    """
+    sequence = lfsr_sequence(mode, dtype_name)
+    steps = np.arange(NOISE_LOOP, dtype=np.int64) * clock // SAMPLE_RATE
+    stream = sequence[steps % len(sequence)]
+    stream.flags.writeable = False
+    return stream
+
+def noise_stream(mode, clock, dtype=None):
+    """
+    Ruido del LFSR muestreado a SAMPLE_RATE (compartido, no modificar); la
+    muestra absoluta k del canal de ruido es stream[k % NOISE_LOOP]
+
+    Args:
+        mode: 'long' o 'short'
+        clock: pasos del LFSR por segundo
+    """
+    dtype = synthesis_dtype() if dtype is None else np.dtype(dtype)
+    return _build_noise_stream(mode, int(clock), dtype.name)
+
+@functools.lru_cache(maxsize=DRUM_CACHE_SIZE)
+def _build_drum_shapes(spec, dtype_name):
+    """
+    Partes fijas de un golpe (versión cacheada, de solo lectura)
+
+    Returns:
+        (tono × envelope, nivel de ruido × envelope): el ruido cambia en cada
+        golpe, el resto es igual en todos
+    """
+    num_samples = int(SAMPLE_RATE * spec.duration)
+    t = np.arange(num_samples) / SAMPLE_RATE
+    # Caída exponencial que termina exactamente en 0 (sin clic al final)
+    envelope = np.exp(-t / spec.decay) * (1 - t / spec.duration)
+
+    tone = np.zeros(num_samples)
+    if spec.tone_level:
+        # Barrido exponencial de la afinación, fase acumulada desde 0 en cada golpe
+        frequency = spec.tone_start * (spec.tone_end / spec.tone_start) ** (t / spec.duration)
+        tone = spec.tone_level * np.sin(2 * np.pi * np.cumsum(frequency) / SAMPLE_RATE)
+
+    tone_shape = (tone * envelope).astype(dtype_name)
+    noise_shape = (spec.noise_level * envelope).astype(dtype_name)
+    tone_shape.flags.writeable = False
+    noise_shape.flags.writeable = False
+    return tone_shape, noise_shape
+
+def drum_shapes(spec, dtype=None):
+    """Tono y nivel de ruido con envelope de un instrumento (compartidos, no modificar)"""
+    dtype = synthesis_dtype() if dtype is None else np.dtype(dtype)
+    return _build_drum_shapes(spec, dtype.name)
+
+def schedule_steps(steps, step_duration, length, hit_length):
+    """
+    Golpes de un patrón por pasos repetido a lo largo de `length` muestras
+
+    Los pasos se colocan en la misma rejilla de muestras que las notas
+    (instante redondeado una sola vez) y se descartan los golpes que no
+    terminan antes de `length`, así un bucle no corta ningún golpe.
+
+    Args:
+        steps: cadena de pasos, p. ej. 'X...x...' (ver STEP_VELOCITIES)
+        step_duration: segundos por paso
+        length: longitud de la voz en muestras
+        hit_length: duración del golpe en muestras
+
+    Returns:
+        (posiciones, velocidades) de los golpes que suenan
+    """
+    levels = np.array([STEP_VELOCITIES[step] for step in steps])
+    num_steps = int(length / (SAMPLE_RATE * step_duration)) + 1
+    step_index = np.arange(num_steps)
+    positions = np.rint(step_index * step_duration * SAMPLE_RATE).astype(np.int64)
+    velocities = levels[step_index % len(steps)]
+    sounding = (velocities > 0) & (positions + hit_length <= length)
+    return positions[sounding], velocities[sounding]
+
+def drum_pattern_voice(pattern, step_duration, length, volume=0.3, kit=DRUM_KIT):
+    """
+    Crea una voz con un patrón de batería completo (todos los instrumentos)
+
+    Una voz es un par (add_to, length) como las de generate_music.py.
+
+    Args:
+        pattern: diccionario instrumento -> cadena de pasos,
+                 p. ej. {'kick': 'X...X...', 'hat': '..x...x.'}
+        step_duration: segundos por paso (BEAT_DURATION / 4 para semicorcheas)
+        length: longitud total de la voz en muestras
+        volume: volumen de la voz
+        kit: instrumentos disponibles (DrumSpec por nombre)
+    """
+    names = list(pattern)
+    specs = [kit[name] for name in names]
+    shapes = [drum_shapes(spec) for spec in specs]
+    max_length = max(len(tone) for tone, _ in shapes)
+
+    # Formas de todos los instrumentos, rellenas con ceros hasta el golpe más largo
+    dtype = synthesis_dtype()
+    tone_shapes = np.zeros((len(specs), max_length), dtype=dtype)
+    noise_shapes = np.zeros((len(specs), max_length), dtype=dtype)
+    for row, (tone, noise) in enumerate(shapes):
+        tone_shapes[row, :len(tone)] = tone
+        noise_shapes[row, :len(noise)] = noise
+
+    # Flujos de ruido de todos los instrumentos en una tabla, cada uno seguido
+    # de su propio comienzo para que un golpe que cruza el final lea una fila contigua
+    streams = [noise_stream(spec.noise_mode, spec.noise_clock) for spec in specs]
+    noise_table = np.concatenate([np.concatenate((stream, stream[:max_length - 1]))
+                                  for stream in streams])
+    noise_rows = sliding_window_view(noise_table, max_length)
+    noise_bases = np.arange(len(specs), dtype=np.int64) * (NOISE_LOOP + max_length - 1)
+
+    # Golpes de todos los instrumentos, ordenados por posición
+    hits = [schedule_steps(pattern[name], step_duration, length, len(tone))
+            for name, (tone, _) in zip(names, shapes)]
+    positions = np.concatenate([hit_positions for hit_positions, _ in hits])
+    velocities = np.concatenate([hit_velocities for _, hit_velocities in hits]) * volume
+    instruments = np.concatenate([np.full(len(hit_positions), row, dtype=np.intp)
+                                  for row, (hit_positions, _) in enumerate(hits)])
+    order = np.argsort(positions, kind='stable')
+    positions, velocities, instruments = positions[order], velocities[order], instruments[order]
+    velocities = velocities.astype(dtype)[:, None]
+    noise_starts = noise_bases[instruments] + positions % NOISE_LOOP
+    offsets = np.arange(max_length, dtype=np.int64)
+
+    def add_to(out, start):
+        stop = start + len(out)
+        first = np.searchsorted(positions, start - max_length, side='right')
+        last = np.searchsorted(positions, stop, side='left')
+        if first >= last:
+            return
+
+        # Golpes que tocan el bloque (golpes × muestras)
+        hit = slice(first, last)
+        row = instruments[hit]
+        values = noise_rows[noise_starts[hit]]
+        values *= noise_shapes[row]
+        values += tone_shapes[row]
+        values *= velocities[hit]
+
+        # Un solo scatter-add para todos los golpes (se suman donde se solapan)
+        # sobre el bloque con un margen de un golpe a cada lado: lo que cae en
+        # el margen pertenece a los bloques vecinos y se descarta. np.bincount
+        # con pesos es el scatter-add vectorizado (np.add.at es mucho más lento)
+        index = (positions[hit] - start + max_length)[:, None] + offsets
+        mixed = np.bincount(index.ravel(), weights=values.ravel(),
+                            minlength=len(out) + 2 * max_length)
+        out += mixed[max_length:max_length + len(out)]
+
+    return add_to, length
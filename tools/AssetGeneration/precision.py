@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Precisión Numérica de la Síntesis de Audio
+Usado por envelopes.py, wavetables.py, generate_sound_effects.py y generate_music.py
+
+La salida final es PCM de 16 bits, así que sintetizar en float64 solo duplica
+el tráfico de memoria. Por defecto osciladores, envelopes y mezclas trabajan en
+float32; float64 queda como referencia (el camino original, sin cambios) para
+la comprobación de paridad de build_assets.py --parity.
+
+Las fases no se acumulan en coma flotante: un acumulador de punto fijo uint64
+(PHASE_BITS bits fraccionarios de ciclo) envuelve exactamente cada ciclo, así
+la fase no pierde precisión por larga que sea la nota, aunque el resto del
+camino sea float32.
+"""
+
+import contextlib
+import numpy as np
+
+# Configuración
+DEFAULT_DTYPE = np.float32    # Precisión de síntesis por defecto
+REFERENCE_DTYPE = np.float64  # Camino de referencia (paridad)
+PHASE_BITS = 52               # Bits fraccionarios del acumulador de fase (ciclos)
+
+_settings = {'dtype': np.dtype(DEFAULT_DTYPE)}
+
+def synthesis_dtype():
+    """dtype con el que se sintetiza actualmente (np.dtype)"""
+    return _settings['dtype']
+
+def is_reference():
+    """True si se sintetiza por el camino float64 de referencia"""
+    return _settings['dtype'] == np.dtype(REFERENCE_DTYPE)
+
+@contextlib.contextmanager
+def synthesis_precision(dtype):
+    """
+    Cambia temporalmente el dtype de síntesis
+
+    Uso:
+        with synthesis_precision(np.float64):
+            wave = create_chomp_sound()
+    """
+    previous = _settings['dtype']
+    _settings['dtype'] = np.dtype(dtype)
+    try:
+        yield
+    finally:
+        _settings['dtype'] = previous
+
+def phase_increment(cycles_per_sample):
+    """
+    Avance de fase por muestra en punto fijo (uint64), envuelto a un ciclo
+
+    Args:
+        cycles_per_sample: escalar o arreglo (frecuencia / sample_rate)
+    """
+    return np.rint(np.mod(cycles_per_sample, 1.0) * 2 ** PHASE_BITS).astype(np.uint64)
+
+def phase_accumulator(cycles_per_sample, num_samples):
+    """
+    Fase de un tono de frecuencia fija como acumulador de punto fijo
+
+    La multiplicación uint64 desborda módulo 2**64, múltiplo de un ciclo
+    (2**PHASE_BITS), así que la fase queda envuelta de forma exacta.
+
+    Args:
+        cycles_per_sample: escalar, o columna (N, 1) para N tonos a la vez
+
+    Returns:
+        arreglo uint64 (muestras,) o (N, muestras); usar accumulator_cycles()
+        o wavetable_oscillator()
+    """
+    return np.arange(num_samples, dtype=np.uint64) * phase_increment(cycles_per_sample)
+
+def sweep_accumulator(cycles_per_sample):
+    """
+    Fase de un barrido (frecuencia variable por muestra) como acumulador de
+    punto fijo: equivale a np.cumsum(cycles_per_sample) envuelto en cada ciclo
+    (sobre el último eje, una fila por barrido si es 2-D)
+    """
+    return np.cumsum(phase_increment(cycles_per_sample), axis=-1, dtype=np.uint64)
+
+def accumulator_cycles(accumulator, dtype=None):
+    """Fase envuelta en [0, 1) ciclos, en el dtype de síntesis"""
+    dtype = synthesis_dtype() if dtype is None else np.dtype(dtype)
+    cycles = (accumulator & np.uint64(2 ** PHASE_BITS - 1)).astype(dtype)
+    cycles *= dtype.type(2.0 ** -PHASE_BITS)
+    return cycles
+
+def max_lsb_difference(reference, candidate):
+    """
+    Máxima diferencia absoluta entre dos señales PCM enteras, en LSB
+
+    Si las longitudes difieren devuelve None (no son comparables)
+    """
+    reference = np.asarray(reference, dtype=np.int32)
+    candidate = np.asarray(candidate, dtype=np.int32)
+    if reference.shape != candidate.shape:
+        return None
+    if reference.size == 0:
+        return 0
+    return int(np.abs(reference - candidate).max())
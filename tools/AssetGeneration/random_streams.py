@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Flujos Aleatorios Deterministas por Asset
+Usado por generate_sound_effects.py y variants.py
+
+El ruido (textura de los efectos) no debe usar el estado global de np.random: cada
+render daría un archivo distinto y ni la caché de build_assets.py ni
+build_assets.py --verify podrían distinguir un cambio real del azar. Cada
+asset obtiene su propia semilla a partir de su nombre, así el resultado es
+idéntico en cada build, independiente del orden o del proceso que lo renderice.
+"""
+
+import hashlib
+import numpy as np
+
+# Cambiar este valor regenera todo el ruido de todos los assets
+SEED_NAMESPACE = 'arcade-maze-chomper/1'
+
+def asset_seed(name):
+    """
+    Semilla entera estable (64 bits) para un asset, p. ej. 'background-theme.wav'
+    """
+    digest = hashlib.sha256(f'{SEED_NAMESPACE}/{name}'.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'little')
+
+def asset_rng(name, *stream):
+    """
+    Generator de NumPy propio de un asset
+
+    Args:
+        name: nombre del asset (archivo de salida)
+        stream: enteros opcionales para derivar subflujos independientes
+                (p. ej. VARIANT_STREAM de variants.py)
+
+    Returns:
+        np.random.Generator con la misma secuencia en cada ejecución
+    """
+    return np.random.default_rng((asset_seed(name), *stream))
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Síntesis de Recetas en Tiempo Real por Bloques
+Usa las recetas de sound_recipes.py (las mismas que generate_sound_effects.py)
+
+Para previsualizar un efecto procedural o parametrizado no hace falta
+renderizarlo entero: RecipeVoice lo sintetiza bloque a bloque, en el orden en
+que lo pide el callback de audio, sobre un ring buffer que aporta quien llama.
+
+Todo lo que depende de la receta (incrementos de fase, tablas de onda,
+envelopes) se prepara al crear la voz, y los buffers de trabajo se reservan
+una sola vez para el tamaño de bloque: renderizar un bloque solo ejecuta
+ufuncs con out= sobre esos buffers, sin reservar memoria. Las operaciones son
+las mismas, en el mismo orden, que las del render offline, así que la salida
+por bloques es idéntica bit a bit a render_recipe() (camino float32).
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+import numpy as np
+
+from envelopes import get_envelope
+from precision import PHASE_BITS, phase_increment, synthesis_dtype
+from sound_recipes import SOUND_RECIPES, recipe_length
+from wavetables import INDEX_BITS, TABLE_SIZE, get_wavetable
+
+# Configuración
+SAMPLE_RATE = 44100        # Misma tasa que los generadores offline
+BLOCK_SIZE = 256           # Muestras por bloque (5.8 ms a 44.1 kHz)
+RING_BLOCKS = 8            # Bloques en el ring buffer por defecto
+BENCHMARK_BLOCK_SIZES = [64, 128, 256, 512]
+BENCHMARK_REPEATS = 5      # Pasadas por receta; se toma el percentil sobre todas
+
+PHASE_MASK = np.uint64(2 ** PHASE_BITS - 1)
+FRACTION_BITS = np.uint64(PHASE_BITS - INDEX_BITS)
+FRACTION_MASK = np.uint64(2 ** (PHASE_BITS - INDEX_BITS) - 1)
+
+def create_ring_buffer(blocks=RING_BLOCKS, block_size=BLOCK_SIZE, dtype=None):
+    """Ring buffer vacío de `blocks` bloques, en el dtype de síntesis"""
+    dtype = synthesis_dtype() if dtype is None else np.dtype(dtype)
+    return np.zeros(blocks * block_size, dtype=dtype)
+
+class RecipeVoice:
+    """
+    Una receta en reproducción: renderiza sus muestras bloque a bloque
+
+    Los parámetros pitch, duty y envelope equivalen a una fila de variants.py
+    (factor de frecuencia, desplazamiento del ciclo de trabajo de las ondas
+    cuadradas y factor de attack/decay/release); con sus valores por defecto
+    la voz suena igual que el efecto original.
+    """
+
+    def __init__(self, recipe, block_size=BLOCK_SIZE, sample_rate=SAMPLE_RATE,
+                 pitch=1.0, duty=0.0, envelope=1.0):
+        self.block_size = block_size
+        self.sample_rate = sample_rate
+        self.dtype = synthesis_dtype()
+        self.length = recipe_length(recipe, sample_rate)
+        self._segments = [self._prepare(segment, pitch, duty, envelope) for segment in recipe]
+
+        # Buffers de trabajo: se reservan aquí y se reutilizan en cada bloque
+        self._ramp = np.arange(block_size, dtype=np.uint64)
+        self._time_ramp = np.arange(block_size, dtype=np.float64)
+        self._phases = np.empty(block_size, dtype=np.uint64)
+        self._bits = np.empty(block_size, dtype=np.uint64)
+        self._index = np.empty(block_size, dtype=np.intp)
+        self._times = np.empty(block_size, dtype=np.float64)
+        self._fraction = np.empty(block_size, dtype=self.dtype)
+        self._scratch = np.empty(block_size, dtype=self.dtype)
+        self._mix = np.empty(block_size, dtype=self.dtype)
+        self.reset()
+
+    def _prepare(self, segment, pitch, duty, envelope):
+        """Estado constante de un segmento: incremento de fase, tabla y envelope"""
+        num_samples = int(self.sample_rate * segment.duration)
+        frequency = segment.frequency * pitch
+        prepared = {'waveform': segment.waveform, 'length': num_samples,
+                    'envelope': None, 'table': None, 'increment': None}
+        if segment.waveform == 'silence':
+            return prepared
+
+        if segment.waveform == 'sweep':
+            prepared['sweep'] = (segment.frequency, segment.end_frequency, segment.duration, pitch,
+                                 segment.duration / num_samples)
+        elif segment.waveform == 'sine':
+            prepared['increment'] = phase_increment(frequency * segment.duration / num_samples)
+        else:
+            prepared['increment'] = phase_increment(frequency * (segment.duration / num_samples))
+            prepared['table'] = get_wavetable(segment.waveform, frequency,
+                                              sample_rate=self.sample_rate, dtype=self.dtype,
+                                              duty=0.5 + duty)
+        if segment.envelope is not None:
+            attack, decay, sustain_level, release = segment.envelope
+            prepared['envelope'] = get_envelope(num_samples, attack * envelope, decay * envelope,
+                                                sustain_level, release * envelope,
+                                                self.sample_rate, self.dtype)
+        return prepared
+
+    def reset(self):
+        """Vuelve al principio de la receta"""
+        self.position = 0
+        self._segment = 0
+        self._segment_start = 0
+        self._sweep_phase = np.uint64(0)
+
+    @property
+    def finished(self):
+        return self.position >= self.length
+
+    def render(self, out, mix=False):
+        """
+        Renderiza las siguientes len(out) muestras (como mucho block_size)
+
+        Tras el final de la receta el resto del bloque es silencio.
+
+        Args:
+            out: arreglo destino del dtype de síntesis (p. ej. un bloque del ring buffer)
+            mix: suma la voz a lo que ya hay en `out` en lugar de sobrescribirlo
+
+        Returns:
+            número de muestras de la receta escritas (menos que len(out) al terminar)
+        """
+        count = len(out)
+        if count > self.block_size:
+            raise ValueError(f"El bloque ({count}) supera block_size ({self.block_size})")
+        target = self._mix[:count] if mix else out
+
+        written = 0
+        while written < count and self._segment < len(self._segments):
+            segment = self._segments[self._segment]
+            offset = self.position - self._segment_start
+            span = min(count - written, segment['length'] - offset)
+            if span > 0:
+                self._render_segment(segment, offset, target[written:written + span])
+                written += span
+                self.position += span
+            if offset + span >= segment['length']:
+                self._segment += 1
+                self._segment_start += segment['length']
+                self._sweep_phase = np.uint64(0)
+
+        if mix:
+            out[:written] += target[:written]
+        else:
+            out[written:] = 0.0
+        return written
+
+    def _render_segment(self, segment, offset, out):
+        """Muestras [offset, offset + len(out)) de un segmento, sobre buffers reutilizados"""
+        count = len(out)
+        waveform = segment['waveform']
+        if waveform == 'silence':
+            out.fill(0.0)
+            return
+
+        phases = self._phases[:count]
+        if waveform == 'sweep':
+            self._sweep_phases(segment, offset, phases)
+        else:
+            # Fase de punto fijo en la posición absoluta: (offset + k) * incremento
+            np.add(self._ramp[:count], np.uint64(offset), out=phases)
+            phases *= segment['increment']
+
+        if segment['table'] is None:
+            # Seno de la fase envuelta (igual que sine_from_accumulator)
+            np.bitwise_and(phases, PHASE_MASK, out=phases)
+            np.copyto(out, phases, casting='unsafe')
+            out *= self.dtype.type(2.0 ** -PHASE_BITS)
+            out *= self.dtype.type(2 * np.pi)
+            np.sin(out, out=out)
+        else:
+            # Wavetable con interpolación lineal (igual que wavetable_oscillator)
+            table, slopes = segment['table']
+            bits = self._bits[:count]
+            index = self._index[:count]
+            fraction = self._fraction[:count]
+            np.right_shift(phases, FRACTION_BITS, out=bits)
+            np.copyto(index, bits, casting='unsafe')
+            index &= TABLE_SIZE - 1
+            np.bitwise_and(phases, FRACTION_MASK, out=bits)
+            np.copyto(fraction, bits, casting='unsafe')
+            fraction *= self.dtype.type(2.0 ** -int(FRACTION_BITS))
+            np.take(slopes, index, out=out, mode='clip')   # 'raise' copiaría vía buffer
+            out *= fraction
+            np.take(table, index, out=self._scratch[:count], mode='clip')
+            out += self._scratch[:count]
+
+        if segment['envelope'] is not None:
+            out *= segment['envelope'][offset:offset + count]
+
+    def _sweep_phases(self, segment, offset, phases):
+        """
+        Fase de un barrido: la frecuencia instantánea se calcula para el bloque
+        y se acumula continuando desde el último bloque (ver generate_sweep_wave)
+        """
+        freq_start, freq_end, duration, pitch, step = segment['sweep']
+        times = self._times[:len(phases)]
+        np.add(self._time_ramp[:len(phases)], offset, out=times)
+        times *= step                  # np.linspace(0, duration, n, False)
+        times /= duration
+        times *= freq_end - freq_start
+        times += freq_start
+        times *= pitch
+        times /= self.sample_rate
+        np.mod(times, 1.0, out=times)
+        times *= 2 ** PHASE_BITS
+        np.rint(times, out=times)
+        np.copyto(phases, times, casting='unsafe')
+        np.cumsum(phases, out=phases)
+        phases += self._sweep_phase
+        self._sweep_phase = phases[-1]
+
+def check_ring_buffer(ring, block_size):
+    """Comprueba que el ring buffer sea 1-D y esté formado por bloques enteros"""
+    if ring.ndim != 1 or len(ring) == 0 or len(ring) % block_size:
+        raise ValueError(f"El ring buffer debe tener un múltiplo de {block_size} muestras "
+                         f"(tiene forma {ring.shape})")
+
+def render_ring_block(voices, ring, write_index, block_size=BLOCK_SIZE):
+    """
+    Mezcla el siguiente bloque de todas las voces en el ring buffer
+
+    Args:
+        voices: voces activas (RecipeVoice); las terminadas aportan silencio
+        ring: ring buffer del que llama (ver create_ring_buffer)
+        write_index: posición de escritura, múltiplo de block_size
+
+    Returns:
+        la siguiente posición de escritura (envuelta al final del ring)
+    """
+    block = ring[write_index:write_index + block_size]
+    block.fill(0.0)
+    for voice in voices:
+        voice.render(block, mix=True)
+    return (write_index + block_size) % len(ring)
+
+def render_voice_blocks(voice, ring):
+    """
+    Renderiza una voz completa en el ring buffer, bloque a bloque
+
+    Generador: produce cada bloque (vista del ring) recién escrito, hasta que la
+    voz termina. Quien consume debe leerlo antes de pedir el siguiente.
+    """
+    check_ring_buffer(ring, voice.block_size)
+    write_index = 0
+    while not voice.finished:
+        block = ring[write_index:write_index + voice.block_size]
+        voice.render(block)
+        yield block
+        write_index = (write_index + voice.block_size) % len(ring)
+
+def render_to_array(recipe, block_size=BLOCK_SIZE, **parameters):
+    """
+    Renderiza una receta entera por bloques (para comparar con render_recipe)
+    """
+    voice = RecipeVoice(recipe, block_size, **parameters)
+    ring = create_ring_buffer(RING_BLOCKS, block_size)
+    out = np.empty(voice.length, dtype=voice.dtype)
+    position = 0
+    for block in render_voice_blocks(voice, ring):
+        count = min(block_size, voice.length - position)
+        out[position:position + count] = block[:count]
+        position += count
+    return out
+
+def benchmark_latency(block_sizes=BENCHMARK_BLOCK_SIZES, repeats=BENCHMARK_REPEATS):
+    """
+    Mide el tiempo de render de cada bloque para todas las recetas
+
+    Returns:
+        lista de (tamaño de bloque, presupuesto en µs, mediana µs, p99 µs,
+                  máximo µs, pico de bytes reservados en el bucle de render);
+        el pico no crece con el tamaño de bloque (solo vistas y escalares)
+    """
+    results = []
+    for block_size in block_sizes:
+        ring = create_ring_buffer(RING_BLOCKS, block_size)
+        voices = [RecipeVoice(recipe, block_size) for recipe in SOUND_RECIPES.values()]
+        timings = []
+        # Como en un hilo de audio: sin pausas del recolector durante el render
+        gc.disable()
+        try:
+            for _ in range(repeats):
+                for voice in voices:
+                    voice.reset()
+                    write_index = 0
+                    while not voice.finished:
+                        start = time.perf_counter_ns()
+                        voice.render(ring[write_index:write_index + block_size])
+                        timings.append(time.perf_counter_ns() - start)
+                        write_index = (write_index + block_size) % len(ring)
+        finally:
+            gc.enable()
+
+        # Memoria reservada durante una pasada completa (sin contar las vistas ya liberadas)
+        tracemalloc.start()
+        for voice in voices:
+            voice.reset()
+            for _ in render_voice_blocks(voice, ring):
+                pass
+        _, allocated = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        timings = np.array(timings) / 1000
+        budget = block_size / SAMPLE_RATE * 1e6
+        results.append((block_size, budget, float(np.median(timings)),
+                        float(np.percentile(timings, 99)), float(timings.max()), allocated))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de latencia de la síntesis por bloques')
+    parser.add_argument('--block-sizes', type=int, nargs='+', default=BENCHMARK_BLOCK_SIZES,
+                        help='Tamaños de bloque a medir (muestras)')
+    parser.add_argument('--repeats', type=int, default=BENCHMARK_REPEATS,
+                        help='Pasadas por receta')
+    args = parser.parse_args()
+
+    print("⏱️  Benchmark de Latencia de Síntesis en Tiempo Real")
+    print("=" * 50)
+    print(f"Recetas: {len(SOUND_RECIPES)} efectos, {SAMPLE_RATE} Hz, {synthesis_dtype().name}")
+    print()
+    print(f"{'Bloque':>8} {'Budget':>10} {'Mediana':>10} {'p99':>10} {'Máximo':>10} {'Memoria':>9}")
+    for block_size, budget, median, p99, worst, allocated in benchmark_latency(args.block_sizes,
+                                                                               args.repeats):
+        print(f"{block_size:>8} {budget:>8.0f}µs {median:>8.1f}µs {p99:>8.1f}µs "
+              f"{worst:>8.1f}µs {allocated:>8}B")
+
+if __name__ == "__main__":
+    main()
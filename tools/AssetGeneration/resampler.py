@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Remuestreo Polifásico Vectorizado
+Usado por generate_sound_effects.py y generate_music.py (perfiles de audio_profiles.py)
+
+Todo el audio se sintetiza a la tasa de los generadores (44.1 kHz) y se lleva
+a la tasa del perfil de salida con un FIR polifásico: un sinc enventanado con
+Kaiser, precalculado como banco de fases (una fila de coeficientes por cada
+posición fraccionaria). Cada muestra de salida es el producto escalar de
+FILTER_TAPS muestras de entrada con la fila de su fase, calculado para un
+bloque entero de salidas a la vez (np.einsum).
+
+Las razones racionales pequeñas (48000/44100 = 160/147, 22050/44100 = 1/2)
+usan fases exactas. Los bucles se remuestrean como señal periódica a una
+longitud entera (la razón exacta puede tener miles de fases); en ese caso se
+interpola linealmente entre las MAX_PHASES fases del banco.
+
+La entrada se lee por rangos con una función read(out, start), así el
+remuestreo también funciona en streaming sobre una mezcla de voces.
+"""
+
+import functools
+import math
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from precision import synthesis_dtype
+
+# Configuración
+FILTER_TAPS = 64     # Muestras de entrada por muestra de salida (par)
+KAISER_BETA = 8.0    # Ventana Kaiser: ~80 dB de atenuación fuera de banda
+ROLLOFF = 0.9        # Corte respecto al Nyquist más bajo de las dos tasas
+MAX_PHASES = 1024    # Fases exactas como máximo; por encima se interpola
+BLOCK_SIZE = 4096    # Muestras de salida por bloque
+
+@functools.lru_cache(maxsize=16)
+def _build_filter_bank(phases, cutoff, dtype_name):
+    """
+    Banco de fases del filtro (versión cacheada, de solo lectura)
+
+    La fila p corresponde a la posición fraccionaria p / phases; hay una fila
+    extra (fracción 1) para poder interpolar entre la última fase y la primera.
+    La columna k multiplica a la entrada en base - FILTER_TAPS/2 + 1 + k.
+    Cada fila suma 1 (ganancia unidad en continua).
+    """
+    half = FILTER_TAPS // 2
+    fractions = np.arange(phases + 1) / phases
+    distances = np.arange(-half + 1, half + 1)[None, :] - fractions[:, None]
+
+    window = np.i0(KAISER_BETA * np.sqrt(np.clip(1 - (distances / half) ** 2, 0, None)))
+    bank = np.sinc(cutoff * distances) * window
+    bank /= bank.sum(axis=1, keepdims=True)
+
+    bank = bank.astype(dtype_name)
+    bank.setflags(write=False)
+    return bank
+
+def get_filter_bank(phases, cutoff, dtype=None):
+    """
+    Obtiene el banco de fases desde la caché (compartido, no modificar)
+
+    Args:
+        phases: número de posiciones fraccionarias
+        cutoff: frecuencia de corte como fracción del Nyquist de entrada
+        dtype: dtype de los coeficientes (por defecto el de síntesis)
+    """
+    dtype = synthesis_dtype() if dtype is None else np.dtype(dtype)
+    return _build_filter_bank(phases, round(cutoff, 12), dtype.name)
+
+def resample_ratio(num_samples, source_rate, target_rate, periodic=False):
+    """
+    Longitud de salida y paso de entrada por muestra de salida (num / den)
+
+    Con periodic=True la señal es un bucle: la salida tiene una longitud entera
+    (la más cercana a la exacta) y el paso encaja exactamente un periodo en
+    ella, así el bucle sigue sin costura a la nueva tasa.
+
+    Returns:
+        (longitud de salida, num, den) con num / den irreducible
+    """
+    if periodic:
+        length = max(1, round(num_samples * target_rate / source_rate))
+        num, den = num_samples, length
+    else:
+        divisor = math.gcd(source_rate, target_rate)
+        num, den = source_rate // divisor, target_rate // divisor
+        length = -(-num_samples * den // num)  # Techo: salidas dentro de la entrada
+    divisor = math.gcd(num, den)
+    return length, num // divisor, den // divisor
+
+def resampled_length(num_samples, source_rate, target_rate, periodic=False):
+    """Número de muestras tras remuestrear (igual a la entrada si las tasas coinciden)"""
+    if source_rate == target_rate:
+        return num_samples
+    return resample_ratio(num_samples, source_rate, target_rate, periodic)[0]
+
+def array_reader(wave):
+    """Función read(out, start) que copia porciones de un arreglo"""
+    def read(out, start):
+        out[:] = wave[start:start + len(out)]
+    return read
+
+def _read_span(read, out, start, num_samples, periodic):
+    """
+    Llena `out` con las muestras de entrada [start, start + len(out))
+
+    Fuera de [0, num_samples) la entrada es silencio, o se envuelve si es periódica.
+    """
+    if periodic:
+        position = 0
+        while position < len(out):
+            index = (start + position) % num_samples
+            count = min(len(out) - position, num_samples - index)
+            read(out[position:position + count], index)
+            position += count
+        return
+
+    out.fill(0.0)
+    lo = max(start, 0)
+    hi = min(start + len(out), num_samples)
+    if hi > lo:
+        read(out[lo - start:hi - start], lo)
+
+def resample_blocks(read, num_samples, source_rate, target_rate, periodic=False, block_size=BLOCK_SIZE):
+    """
+    Genera la señal remuestreada en bloques de tamaño fijo
+
+    Reutiliza el mismo buffer en cada bloque: el consumidor no debe guardarlo.
+
+    Args:
+        read: función read(out, start) que escribe en `out` las muestras de
+              entrada desde la posición absoluta `start`
+        num_samples: longitud de la entrada
+        source_rate: tasa de la entrada
+        target_rate: tasa de salida
+        periodic: la entrada es un bucle (ver resample_ratio)
+    """
+    length, num, den = resample_ratio(num_samples, source_rate, target_rate, periodic)
+    phases = min(den, MAX_PHASES)
+    dtype = synthesis_dtype()
+    bank = get_filter_bank(phases, ROLLOFF * min(1.0, den / num), dtype)
+    half = FILTER_TAPS // 2
+
+    source = np.empty(((block_size - 1) * num) // den + FILTER_TAPS + 1, dtype=dtype)
+    buffer = np.empty(block_size, dtype=dtype)
+
+    for first in range(0, length, block_size):
+        outputs = np.arange(first, min(first + block_size, length), dtype=np.int64)
+        positions = outputs * num
+        bases = positions // den
+        remainders = positions - bases * den
+
+        # Entrada que cubre todas las ventanas del bloque
+        start = int(bases[0]) - half + 1
+        window = source[:int(bases[-1]) + half + 1 - start]
+        _read_span(read, window, start, num_samples, periodic)
+        frames = sliding_window_view(window, FILTER_TAPS)[bases - bases[0]]
+
+        if phases == den:
+            coefficients = bank[remainders]
+        else:
+            scaled = remainders * phases
+            lower = scaled // den
+            weight = ((scaled - lower * den) / den).astype(dtype)[:, None]
+            coefficients = bank[lower] + weight * (bank[lower + 1] - bank[lower])
+
+        block = buffer[:len(outputs)]
+        np.einsum('ij,ij->i', frames, coefficients, out=block)
+        yield block
+
+def resample(wave, source_rate, target_rate, periodic=False):
+    """
+    Remuestrea una onda completa (la misma onda si las tasas coinciden)
+    """
+    if source_rate == target_rate:
+        return wave
+
+    out = np.empty(resampled_length(len(wave), source_rate, target_rate, periodic),
+                   dtype=synthesis_dtype())
+    position = 0
+    for block in resample_blocks(array_reader(wave), len(wave), source_rate, target_rate, periodic):
+        out[position:position + len(block)] = block
+        position += len(block)
+    return out
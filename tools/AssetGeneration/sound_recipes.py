@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Recetas de los Efectos de Sonido
+Usado por generate_sound_effects.py (render offline) y realtime_synth.py (render por bloques)
+
+Cada efecto es una secuencia de segmentos consecutivos: un oscilador (o un
+barrido, o silencio) de duración fija con su envelope ADSR. Al ser datos y no
+código, la misma receta se puede renderizar de una vez a un WAV o bloque a
+bloque en tiempo real, y una receta nueva (o modificada) se prueba sin tocar
+los generadores.
+"""
+
+import collections
+
+# Tiempos en segundos; sustain_level entre 0 y 1
+Envelope = collections.namedtuple('Envelope', ['attack', 'decay', 'sustain_level', 'release'])
+
+#   waveform: 'sine', 'square', 'triangle', 'sawtooth', 'sweep' (seno de frequency
+#             a end_frequency) o 'silence'
+#   frequency: Hz; duration: segundos; envelope: Envelope o None (sin envelope)
+Segment = collections.namedtuple('Segment', ['waveform', 'frequency', 'duration', 'envelope',
+                                             'end_frequency'],
+                                 defaults=(None, None))
+
+WAVEFORMS = ('sine', 'square', 'triangle', 'sawtooth', 'sweep', 'silence')
+
+def tone_sequence(waveform, notes, envelope):
+    """
+    Receta de una melodía: un segmento por nota, todas con el mismo envelope
+
+    Args:
+        notes: lista de (frecuencia, duración); frecuencia 0 es un silencio
+    """
+    return tuple(Segment('silence', 0, duration) if frequency == 0
+                 else Segment(waveform, frequency, duration, envelope)
+                 for frequency, duration in notes)
+
+def recipe_length(recipe, sample_rate):
+    """Número de muestras de una receta (cada segmento se redondea por separado)"""
+    return sum(int(sample_rate * segment.duration) for segment in recipe)
+
+# Chomp: dos tonos rápidos que bajan (tipo "waka"), 80 ms
+CHOMP_RECIPE = (
+    Segment('square', 800, 0.08 / 2, Envelope(0.001, 0.01, 0.6, 0.02)),  # Tono alto
+    Segment('square', 400, 0.08 / 2, Envelope(0.001, 0.01, 0.5, 0.02)),  # Tono bajo
+)
+
+# Power pellet: secuencia de tonos ascendentes, 300 ms
+EAT_POWER_PELLET_RECIPE = tone_sequence(
+    'square', [(freq, 0.3 / 4) for freq in (400, 500, 600, 800)],
+    Envelope(0.005, 0.02, 0.7, 0.03))
+
+# Comer fantasma: barrido ascendente de 200 Hz a 800 Hz
+EAT_GHOST_RECIPE = (
+    Segment('sweep', 200, 0.4, Envelope(0.01, 0.05, 0.8, 0.1), end_frequency=800),
+)
+
+# Fruta: melodía corta y alegre
+EAT_FRUIT_RECIPE = tone_sequence('sine', [
+    (659, 0.1),  # E5
+    (784, 0.1),  # G5
+    (988, 0.15), # B5
+    (1319, 0.15) # E6
+], Envelope(0.005, 0.02, 0.7, 0.03))
+
+# Muerte: barrido descendente de 800 Hz a 100 Hz que se desvanece gradualmente
+DEATH_RECIPE = (
+    Segment('sweep', 800, 1.0, Envelope(0.01, 0.1, 0.6, 0.4), end_frequency=100),
+)
+
+# Vida extra: arpegio ascendente
+EXTRA_LIFE_RECIPE = tone_sequence('sine', [
+    (523, 0.15),  # C5
+    (659, 0.15),  # E5
+    (784, 0.15),  # G5
+    (1047, 0.2),  # C6
+    (1047, 0.15)  # C6 (repetido)
+], Envelope(0.01, 0.03, 0.7, 0.05))
+
+# Inicio de nivel: melodía tipo fanfare
+GAME_START_RECIPE = tone_sequence('sine', [
+    (392, 0.15),  # G4
+    (523, 0.15),  # C5
+    (659, 0.15),  # E5
+    (784, 0.2),   # G5
+    (659, 0.15),  # E5
+    (784, 0.3),   # G5
+    (0, 0.2),     # Silencio
+    (659, 0.2),   # E5
+    (784, 0.4)    # G5
+], Envelope(0.01, 0.03, 0.7, 0.05))
+
+# Nivel completado: secuencia victoriosa
+LEVEL_COMPLETE_RECIPE = tone_sequence('triangle', [
+    (659, 0.1),   # E5
+    (659, 0.1),   # E5
+    (659, 0.2),   # E5 (más largo)
+    (523, 0.1),   # C5
+    (659, 0.1),   # E5
+    (784, 0.3),   # G5
+    (392, 0.3)    # G4
+], Envelope(0.01, 0.02, 0.8, 0.04))
+
+# Game over: secuencia descendente triste
+GAME_OVER_RECIPE = tone_sequence('sine', [
+    (523, 0.3),   # C5
+    (494, 0.3),   # B4
+    (440, 0.3),   # A4
+    (392, 0.3),   # G4
+    (349, 0.4),   # F4
+    (330, 0.4)    # E4
+], Envelope(0.02, 0.05, 0.6, 0.1))
+
+# Seleccionar en el menú: blip corto y agradable
+MENU_SELECT_RECIPE = (
+    Segment('square', 800, 0.1, Envelope(0.005, 0.02, 0.5, 0.03)),
+)
+
+# Navegar en el menú: blip más suave
+MENU_NAVIGATE_RECIPE = (
+    Segment('sine', 600, 0.08, Envelope(0.005, 0.015, 0.4, 0.02)),
+)
+
+# Fantasma regresando a la base: barrido rápido ascendente
+GHOST_RETURN_RECIPE = (
+    Segment('sweep', 300, 0.3, Envelope(0.01, 0.05, 0.5, 0.08), end_frequency=600),
+)
+
+# Recetas por archivo de salida (mismas claves que SOUND_EFFECTS)
+SOUND_RECIPES = {
+    "chomp.wav": CHOMP_RECIPE,
+    "eat-power-pellet.wav": EAT_POWER_PELLET_RECIPE,
+    "eat-ghost.wav": EAT_GHOST_RECIPE,
+    "eat-fruit.wav": EAT_FRUIT_RECIPE,
+    "death.wav": DEATH_RECIPE,
+    "extra-life.wav": EXTRA_LIFE_RECIPE,
+    "game-start.wav": GAME_START_RECIPE,
+    "level-complete.wav": LEVEL_COMPLETE_RECIPE,
+    "game-over.wav": GAME_OVER_RECIPE,
+    "menu-select.wav": MENU_SELECT_RECIPE,
+    "menu-navigate.wav": MENU_NAVIGATE_RECIPE,
+    "ghost-return.wav": GHOST_RETURN_RECIPE,
+}
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Constructor de Sprite Sheets
+Usado por los generadores de sprites (pacman, fantasmas, items, tiles)
+
+Los sprites se dibujan con PIL, así que el sheet es una imagen RGBA y cada
+celda se coloca con Image.paste (una copia en C, sin pasar por NumPy). Las
+etapas que trabajan sobre píxeles (escalado, atlas, máscaras) leen el sheet
+terminado como arreglo uint8 (alto, ancho, 4) y vuelven a PIL con
+sheet_to_image().
+
+Multi-resolución: los sprites se dibujan en coordenadas lógicas (1x) sobre un
+lienzo `scale` veces mayor (ScaledDraw). render_at_scales() renderiza cada sheet
+una sola vez a la escala más alta pedida y deriva las menores por promedio de
+bloques (box filter con alfa premultiplicado).
+
+Colisiones: add_collision_data() añade a cada sprite de un sprite map su caja
+ajustada, una máscara de colisión de 1 bit y su centroide, calculados del
+canal alfa del sheet ya renderizado (ver collision_data).
+
+Uso como script: compara el ensamblado con Image.paste contra la copia de las
+mismas celdas en un arreglo NumPy para varios tamaños de sprite.
+"""
+
+import argparse
+import base64
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+# Configuración
+TRANSPARENT = (0, 0, 0, 0)
+
+# Layouts (columnas, filas) de los sheets del juego, para el benchmark
+SHEET_LAYOUTS = {
+    'pacman': (6, 6),
+    'ghosts': (8, 9),
+    'items': (8, 1),
+    'tiles': (9, 2),
+}
+BENCHMARK_SIZES = [32, 64, 128]
+
+# Claves de los sprite maps que son medidas en píxeles (se multiplican por la escala)
+PIXEL_KEYS = ('x', 'y', 'sprite_size', 'width', 'height')
+BENCHMARK_REPEATS = 20
+
+# Alfa mínimo para que un píxel cuente como sólido en las máscaras de colisión
+ALPHA_THRESHOLD = 128
+
+def new_sheet(cols, rows, sprite_size, background=TRANSPARENT):
+    """
+    Crea la imagen RGBA de un sheet de cols × rows celdas
+    """
+    return Image.new('RGBA', (cols * sprite_size, rows * sprite_size), background)
+
+def sprite_pixels(sprite):
+    """
+    Píxeles RGBA de un sprite como arreglo uint8 (alto, ancho, 4)
+    """
+    if isinstance(sprite, Image.Image):
+        if sprite.mode != 'RGBA':
+            sprite = sprite.convert('RGBA')
+        return np.asarray(sprite)
+    return sprite
+
+def place_sprite(sheet, sprite, col, row, sprite_size):
+    """
+    Pega un sprite en su celda (reemplaza los píxeles, sin máscara)
+    """
+    sheet.paste(sprite, (col * sprite_size, row * sprite_size))
+
+def sheet_to_image(sheet):
+    """
+    Convierte un sheet en arreglo (escalado, atlas) a una imagen PIL RGBA
+    """
+    return Image.fromarray(sheet, 'RGBA')
+
+# ============================================
+# MULTI-RESOLUCIÓN
+# ============================================
+
+class ScaledDraw:
+    """
+    Envoltorio de ImageDraw que recibe coordenadas en píxeles lógicos (1x)
+    y dibuja sobre un lienzo `scale` veces mayor
+
+    Cada píxel lógico (x, y) ocupa el bloque [x*s, x*s + s - 1]: los bbox
+    inclusivos de PIL se expanden a bloques completos, los vértices de
+    polígonos y líneas se colocan en el centro del bloque y los anchos de
+    trazo se multiplican por la escala.
+    """
+
+    def __init__(self, image, scale):
+        self._draw = ImageDraw.Draw(image)
+        self.scale = scale
+
+    def _box(self, xy):
+        if len(xy) == 2:
+            (x0, y0), (x1, y1) = xy
+        else:
+            x0, y0, x1, y1 = xy
+        s = self.scale
+        return [x0 * s, y0 * s, x1 * s + s - 1, y1 * s + s - 1]
+
+    def _points(self, xy):
+        if xy and not isinstance(xy[0], (tuple, list)):
+            xy = list(zip(xy[0::2], xy[1::2]))
+        s = self.scale
+        offset = (s - 1) / 2
+        return [(x * s + offset, y * s + offset) for x, y in xy]
+
+    def _width(self, width):
+        # En PIL un ancho 0 dibuja líneas de 1 píxel
+        return max(width, 1) * self.scale
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        self._draw.ellipse(self._box(xy), fill=fill, outline=outline, width=self._width(width))
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self._draw.rectangle(self._box(xy), fill=fill, outline=outline, width=self._width(width))
+
+    def pieslice(self, xy, start, end, fill=None, outline=None, width=1):
+        self._draw.pieslice(self._box(xy), start, end, fill=fill, outline=outline,
+                            width=self._width(width))
+
+    def arc(self, xy, start, end, fill=None, width=1):
+        self._draw.arc(self._box(xy), start, end, fill=fill, width=self._width(width))
+
+    def polygon(self, xy, fill=None, outline=None):
+        self._draw.polygon(self._points(xy), fill=fill, outline=outline)
+
+    def line(self, xy, fill=None, width=0):
+        self._draw.line(self._points(xy), fill=fill, width=self._width(width))
+
+    def point(self, xy, fill=None):
+        for x, y in (xy if isinstance(xy[0], (tuple, list)) else [xy]):
+            self.rectangle([x, y, x, y], fill=fill)
+
+def new_sprite_canvas(size, background, scale=1, mode='RGBA'):
+    """
+    Crea la imagen de un sprite y su objeto de dibujo
+
+    Args:
+        size: tamaño lógico del sprite (SPRITE_SIZE)
+        background: color de fondo
+        scale: factor entero; la imagen mide size * scale píxeles
+        mode: modo PIL ('RGBA' para sprites, 'L' para máscaras)
+
+    Returns:
+        (Image, draw) donde draw acepta coordenadas lógicas
+    """
+    img = Image.new(mode, (size * scale, size * scale), background)
+    if scale == 1:
+        return img, ImageDraw.Draw(img)
+    return img, ScaledDraw(img, scale)
+
+def downsample(pixels, factor):
+    """
+    Reduce un arreglo RGBA uint8 por un factor entero promediando bloques
+
+    El color se promedia premultiplicado por alfa para que los píxeles
+    transparentes (0, 0, 0, 0) no oscurezcan los bordes. Se trabaja por
+    planos contiguos (canal, alto, ancho) y los bloques se suman con vistas
+    desplazadas, que es mucho más rápido que reducir ejes de tamaño 2 o 4.
+    """
+    if factor == 1:
+        return pixels
+    height, width, _ = pixels.shape
+    area = factor * factor
+
+    planes = np.moveaxis(pixels, 2, 0).astype(np.uint32, order='C')
+    planes[:3] *= planes[3]
+
+    columns = planes[:, :, 0::factor].copy()
+    for offset in range(1, factor):
+        columns += planes[:, :, offset::factor]
+    sums = columns[:, 0::factor].copy()
+    for offset in range(1, factor):
+        sums += columns[:, offset::factor]
+
+    alpha = sums[3]
+    divisor = np.maximum(alpha, 1)
+    result = np.empty((height // factor, width // factor, 4), dtype=np.uint8)
+    result[..., 3] = (alpha + area // 2) // area
+    for channel in range(3):
+        result[..., channel] = (sums[channel] + divisor // 2) // divisor
+    return result
+
+def render_at_scales(sheet_function, scales):
+    """
+    Renderiza un sheet una sola vez a la escala más alta y deriva las demás
+
+    Args:
+        sheet_function: función create_*_spritesheet(scale)
+        scales: escalas enteras pedidas (cada una debe dividir a la mayor)
+
+    Returns:
+        lista de imágenes PIL, en el mismo orden que `scales`
+    """
+    top = max(scales)
+    if any(top % scale for scale in scales):
+        raise ValueError(f"Las escalas {list(scales)} deben dividir a {top}")
+
+    pixels = np.asarray(sheet_function(top))
+    return [sheet_to_image(downsample(pixels, top // scale)) for scale in scales]
+
+def scale_sprite_map(sprite_map, scale):
+    """
+    Copia de un sprite map con las medidas en píxeles multiplicadas por la escala
+    """
+    if scale == 1:
+        return sprite_map
+
+    def scaled(value):
+        if isinstance(value, dict):
+            return {key: item * scale if key in PIXEL_KEYS and isinstance(item, int) else scaled(item)
+                    for key, item in value.items()}
+        if isinstance(value, list):
+            return [scaled(item) for item in value]
+        return value
+
+    result = scaled(sprite_map)
+    result['scale'] = scale
+    return result
+
+def scaled_filename(filename, scale):
+    """
+    Nombre de archivo para una escala: 'x.png' -> 'x@2x.png' (1x sin sufijo)
+    """
+    if scale == 1:
+        return filename
+    stem, dot, extension = filename.rpartition('.')
+    return f"{stem}@{scale}x{dot}{extension}"
+
+# ============================================
+# COLISIONES
+# ============================================
+
+def sprite_entries(node):
+    """
+    Recorre un árbol de sprite map y devuelve los diccionarios que son sprites
+    (los que tienen "x" e "y"), en orden de aparición
+    """
+    if isinstance(node, dict):
+        if 'x' in node and 'y' in node:
+            return [node]
+        return [entry for value in node.values() for entry in sprite_entries(value)]
+    if isinstance(node, list):
+        return [entry for value in node for entry in sprite_entries(value)]
+    return []
+
+def collision_data(cell):
+    """
+    Datos de colisión de un sprite a partir de su canal alfa
+
+    Args:
+        cell: arreglo RGBA (alto, ancho, 4) de la celda del sprite
+
+    Returns:
+        diccionario con (coordenadas relativas a la celda, en píxeles):
+        - "bbox": [x, y, ancho, alto] de los píxeles con alfa >= ALPHA_THRESHOLD
+        - "mask": la máscara de esa caja en base64, fila a fila, 1 bit por
+          píxel (el más significativo primero) y cada fila completada a bytes
+        - "centroid": [x, y] del centro de masa de los píxeles sólidos
+        Un sprite sin píxeles sólidos tiene bbox [0, 0, 0, 0], máscara vacía y
+        el centro de la celda como centroide.
+    """
+    solid = cell[..., 3] >= ALPHA_THRESHOLD
+    ys, xs = np.nonzero(solid)
+    if len(xs) == 0:
+        height, width = solid.shape
+        return {"bbox": [0, 0, 0, 0], "mask": "", "centroid": [width / 2, height / 2]}
+
+    x0, y0 = int(xs.min()), int(ys.min())
+    x1, y1 = int(xs.max()) + 1, int(ys.max()) + 1
+    mask = np.packbits(solid[y0:y1, x0:x1], axis=1)
+    return {
+        "bbox": [x0, y0, x1 - x0, y1 - y0],
+        "mask": base64.b64encode(mask.tobytes()).decode('ascii'),
+        # Centro de cada píxel en (x + 0.5, y + 0.5)
+        "centroid": [round(float(xs.mean()) + 0.5, 2), round(float(ys.mean()) + 0.5, 2)],
+    }
+
+def add_collision_data(sprite_map, sheet):
+    """
+    Añade caja ajustada, máscara y centroide (ver collision_data) a cada
+    sprite de un sprite map, recortando su celda del sheet a la misma escala
+
+    Las medidas son relativas a la celda, así que siguen siendo válidas si el
+    sprite se mueve a otro sheet (atlas). Son listas y no diccionarios con
+    x/y para que no se confundan con sprites ni las reescale scale_sprite_map.
+
+    Returns:
+        el mismo sprite map, modificado
+    """
+    pixels = sprite_pixels(sheet)
+    default_size = sprite_map['sprite_size']
+    for entry in sprite_entries(sprite_map['sprites']):
+        x, y = entry['x'], entry['y']
+        width = entry.get('width', default_size)
+        height = entry.get('height', default_size)
+        entry.update(collision_data(pixels[y:y + height, x:x + width]))
+    return sprite_map
+
+def render_with_sprite_maps(sheet_function, map_function, scales=(1,)):
+    """
+    Renderiza un sheet a varias escalas (ver render_at_scales) junto con su
+    sprite map de cada escala, con los datos de colisión calculados de la misma
+    imagen que se exporta (sin volver a dibujar el sheet)
+
+    Args:
+        sheet_function: función create_*_spritesheet(scale)
+        map_function: función build_sprite_map(scale)
+        scales: escalas enteras pedidas
+
+    Returns:
+        lista de (imagen PIL, sprite map), en el mismo orden que `scales`
+    """
+    images = render_at_scales(sheet_function, scales)
+    return [(image, add_collision_data(map_function(scale), image))
+            for image, scale in zip(images, scales)]
+
+# ============================================
+# BENCHMARK
+# ============================================
+
+def _paste_assembly(sprites, cols, rows, size):
+    sheet = new_sheet(cols, rows, size)
+    for index, sprite in enumerate(sprites):
+        row, col = divmod(index, cols)
+        place_sprite(sheet, sprite, col, row, size)
+    return sheet
+
+def _array_assembly(sprites, cols, rows, size):
+    sheet = np.zeros((rows * size, cols * size, 4), dtype=np.uint8)
+    for index, sprite in enumerate(sprites):
+        row, col = divmod(index, cols)
+        sheet[row * size:(row + 1) * size, col * size:(col + 1) * size] = sprite_pixels(sprite)
+    return sheet_to_image(sheet)
+
+def _best_time(function, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def benchmark_assembly(sizes=BENCHMARK_SIZES, repeats=BENCHMARK_REPEATS):
+    """
+    Mide el ensamblado de los cuatro layouts con sprites sintéticos
+
+    Ambos lados reciben las mismas celdas: imágenes PIL, que es lo que producen
+    los generadores. El lado NumPy incluye la lectura de cada celda como arreglo
+    y la conversión final del sheet a PIL.
+
+    Returns:
+        lista de (tamaño, ms con paste, ms con arreglo)
+    """
+    rng = np.random.default_rng(0)
+    results = []
+    for size in sizes:
+        layouts = []
+        for cols, rows in SHEET_LAYOUTS.values():
+            images = [Image.fromarray(rng.integers(0, 256, (size, size, 4), dtype=np.uint8), 'RGBA')
+                      for _ in range(cols * rows)]
+            layouts.append((cols, rows, images))
+
+        paste_ms = _best_time(lambda: [_paste_assembly(images, c, r, size).load()
+                                       for c, r, images in layouts], repeats)
+        array_ms = _best_time(lambda: [_array_assembly(images, c, r, size).load()
+                                       for c, r, images in layouts], repeats)
+        results.append((size, paste_ms, array_ms))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del ensamblado de sprite sheets')
+    parser.add_argument('--sizes', type=int, nargs='+', default=BENCHMARK_SIZES,
+                        help='Tamaños de sprite a medir')
+    parser.add_argument('--repeats', type=int, default=BENCHMARK_REPEATS,
+                        help='Repeticiones por medida (se toma la mejor)')
+    args = parser.parse_args()
+
+    print("🧩 Benchmark de Ensamblado de Sprite Sheets")
+    print("=" * 50)
+    print(f"Layouts: {', '.join(f'{n} {c}x{r}' for n, (c, r) in SHEET_LAYOUTS.items())}")
+    print()
+    print(f"{'Sprite':>8} {'paste':>10} {'NumPy':>10} {'Ganancia':>9}")
+    for size, paste_ms, array_ms in benchmark_assembly(args.sizes, args.repeats):
+        print(f"{size:>6}px {paste_ms:>8.2f}ms {array_ms:>8.2f}ms "
+              f"{array_ms / paste_ms:>8.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Variantes de Efectos de Sonido en un Solo Render
+Usado por generate_sound_effects.py
+
+Un efecto que el juego repite miles de veces por nivel (chomp) suena mecánico
+si siempre es el mismo archivo. En lugar de llamar N veces a la función del
+efecto, las N variantes se renderizan a la vez: dentro de rendering_variants()
+los osciladores y envelopes de generate_sound_effects.py reciben un parámetro
+por variante (una columna (N, 1)) y devuelven arreglos (variantes × muestras).
+Las funciones de los efectos no cambian; solo concatenan sobre el último eje.
+
+Se varían la afinación, el ciclo de trabajo de las ondas cuadradas y los
+tiempos del envelope; la duración no, así todas las variantes tienen la misma
+longitud. La variante 0 usa los parámetros originales (es el efecto tal cual)
+y el resto sale del flujo aleatorio del asset (random_streams.py).
+"""
+
+import collections
+import contextlib
+import numpy as np
+
+from random_streams import asset_rng
+
+#   count: número de variantes (incluida la original)
+#   pitch: desviación relativa máxima de la frecuencia (0.04 = ±4%)
+#   duty: desviación máxima del ciclo de trabajo de las ondas cuadradas (0.1 = 0.5 ± 0.1)
+#   envelope: desviación relativa máxima de attack, decay y release
+VariantSpec = collections.namedtuple('VariantSpec', ['count', 'pitch', 'duty', 'envelope'])
+
+VARIANT_STREAM = 1  # Subflujo de asset_rng para los parámetros (0 y sin subflujo: el ruido)
+
+_settings = {'parameters': None}
+
+def draw_variant_parameters(spec, seed_name):
+    """
+    Parámetros de cada variante, deterministas para un asset
+
+    Returns:
+        diccionario nombre -> arreglo (count,): 'pitch' y 'envelope' son
+        factores (1 = original) y 'duty' un desplazamiento del ciclo de trabajo
+    """
+    jitter = asset_rng(seed_name, VARIANT_STREAM).uniform(-1.0, 1.0, (3, spec.count))
+    jitter[:, 0] = 0.0  # Variante 0: el efecto original
+    return {
+        'pitch': 1.0 + spec.pitch * jitter[0],
+        'duty': spec.duty * jitter[1],
+        'envelope': 1.0 + spec.envelope * jitter[2],
+    }
+
+@contextlib.contextmanager
+def rendering_variants(parameters):
+    """
+    Activa los parámetros por variante mientras se ejecuta la función del efecto
+
+    Uso:
+        with rendering_variants(draw_variant_parameters(spec, 'chomp.wav')):
+            waves = create_chomp_sound()   # (variantes × muestras)
+    """
+    previous = _settings['parameters']
+    _settings['parameters'] = {name: np.asarray(values, dtype=np.float64)[:, None]
+                               for name, values in parameters.items()}
+    try:
+        yield
+    finally:
+        _settings['parameters'] = previous
+
+def variant_parameter(name):
+    """Parámetro por variante como columna (N, 1), o None fuera de rendering_variants()"""
+    parameters = _settings['parameters']
+    return None if parameters is None else parameters[name]
+
+def variant_shape(num_samples):
+    """Forma de una onda: (variantes, muestras) dentro de rendering_variants(), si no (muestras,)"""
+    parameters = _settings['parameters']
+    if parameters is None:
+        return (num_samples,)
+    return (len(parameters['pitch']), num_samples)
+
+def render_variants(generator_func, spec, seed_name):
+    """
+    Renderiza `spec.count` variantes de un efecto en una sola pasada
+
+    Args:
+        generator_func: función del efecto (p. ej. create_chomp_sound)
+        spec: VariantSpec con el número de variantes y las desviaciones
+        seed_name: nombre del asset que fija los parámetros (p. ej. 'chomp.wav')
+
+    Returns:
+        arreglo (variantes × muestras); la fila 0 es el efecto original
+    """
+    with rendering_variants(draw_variant_parameters(spec, seed_name)):
+        waves = generator_func()
+    if waves.ndim == 1:
+        # El efecto no usa ningún parámetro variable: todas las filas son iguales
+        waves = np.tile(waves, (spec.count, 1))
+    return waves
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Salida WAV PCM (16 u 8 bits) con np.memmap
+Usado por generate_sound_effects.py y generate_music.py
+
+El encabezado RIFF se escribe por adelantado (la longitud de la pista se
+conoce antes de renderizar) y la región de datos se mapea como un arreglo
+entero. Cada bloque float pasa por la etapa de ganancia con headroom conocido
+y se copia directamente en su porción del mapeo: no hay bytes intermedios
+(tobytes/writeframes) ni copias de la pista completa, y la memoria usada es
+la de un bloque más las páginas que el sistema operativo vaya escribiendo.
+
+Para salidas en memoria (io.BytesIO, sin archivo que mapear) write_wav_blocks()
+escribe los mismos bytes con el módulo wave.
+"""
+
+import io
+import struct
+import wave as wave_module
+import numpy as np
+
+# Configuración
+WAV_HEADER_SIZE = 44  # Encabezado RIFF/WAVE + 'fmt ' (PCM) + cabecera de 'data'
+OUTPUT_HEADROOM = 0.9  # Pico de salida respecto a la escala completa
+
+# Formato PCM por profundidad de bits: (dtype, escala, desplazamiento)
+#   16 bits: con signo, truncado igual que astype(np.int16)
+#   8 bits: sin signo centrado en 128; el +0.5 redondea al truncar
+PCM_FORMATS = {
+    16: ('<i2', 32767, 0.0),
+    8: ('u1', 127, 128.5),
+}
+
+def pcm_block(block, peak, bits=16, out=None):
+    """
+    Etapa de ganancia: lleva un bloque float a la escala PCM con headroom
+
+    block / peak * 0.9 * 32767 (16 bits), siempre en este orden de operaciones
+    para que todas las salidas (archivo mapeado, writeframes, banco de sonidos)
+    den las mismas muestras bit a bit.
+
+    Args:
+        block: bloque de audio float
+        peak: pico absoluto de toda la pista (0 = silencio)
+        bits: profundidad de bits de la salida (16 u 8)
+        out: arreglo destino (puede ser el propio bloque para trabajar in-place)
+    """
+    _, scale, offset = PCM_FORMATS[bits]
+    if peak > 0:
+        out = np.divide(block, peak, out=out)
+        out *= OUTPUT_HEADROOM
+    else:
+        out = np.multiply(block, OUTPUT_HEADROOM, out=out)
+    out *= scale
+    if offset:
+        out += offset
+    return out
+
+def pcm_samples(block, peak, bits=16):
+    """Muestras PCM enteras de un bloque float (dtype del formato de `bits`)"""
+    return pcm_block(block, peak, bits).astype(PCM_FORMATS[bits][0])
+
+def pcm16_from_pcm(samples, bits):
+    """
+    Convierte muestras PCM a 16 bits con signo, como hace SFML al cargar un WAV
+    (8 bits: (muestra - 128) << 8)
+    """
+    if bits == 16:
+        return samples
+    return ((samples.astype(np.int16) - 128) << 8).astype('<i2')
+
+def peak_level(blocks):
+    """Pico absoluto de una secuencia de bloques (primera pasada)"""
+    peak = 0.0
+    for block in blocks:
+        if len(block):
+            peak = max(peak, block.max(), -block.min())
+    return peak
+
+def write_wav_header(file, num_samples, sample_rate, channels=1, bits=16):
+    """
+    Escribe el encabezado canónico de un WAV PCM (el mismo que produce el
+    módulo wave, más el relleno de pad_data_chunk) para `num_samples` muestras
+    por canal
+    """
+    sample_width = bits // 8
+    data_size = num_samples * channels * sample_width
+    file.write(struct.pack('<4sI4s4sIHHIIHH4sI',
+                           b'RIFF', WAV_HEADER_SIZE - 8 + data_size + data_size % 2, b'WAVE',
+                           b'fmt ', 16, 1, channels, sample_rate,
+                           sample_rate * channels * sample_width,
+                           channels * sample_width, bits,
+                           b'data', data_size))
+
+def open_pcm_memmap(filename, num_samples, sample_rate, bits=16):
+    """
+    Crea el archivo WAV con su tamaño final y mapea la región de datos
+
+    Returns:
+        np.memmap del dtype PCM (int16 little-endian o uint8) de num_samples
+        muestras, o None si la pista está vacía (no se puede mapear una región
+        de tamaño 0)
+    """
+    with open(filename, 'wb') as f:
+        write_wav_header(f, num_samples, sample_rate, bits=bits)
+        data_size = num_samples * (bits // 8)
+        f.truncate(WAV_HEADER_SIZE + data_size + data_size % 2)
+    if num_samples == 0:
+        return None
+    return np.memmap(filename, dtype=PCM_FORMATS[bits][0], mode='r+', offset=WAV_HEADER_SIZE,
+                     shape=(num_samples,))
+
+def write_pcm_memmap(filename, blocks, num_samples, sample_rate, bits=16):
+    """
+    Escribe bloques ya en escala PCM (ver pcm_block) en un WAV mapeado
+
+    Args:
+        filename: ruta del archivo de salida
+        blocks: iterable de bloques float consecutivos; pueden reutilizar el
+                mismo buffer, se copian al mapeo antes de pedir el siguiente
+        num_samples: longitud total de la pista en muestras
+        sample_rate: tasa de muestreo
+        bits: profundidad de bits (16 u 8)
+    """
+    samples = open_pcm_memmap(filename, num_samples, sample_rate, bits)
+    position = 0
+    for block in blocks:
+        end = position + len(block)
+        if end > num_samples:
+            raise ValueError(f"Los bloques superan la longitud declarada ({num_samples} muestras)")
+        # Conversión float -> entero por truncamiento, igual que astype()
+        np.copyto(samples[position:end], block, casting='unsafe')
+        position = end
+
+    if position != num_samples:
+        raise ValueError(f"Se escribieron {position} de {num_samples} muestras")
+    if samples is not None:
+        samples.flush()
+        del samples
+
+def pad_data_chunk(file):
+    """
+    Añade el byte de relleno que RIFF exige tras un chunk 'data' de tamaño
+    impar (8 bits con un número impar de muestras) y corrige el tamaño RIFF
+
+    El módulo wave no lo escribe; así su salida coincide con la de
+    write_pcm_memmap y los chunks que se añadan después quedan alineados.
+
+    Args:
+        file: ruta o archivo binario con un WAV canónico recién escrito
+    """
+    if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+        with open(file, 'r+b') as f:
+            pad_data_chunk(f)
+        return
+
+    end = file.seek(0, io.SEEK_END)
+    if (end - WAV_HEADER_SIZE) % 2:
+        file.write(b'\0')
+        file.seek(4)
+        file.write(struct.pack('<I', end + 1 - 8))
+        file.seek(0, io.SEEK_END)
+
+def write_wav_blocks(file, blocks, peak, sample_rate, bits=16):
+    """
+    Escribe bloques de audio en un WAV sin reunir la pista completa
+
+    Cada bloque pasa por la etapa de ganancia (ver pcm_samples) con el pico ya
+    conocido y se escribe directamente con writeframes.
+
+    Args:
+        file: ruta o archivo abierto en modo binario
+        blocks: iterable de bloques float
+        peak: pico absoluto de toda la pista (primera pasada)
+        sample_rate: tasa de muestreo
+        bits: profundidad de bits (16 u 8)
+    """
+    with wave_module.open(file, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(bits // 8)
+        wav_file.setframerate(sample_rate)
+
+        for block in blocks:
+            wav_file.writeframes(pcm_samples(block, peak, bits).tobytes())
+    pad_data_chunk(file)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Osciladores por Wavetable Limitados en Banda
+Usado por generate_sound_effects.py y generate_music.py
+
+Las formas de onda ingenuas (np.sign / np.floor) tienen armónicos infinitos y a
+44.1 kHz se doblan por encima de Nyquist (aliasing). Aquí cada forma de onda se
+precalcula una sola vez como tabla de un ciclo por octava, conservando solo los
+armónicos que caben bajo Nyquist para la nota más aguda de esa octava. Los
+osciladores leen la tabla con interpolación lineal de la fase fraccional.
+
+Las tablas se guardan en el dtype de síntesis (precision.py). Fuera del camino
+de referencia la fase llega como acumulador de punto fijo (tone_phases), del
+que se extraen directamente el índice de tabla y la fracción.
+"""
+
+import functools
+import numpy as np
+
+from precision import PHASE_BITS, is_reference, phase_accumulator, synthesis_dtype
+
+# Configuración
+DEFAULT_SAMPLE_RATE = 44100
+TABLE_SIZE = 2048          # Muestras por ciclo en cada tabla (potencia de 2)
+OVERSAMPLING = 16          # Resolución de la forma ingenua antes de filtrar
+BASE_FREQUENCY = 27.5      # A0: la tabla de la octava 0 cubre hasta esta frecuencia
+NUM_OCTAVES = 10           # Octavas 0..10 (hasta 28160 Hz)
+WAVETABLE_CACHE_SIZE = 128
+INDEX_BITS = TABLE_SIZE.bit_length() - 1  # log2(TABLE_SIZE)
+
+def _naive_square(x, low_level, duty):
+    return np.where(x < duty, 1.0, -low_level)
+
+def _naive_sawtooth(x, low_level, duty):
+    return 2 * (x - np.floor(x + 0.5))
+
+def _naive_triangle(x, low_level, duty):
+    return 2 * np.abs(2 * (x - np.floor(x + 0.5))) - 1
+
+# Formas de onda ingenuas, con la misma fase que los generadores originales
+NAIVE_SHAPES = {
+    'square': _naive_square,
+    'sawtooth': _naive_sawtooth,
+    'triangle': _naive_triangle,
+}
+
+def octave_for(frequency):
+    """
+    Índice de la tabla que cubre una frecuencia (la más rica sin aliasing)
+    """
+    if frequency <= BASE_FREQUENCY:
+        return 0
+    return min(int(np.ceil(np.log2(frequency / BASE_FREQUENCY))), NUM_OCTAVES)
+
+@functools.lru_cache(maxsize=WAVETABLE_CACHE_SIZE)
+def _build_wavetable(waveform, octave, low_level, duty, sample_rate, dtype_name):
+    """
+    Construye la tabla limitada en banda de un ciclo (usar get_wavetable)
+
+    Devuelve (tabla, pendientes): pendientes[i] = tabla[i + 1] - tabla[i], con el
+    ciclo cerrado, para interpolar con dos lecturas y sin índices extra.
+    """
+    shape = NAIVE_SHAPES[waveform]
+    size = TABLE_SIZE * OVERSAMPLING
+    spectrum = np.fft.rfft(shape(np.arange(size) / size, low_level, duty)) / size
+
+    # Armónicos que caben bajo Nyquist para la nota más aguda de la octava
+    top_frequency = BASE_FREQUENCY * 2 ** octave
+    harmonics = int((sample_rate / 2) // top_frequency)
+    harmonics = max(1, min(harmonics, TABLE_SIZE // 2 - 1))
+
+    # Factores sigma de Lanczos para atenuar el fenómeno de Gibbs
+    kept = np.zeros(TABLE_SIZE // 2 + 1, dtype=complex)
+    kept[:harmonics + 1] = spectrum[:harmonics + 1]
+    kept[1:harmonics + 1] *= np.sinc(np.arange(1, harmonics + 1) / (harmonics + 1))
+
+    table = np.fft.irfft(kept, n=TABLE_SIZE) * TABLE_SIZE
+    slopes = np.roll(table, -1) - table
+    # Diseño en float64; solo el resultado se guarda en el dtype de síntesis
+    table = table.astype(dtype_name, copy=False)
+    slopes = slopes.astype(dtype_name, copy=False)
+    table.flags.writeable = False
+    slopes.flags.writeable = False
+    return table, slopes
+
+def get_wavetable(waveform, frequency, low_level=1.0, sample_rate=DEFAULT_SAMPLE_RATE, dtype=None,
+                  duty=0.5):
+    """
+    Devuelve la tabla (compartida, de solo lectura) adecuada para una frecuencia
+
+    Args:
+        waveform: 'square', 'sawtooth' o 'triangle'
+        frequency: frecuencia de la nota en Hz
+        low_level: nivel de la parte negativa de la onda cuadrada (duty del bajo)
+        sample_rate: tasa de muestreo
+        dtype: dtype de las tablas (por defecto el de síntesis)
+        duty: fracción del ciclo en la parte alta de la onda cuadrada
+
+    Returns:
+        tupla (tabla, pendientes) de TABLE_SIZE muestras cada una
+    """
+    dtype = synthesis_dtype() if dtype is None else np.dtype(dtype)
+    duty = float(duty) if waveform == 'square' else 0.5  # Solo la cuadrada depende del duty
+    return _build_wavetable(waveform, octave_for(frequency), float(low_level), duty,
+                            int(sample_rate), dtype.name)
+
+def tone_phases(frequency, num_samples, step):
+    """
+    Fases de un tono de frecuencia fija para wavetable_oscillator
+
+    Args:
+        frequency: frecuencia en Hz
+        num_samples: número de muestras
+        step: segundos por muestra (1 / sample_rate, o duration / num_samples
+              para reproducir np.linspace(0, duration, num_samples, False))
+
+    Returns:
+        en el camino de referencia, la fase en ciclos (float64, sin envolver);
+        si no, el acumulador de punto fijo uint64 (envuelto exactamente)
+    """
+    if is_reference():
+        return (np.arange(num_samples) * step) * frequency
+    return phase_accumulator(frequency * step, num_samples)
+
+def wavetable_oscillator(waveform, frequency, phases, low_level=1.0,
+                         sample_rate=DEFAULT_SAMPLE_RATE, duty=0.5):
+    """
+    Renderiza una nota leyendo la tabla con interpolación lineal
+
+    Args:
+        waveform: 'square', 'sawtooth' o 'triangle'
+        frequency: frecuencia en Hz (elige la tabla); una columna (N, 1) con
+                   fases (N, muestras) renderiza N notas a la vez
+        phases: fase de cada muestra en ciclos, no negativa (t * frequency),
+                o acumulador de punto fijo uint64 (tone_phases)
+        low_level: nivel de la parte negativa de la onda cuadrada
+        sample_rate: tasa de muestreo
+        duty: ciclo de trabajo de la onda cuadrada (escalar o columna (N, 1))
+
+    Returns:
+        numpy array con la onda, en el dtype de síntesis
+    """
+    if np.ndim(frequency) or np.ndim(duty):
+        # Una tabla por fila: se apilan y cada fila lee la suya
+        frequencies, duties = np.broadcast_arrays(np.ravel(frequency), np.ravel(duty))
+        rows = [get_wavetable(waveform, f, low_level, sample_rate, duty=d)
+                for f, d in zip(frequencies.tolist(), duties.tolist())]
+        table = np.stack([row_table for row_table, _ in rows])
+        slopes = np.stack([row_slopes for _, row_slopes in rows])
+        row_index = np.arange(len(rows))[:, None]
+    else:
+        table, slopes = get_wavetable(waveform, frequency, low_level, sample_rate, duty=duty)
+        row_index = None
+
+    if phases.dtype == np.uint64:
+        # Los bits altos de la fracción de ciclo son el índice; el resto, la fracción
+        fraction_bits = PHASE_BITS - INDEX_BITS
+        index = (phases >> np.uint64(fraction_bits)).astype(np.intp)
+        index &= TABLE_SIZE - 1
+        position = (phases & np.uint64(2 ** fraction_bits - 1)).astype(table.dtype)
+        position *= table.dtype.type(2.0 ** -fraction_bits)
+    else:
+        position = np.multiply(phases, TABLE_SIZE, dtype=np.float64)
+        index = position.astype(np.int64)
+        position -= index          # Parte fraccional
+        index &= TABLE_SIZE - 1    # Envolver el ciclo (TABLE_SIZE es potencia de 2)
+
+    if row_index is not None:
+        wave = slopes[row_index, index]
+        wave *= position
+        wave += table[row_index, index]
+        return wave
+
+    wave = slopes[index]
+    wave *= position
+    wave += table[index]
+    return wave
+
+def wavetable_cache_info():
+    """Estadísticas de la caché de tablas (hits, misses, maxsize, currsize)"""
+    return _build_wavetable.cache_info()